@@ -0,0 +1,60 @@
+"""
+Query count and latency of ``/api/analytics/`` as the number of companies
+grows, with the result cache disabled.
+
+    python -m benchmarks.analytics [--companies 10 100 1000] [--employees-per-company 50]
+"""
+
+import argparse
+import time
+
+from benchmarks.common import report, seed_org, test_database
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from company import analytics
+from company.models import Company, Department, PerformanceReview, Project
+from user.models import Employee, User
+
+
+def clear():
+    for model in (PerformanceReview, Employee, User, Project, Department, Company):
+        model.objects.all().delete()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--companies", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--employees-per-company", type=int, default=50)
+    args = parser.parse_args()
+
+    rows = []
+    with test_database(), override_settings(ANALYTICS={"CACHE_TTL": 0}):
+        for companies in args.companies:
+            clear()
+            employees = companies * args.employees_per_company
+            seed_org(
+                companies=companies,
+                departments=5,
+                employees=employees,
+                projects=companies * 10,
+                reviews=employees,
+            )
+            connection.queries_log.clear()
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                for name in analytics.SECTIONS:
+                    analytics.get_section(name)
+                elapsed = time.perf_counter() - start
+            rows.append((companies, employees, len(queries), f"{elapsed * 1000:.1f}"))
+
+    report(
+        "All analytics sections, uncached",
+        rows,
+        ["companies", "employees", "queries", "ms"],
+    )
+
+
+if __name__ == "__main__":
+    main()
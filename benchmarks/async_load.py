@@ -0,0 +1,154 @@
+"""
+p50/p99 latency of the employee list under concurrent slow clients.
+
+    python -m benchmarks.async_load [--requests 200] [--threads 8] [--delay 0.05]
+
+Three paths serve the same list of employees:
+
+* WSGI: the sync DRF view on a pool of ``--threads`` worker threads. A slow
+  client keeps its worker busy while it drains the response.
+* ASGI sync: the same DRF view behind the ASGI handler, which pushes every
+  request into a thread with ``sync_to_async``.
+* ASGI async: ``/api/user/async/employee/`` using ``aiterator``.
+
+Each client waits ``--delay`` seconds before reading the body, which simulates
+a slow network. Django's async ORM still runs the query itself in a thread,
+so the gain comes from not holding a worker while clients are slow.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from benchmarks.common import report, seed_org, test_database
+
+from django.core.asgi import get_asgi_application
+from django.core.wsgi import get_wsgi_application
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from user.models import User
+
+
+def percentiles(latencies):
+    latencies = sorted(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return statistics.median(latencies) * 1000, p99 * 1000
+
+
+def run_wsgi(path, token, requests, threads, delay):
+    application = get_wsgi_application()
+
+    def call(start):
+        environ = {
+            "REQUEST_METHOD": "GET",
+            "PATH_INFO": path,
+            "QUERY_STRING": "",
+            "SERVER_NAME": "testserver",
+            "SERVER_PORT": "80",
+            "HTTP_AUTHORIZATION": f"Bearer {token}",
+            "wsgi.url_scheme": "http",
+            "wsgi.input": BytesIO(),
+            "wsgi.errors": BytesIO(),
+        }
+        body = application(environ, lambda status, headers: None)
+        time.sleep(delay)
+        b"".join(body)
+        body.close()
+        return time.perf_counter() - start
+
+    # Latency is measured from submission so time spent queued for a free
+    # worker thread counts, as it would for a client.
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        latencies = list(pool.map(call, [start] * requests))
+    return latencies, time.perf_counter() - start
+
+
+async def run_asgi(path, token, requests, delay):
+    application = get_asgi_application()
+
+    async def call():
+        start = time.perf_counter()
+        sent = False
+        disconnect = asyncio.Event()
+
+        async def receive():
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            await disconnect.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.body":
+                await asyncio.sleep(delay)
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": b"",
+            "headers": [(b"authorization", f"Bearer {token}".encode())],
+            "client": ("127.0.0.1", 1234),
+            "server": ("testserver", 80),
+        }
+        await application(scope, receive, send)
+        disconnect.set()
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    latencies = await asyncio.gather(*(call() for _ in range(requests)))
+    return latencies, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--delay", type=float, default=0.05)
+    parser.add_argument("--employees", type=int, default=50)
+    args = parser.parse_args()
+
+    with test_database():
+        seed_org(companies=2, departments=3, employees=args.employees)
+        admin = User.objects.create(
+            email="admin@bench.test", username="admin", role="admin"
+        )
+        token = str(RefreshToken.for_user(admin).access_token)
+
+        runs = {
+            "WSGI (sync view, threads)": run_wsgi(
+                "/api/user/employee/", token, args.requests, args.threads, args.delay
+            ),
+            "ASGI (sync view)": asyncio.run(
+                run_asgi("/api/user/employee/", token, args.requests, args.delay)
+            ),
+            "ASGI (async view)": asyncio.run(
+                run_asgi("/api/user/async/employee/", token, args.requests, args.delay)
+            ),
+        }
+
+    rows = []
+    for name, (latencies, elapsed) in runs.items():
+        p50, p99 = percentiles(latencies)
+        rows.append(
+            (name, f"{p50:.1f}", f"{p99:.1f}", f"{len(latencies) / elapsed:.1f}")
+        )
+    report(
+        f"{args.requests} concurrent requests, {args.employees} employees, "
+        f"client delay {args.delay * 1000:.0f} ms",
+        rows,
+        ["path", "p50 ms", "p99 ms", "req/s"],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+import os
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "company_sys.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import connection  # noqa: E402
+from django.test.utils import (  # noqa: E402
+    setup_test_environment,
+    teardown_test_environment,
+)
+
+
+@contextmanager
+def test_database(path=None):
+    """
+    Run the block against a freshly migrated throwaway database. ``path``
+    keeps a SQLite database in a file instead of memory, for benchmarks whose
+    threads write concurrently.
+    """
+    if path is not None:
+        connection.settings_dict["TEST"]["NAME"] = str(path)
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+@contextmanager
+def timer(results, name):
+    start = time.perf_counter()
+    yield
+    results[name] = time.perf_counter() - start
+
+
+def report(title, rows, headers):
+    widths = [
+        max(len(str(header)), *(len(str(row[index])) for row in rows))
+        for index, header in enumerate(headers)
+    ]
+    print(title)
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    for row in rows:
+        print("  ".join(str(value).ljust(w) for value, w in zip(row, widths)))
+    print()
+
+
+def seed_org(companies=10, departments=5, employees=1000, projects=100, reviews=0):
+    """
+    Bulk-insert a synthetic organisation spread evenly over ``companies``.
+    ``departments`` is per company; the other counts are totals.
+    """
+    import random
+    from datetime import date, timedelta
+
+    from django.contrib.auth.hashers import make_password
+
+    from company import counters
+    from company.choices import Stages
+    from company.models import Company, Department, PerformanceReview, Project
+    from user.models import Employee, User
+
+    rng = random.Random(42)
+    batch = 5000
+    password = make_password(None)
+
+    company_objs = Company.objects.bulk_create(
+        [Company(name=f"Company {i}") for i in range(companies)], batch_size=batch
+    )
+    department_objs = Department.objects.bulk_create(
+        [
+            Department(company=company, name=f"Department {j}")
+            for company in company_objs
+            for j in range(departments)
+        ],
+        batch_size=batch,
+    )
+    Project.objects.bulk_create(
+        [
+            Project(
+                company_id=department.company_id,
+                department=department,
+                name=f"Project {i}",
+                start_date=date(2020, 1, 1) + timedelta(days=rng.randrange(2000)),
+                is_active=rng.random() < 0.3,
+            )
+            for i, department in (
+                (i, rng.choice(department_objs)) for i in range(projects)
+            )
+        ],
+        batch_size=batch,
+    )
+    for start in range(0, employees, batch):
+        count = min(batch, employees - start)
+        users = User.objects.bulk_create(
+            [
+                User(
+                    email=f"user{i}@bench.test",
+                    username=f"user{i}",
+                    password=password,
+                )
+                for i in range(start, start + count)
+            ]
+        )
+        staff = []
+        for i, user in zip(range(start, start + count), users):
+            department = department_objs[i % len(department_objs)]
+            staff.append(
+                Employee(
+                    company_id=department.company_id,
+                    department=department,
+                    user=user,
+                    first_name=f"First{i}",
+                    last_name=f"Last{i}",
+                    email=f"employee{i}@bench.test",
+                    position=rng.choice(["Developer", "Designer", "Manager", "QA"]),
+                    hired_on=date(2015, 1, 1) + timedelta(days=rng.randrange(3500)),
+                )
+            )
+        Employee.objects.bulk_create(staff)
+
+    employee_ids = list(Employee.objects.values_list("pk", flat=True))
+    stages = list(Stages.values)
+    for start in range(0, reviews, batch):
+        PerformanceReview.objects.bulk_create(
+            [
+                PerformanceReview(
+                    employee_id=rng.choice(employee_ids), stage=rng.choice(stages)
+                )
+                for _ in range(min(batch, reviews - start))
+            ]
+        )
+    counters.reconcile()
@@ -0,0 +1,152 @@
+"""
+Throughput of the read endpoints with a new database connection per request
+against persistent connections and, on PostgreSQL with ``psycopg_pool``,
+Django's connection pool.
+
+    python -m benchmarks.db_connections [--requests 2000] [--threads 8]
+
+A stand-in load generator calls the WSGI application from ``--threads``
+worker threads, the way a threaded server would, cycling through a few list
+and detail URLs with the response cache off. Runs against the configured
+``DB_*`` database (a throwaway test database is created); on SQLite a file
+is used so every thread opens real connections. Connecting is cheap on
+SQLite, so the difference is far larger on a networked PostgreSQL.
+"""
+
+import argparse
+import statistics
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+
+from benchmarks.common import report, seed_org, test_database
+
+from django.conf import settings
+from django.core.wsgi import get_wsgi_application
+from django.db import connection, connections
+from django.db.backends.signals import connection_created
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from company.models import Company, Project
+from user.models import Employee, User
+
+
+def call(application, path, token):
+    path, _, query = path.partition("?")
+    environ = {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": path,
+        "QUERY_STRING": query,
+        "SERVER_NAME": "testserver",
+        "SERVER_PORT": "80",
+        "HTTP_AUTHORIZATION": f"Bearer {token}",
+        "wsgi.url_scheme": "http",
+        "wsgi.input": BytesIO(),
+        "wsgi.errors": BytesIO(),
+    }
+    statuses = []
+    body = application(environ, lambda status, headers: statuses.append(status))
+    b"".join(body)
+    # Closing the body sends request_finished, where Django closes or keeps
+    # the thread's connection according to CONN_MAX_AGE.
+    body.close()
+    assert statuses[0].startswith("200"), statuses[0]
+
+
+def run(paths, token, requests, threads):
+    application = get_wsgi_application()
+    opened = []
+    counter = threading.Lock()
+
+    def count(sender, **kwargs):
+        with counter:
+            opened.append(1)
+
+    def worker(index):
+        start = time.perf_counter()
+        call(application, paths[index % len(paths)], token)
+        return time.perf_counter() - start
+
+    barrier = threading.Barrier(threads)
+
+    def close(_):
+        # Every worker thread waits here once, so each closes its own.
+        barrier.wait()
+        connections.close_all()
+
+    connection_created.connect(count)
+    try:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(threads) as pool:
+            latencies = list(pool.map(worker, range(requests)))
+            elapsed = time.perf_counter() - start
+            # Drop the threads' persistent connections before the next mode.
+            list(pool.map(close, range(threads)))
+    finally:
+        connection_created.disconnect(count)
+    return latencies, elapsed, len(opened)
+
+
+def modes(database):
+    options = database["OPTIONS"]
+    pool = options.pop("pool", None)
+    yield "new connection per request", 0
+    yield "persistent (CONN_MAX_AGE=600)", 600
+    if pool is not None:
+        options["pool"] = pool
+        yield "pool", 0
+        options.pop("pool")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    settings.RESPONSE_CACHE["ENABLED"] = False
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "bench.sqlite3"
+        with test_database(path if connection.vendor == "sqlite" else None):
+            seed_org(companies=5, departments=3, employees=500, projects=200)
+            admin = User.objects.create(
+                email="admin@bench.test", username="admin", role="admin"
+            )
+            token = str(RefreshToken.for_user(admin).access_token)
+            paths = [
+                "/api/user/employee/?page_size=20",
+                "/api/project/?page_size=20",
+                f"/api/company/{Company.objects.first().pk}/",
+                f"/api/user/employee/{Employee.objects.first().pk}/",
+                f"/api/project/{Project.objects.first().pk}/",
+            ]
+            # Every thread's connection reads this same settings dict.
+            database = connection.settings_dict
+            for name, max_age in modes(database):
+                database["CONN_MAX_AGE"] = max_age
+                latencies, elapsed, opened = run(
+                    paths, token, args.requests, args.threads
+                )
+                rows.append(
+                    (
+                        name,
+                        f"{args.requests / elapsed:,.0f}",
+                        f"{statistics.median(latencies) * 1000:.2f}",
+                        opened,
+                    )
+                )
+
+    report(
+        f"{args.requests} requests from {args.threads} threads on "
+        f"{connection.vendor}",
+        rows,
+        ["connections", "req/s", "p50 ms", "connections opened"],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Rows per second of the read serializers against their compiled
+``common.fast_read`` plans, checking that both produce the same JSON.
+
+    python -m benchmarks.fast_read [--rows 20000] [--repeat 3]
+"""
+
+import argparse
+import time
+
+from benchmarks.common import report, seed_org, test_database
+
+from django.db.models import F
+from rest_framework.renderers import JSONRenderer
+
+from common.fast_read import compile_serializer
+from company.models import Company, Department, PerformanceReview, Project
+from company.serializers import (
+    ReadCompanySerializer,
+    ReadDepartmentSerializer,
+    ReadPerformanceReviewSerializer,
+    ReadProjectSerializer,
+)
+from user.apis.common import EmployeeAPIView
+from user.models import Employee
+from user.serializers import ReadEmployeeSerializer
+
+
+def cases():
+    return [
+        (
+            "employee",
+            Employee.objects.select_related("company", "department"),
+            ReadEmployeeSerializer,
+            EmployeeAPIView.sparse_field_sources,
+        ),
+        (
+            "project",
+            Project.objects.select_related("company", "department").filter(
+                department__isnull=False
+            ),
+            ReadProjectSerializer,
+            None,
+        ),
+        (
+            "review",
+            PerformanceReview.objects.select_related("employee"),
+            ReadPerformanceReviewSerializer,
+            None,
+        ),
+        (
+            "department",
+            Department.objects.select_related("company"),
+            ReadDepartmentSerializer,
+            None,
+        ),
+        (
+            "company",
+            Company.objects.annotate(
+                num_of_employee=F("number_of_employees"),
+                num_of_department=F("number_of_departments"),
+                num_of_project=F("number_of_projects"),
+            ),
+            ReadCompanySerializer,
+            None,
+        ),
+    ]
+
+
+def best(repeat, function):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = []
+    with test_database():
+        seed_org(
+            companies=args.rows // 100,
+            departments=5,
+            employees=args.rows,
+            projects=args.rows,
+            reviews=args.rows,
+        )
+        renderer = JSONRenderer()
+        for name, queryset, serializer_class, computed in cases():
+            plan = compile_serializer(serializer_class(), queryset, computed)
+            drf_time, drf_data = best(
+                args.repeat, lambda: serializer_class(queryset.all(), many=True).data
+            )
+            fast_time, fast_data = best(
+                args.repeat, lambda: plan.render(plan.values(queryset.all()))
+            )
+            identical = renderer.render(drf_data) == renderer.render(fast_data)
+            count = len(fast_data)
+            rows.append(
+                (
+                    name,
+                    count,
+                    f"{count / drf_time:,.0f}",
+                    f"{count / fast_time:,.0f}",
+                    f"{drf_time / fast_time:.1f}x",
+                    "yes" if identical else "NO",
+                )
+            )
+
+    report(
+        "Read serializer vs compiled values() plan (query + rows to dicts)",
+        rows,
+        ["list", "rows", "drf rows/s", "fast rows/s", "speedup", "identical"],
+    )
+
+
+if __name__ == "__main__":
+    main()
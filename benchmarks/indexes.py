@@ -0,0 +1,119 @@
+"""
+Query plans and latency of the main filter patterns with and without the
+composite/partial indexes declared in the models' ``Meta.indexes``.
+
+    python -m benchmarks.indexes [--reviews 1000000] [--employees 100000]
+
+The seeded database is built once; the declared indexes are then dropped and
+every query is timed again.
+"""
+
+import argparse
+import statistics
+import time
+from datetime import date, datetime, timezone
+
+from benchmarks.common import report, seed_org, test_database
+
+from django.db import connection
+
+from company.choices import Stages
+from company.models import Company, Department, PerformanceReview, Project
+from user.models import Employee
+
+MODELS = (Company, Department, Project, PerformanceReview, Employee)
+
+
+def patterns():
+    employee_id = Employee.objects.order_by("?").values_list("pk", flat=True).first()
+    company_id = Company.objects.values_list("pk", flat=True).first()
+    since = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    return {
+        "reviews of employee in stage": PerformanceReview.objects.filter(
+            employee_id=employee_id, stage=Stages.UNDER_APPROVAL
+        ),
+        "reviews in stage by schedule": PerformanceReview.objects.filter(
+            stage=Stages.REVIEW_SCHEDULED, scheduled_date__gte=since
+        ).order_by("scheduled_date")[:50],
+        "latest reviews page": PerformanceReview.objects.order_by("-created_at", "-id")[
+            :50
+        ],
+        "active projects of company": Project.objects.filter(
+            company_id=company_id, is_active=True
+        ),
+        "active projects starting in 2021": Project.objects.filter(
+            is_active=True, start_date__range=(date(2021, 1, 1), date(2021, 12, 31))
+        ),
+        "employees by position": Employee.objects.filter(position="QA")[:50],
+    }
+
+
+def measure(queryset, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        list(queryset.all())
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def run(repeat):
+    results = {}
+    for name, queryset in patterns().items():
+        plan = queryset.explain().replace("\n", " | ")
+        results[name] = (measure(queryset, repeat), plan)
+    return results
+
+
+def drop_indexes():
+    with connection.schema_editor() as editor:
+        for model in MODELS:
+            for index in model._meta.indexes:
+                editor.remove_index(model, index)
+    if connection.vendor in ("sqlite", "postgresql"):
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--reviews", type=int, default=1_000_000)
+    parser.add_argument("--employees", type=int, default=100_000)
+    parser.add_argument("--projects", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with test_database():
+        seed_org(
+            companies=100,
+            departments=10,
+            employees=args.employees,
+            projects=args.projects,
+            reviews=args.reviews,
+        )
+        PerformanceReview.objects.filter(stage=Stages.REVIEW_SCHEDULED).update(
+            scheduled_date=datetime(2024, 6, 1, tzinfo=timezone.utc)
+        )
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+        indexed = run(args.repeat)
+        drop_indexes()
+        plain = run(args.repeat)
+
+    rows = [
+        (name, f"{plain[name][0]:.2f}", f"{indexed[name][0]:.2f}") for name in indexed
+    ]
+    report(
+        f"Median latency over {args.repeat} runs ({args.reviews} reviews, "
+        f"{args.employees} employees, {args.projects} projects)",
+        rows,
+        ["query", "no index ms", "indexed ms"],
+    )
+    for name in indexed:
+        print(name)
+        print(f"  without: {plain[name][1]}")
+        print(f"  with:    {indexed[name][1]}")
+
+
+if __name__ == "__main__":
+    main()
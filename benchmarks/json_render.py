@@ -0,0 +1,107 @@
+"""
+Render time and peak memory of DRF's ``JSONRenderer`` against
+``common.renderers`` on large lists of rows with dates, datetimes and
+decimals, rendered whole and streamed in chunks.
+
+    python -m benchmarks.json_render [--rows 100000] [--chunk 2000]
+"""
+
+import argparse
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from benchmarks.common import report
+
+from rest_framework.renderers import JSONRenderer
+
+from common import renderers
+from common.renderers import FastJSONRenderer, chunked, stream_json_array
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def make_rows(count):
+    for index in range(count):
+        yield {
+            "id": index,
+            "first_name": f"first {index}",
+            "last_name": f"last {index}",
+            "email": f"employee{index}@example.com",
+            "company": "Company",
+            "department": f"Department {index % 50}",
+            "hired_on": date(2020, 1, 1) + timedelta(days=index % 2000),
+            "created_at": START + timedelta(seconds=index, microseconds=index),
+            "salary": Decimal(index % 9000 + 1000) / 10,
+            "is_active": index % 7 != 0,
+        }
+
+
+def whole(renderer, count):
+    return [renderer.render(list(make_rows(count)))]
+
+
+def streamed(renderer, count, chunk):
+    return stream_json_array(chunked(make_rows(count), chunk), renderer)
+
+
+def consume(function):
+    parts = list(function())
+    return sum(len(part) for part in parts), b"".join(parts)
+
+
+def measure(function):
+    start = time.perf_counter()
+    size, content = consume(function)
+    elapsed = time.perf_counter() - start
+    # Traced separately: tracemalloc slows allocation-heavy code down a lot.
+    tracemalloc.start()
+    for part in function():
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak, size, content
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--chunk", type=int, default=2000)
+    args = parser.parse_args()
+
+    drf, fast = JSONRenderer(), FastJSONRenderer()
+    cases = [
+        ("stdlib json", lambda: whole(drf, args.rows)),
+        ("stdlib json, streamed", lambda: streamed(drf, args.rows, args.chunk)),
+    ]
+    if renderers.orjson is not None:
+        cases += [
+            ("orjson", lambda: whole(fast, args.rows)),
+            ("orjson, streamed", lambda: streamed(fast, args.rows, args.chunk)),
+        ]
+
+    rows, expected = [], None
+    for name, function in cases:
+        elapsed, peak, size, content = measure(function)
+        expected = expected or content
+        rows.append(
+            (
+                name,
+                f"{elapsed * 1000:,.0f}",
+                f"{peak / 2**20:,.1f}",
+                f"{size / 2**20:,.1f}",
+                "yes" if content == expected else "NO",
+            )
+        )
+
+    report(
+        f"Rendering {args.rows:,} rows (rows built lazily; streamed in chunks "
+        f"of {args.chunk:,})",
+        rows,
+        ["renderer", "ms", "peak MiB", "output MiB", "identical"],
+    )
+
+
+if __name__ == "__main__":
+    main()
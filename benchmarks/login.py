@@ -0,0 +1,80 @@
+"""
+Logins per second per core for each password hasher policy.
+
+    python -m benchmarks.login [--iterations 50]
+
+Every login runs in a single thread, so the rates are per core. "hash only"
+times ``check_password`` alone; "endpoint" drives ``POST /api/user/login/``
+end to end, including the JWT encoding.
+"""
+
+import argparse
+import time
+
+from benchmarks.common import report, test_database
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, make_password
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from user.models import User
+
+PASSWORD = "TestPass123"
+
+
+def policies():
+    hashers = {
+        "pbkdf2 (Django default)": "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+        "scrypt (tuned)": "user.hashers.TunedScryptPasswordHasher",
+    }
+    try:
+        import argon2  # noqa: F401
+
+        hashers["argon2 (tuned)"] = "user.hashers.TunedArgon2PasswordHasher"
+    except ImportError:
+        pass
+    return hashers
+
+
+def rate(iterations, func):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return iterations / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    rows = []
+    with test_database():
+        client = APIClient()
+        for index, (name, hasher) in enumerate(policies().items()):
+            with override_settings(PASSWORD_HASHERS=[hasher]):
+                encoded = make_password(PASSWORD)
+                email = f"bench{index}@test.com"
+                User.objects.create(email=email, username=email, password=encoded)
+                payload = {"email": email, "password": PASSWORD}
+
+                hash_rate = rate(
+                    args.iterations, lambda: check_password(PASSWORD, encoded)
+                )
+                endpoint_rate = rate(
+                    args.iterations,
+                    lambda: client.post(reverse("login"), payload, format="json"),
+                )
+            rows.append((name, f"{hash_rate:.1f}", f"{endpoint_rate:.1f}"))
+
+    report(
+        f"Logins/sec/core (scrypt params: {settings.PASSWORD_HASHER_PARAMS['scrypt']})",
+        rows,
+        ["policy", "hash only", "endpoint"],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Latency of ``/api/search/`` queries against the full-text index versus the
+equivalent ``icontains`` scan over the employee table.
+
+    python -m benchmarks.search [--employees 1000000] [--repeat 20]
+"""
+
+import argparse
+import statistics
+import time
+
+from benchmarks.common import report, seed_org, test_database
+
+from django.db.models import Q
+
+from common import search
+from user.models import Employee
+
+QUERIES = ("first4242", "last99 develop", "employee12345", "qa", "des")
+
+
+def median_ms(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def scan(query):
+    condition = Q()
+    for word in search.terms(query):
+        condition &= (
+            Q(first_name__icontains=word)
+            | Q(last_name__icontains=word)
+            | Q(email__icontains=word)
+            | Q(position__icontains=word)
+        )
+    return list(Employee.objects.filter(condition).values_list("pk")[:20])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--employees", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with test_database():
+        seed_org(companies=100, departments=10, employees=args.employees)
+        start = time.perf_counter()
+        counts = search.rebuild()
+        print(f"Indexed {counts} in {time.perf_counter() - start:.1f}s\n")
+
+        rows = []
+        for query in QUERIES:
+            indexed = median_ms(lambda: search.search(query, limit=20), args.repeat)
+            scanned = median_ms(lambda: scan(query), args.repeat)
+            rows.append((query, f"{scanned:.2f}", f"{indexed:.2f}"))
+
+    report(
+        f"Median latency over {args.repeat} runs, {args.employees} employees",
+        rows,
+        ["query", "icontains ms", "index ms"],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Concurrent POSTs to ``/api/user/employee/`` and ``/api/project/`` on a file
+SQLite database, with SQLite's defaults against the tuned connection options
+of ``company_sys.database`` (WAL, ``synchronous=NORMAL``, ``busy_timeout``,
+``BEGIN IMMEDIATE``).
+
+    python -m benchmarks.sqlite_writers [--threads 32] [--requests 20]
+
+Each of ``--threads`` threads sends ``--requests`` POSTs through the WSGI
+application, alternating employees and projects. "errors" counts responses
+that were not 201, i.e. "database is locked" failures.
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+
+from benchmarks.common import report, test_database
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.wsgi import get_wsgi_application
+from django.db import connection, connections
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from company.models import Company, Department
+from company_sys.database import database_settings
+from user.models import User
+
+
+def post(application, path, token, payload):
+    body = json.dumps(payload).encode()
+    environ = {
+        "REQUEST_METHOD": "POST",
+        "PATH_INFO": path,
+        "QUERY_STRING": "",
+        "CONTENT_TYPE": "application/json",
+        "CONTENT_LENGTH": str(len(body)),
+        "SERVER_NAME": "testserver",
+        "SERVER_PORT": "80",
+        "HTTP_AUTHORIZATION": f"Bearer {token}",
+        "wsgi.url_scheme": "http",
+        "wsgi.input": BytesIO(body),
+        "wsgi.errors": BytesIO(),
+    }
+    statuses = []
+    response = application(environ, lambda status, headers: statuses.append(status))
+    b"".join(response)
+    response.close()
+    return statuses[0].startswith("201")
+
+
+def run(token, company, department, users, threads, requests):
+    application = get_wsgi_application()
+    barrier = threading.Barrier(threads)
+
+    def worker(index):
+        latencies, errors = [], 0
+        for number in range(requests):
+            if number % 2:
+                path, payload = "/api/project/", {
+                    "company": company,
+                    "department": department,
+                    "name": f"Project {index}-{number}",
+                }
+            else:
+                user = users.pop()
+                path, payload = "/api/user/employee/", {
+                    "company": company,
+                    "department": department,
+                    "user": user.pk,
+                    "first_name": "Bench",
+                    "last_name": f"{index}-{number}",
+                    "email": user.email,
+                }
+            start = time.perf_counter()
+            errors += not post(application, path, token, payload)
+            latencies.append(time.perf_counter() - start)
+        # Wait for the other threads so each closes its own connection.
+        barrier.wait()
+        connections.close_all()
+        return latencies, errors
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        results = list(pool.map(worker, range(threads)))
+    elapsed = time.perf_counter() - start
+    latencies = sorted(latency for result, _ in results for latency in result)
+    return latencies, sum(errors for _, errors in results), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=20)
+    args = parser.parse_args()
+
+    # Failed requests are counted, not logged.
+    logging.disable(logging.CRITICAL)
+    settings.RESPONSE_CACHE["ENABLED"] = False
+    tuned = database_settings({}, Path("."))["OPTIONS"]
+    modes = [("SQLite defaults", {}), ("WAL + BEGIN IMMEDIATE", tuned)]
+    # Create the database with the defaults: WAL, once enabled, stays on for
+    # the file, so the modes run in this order.
+    connection.settings_dict["OPTIONS"] = {}
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        with test_database(Path(directory) / "bench.sqlite3"):
+            company = Company.objects.create(name="Bench")
+            department = Department.objects.create(name="Bench", company=company)
+            admin = User.objects.create(
+                email="admin@bench.test", username="admin", role="admin"
+            )
+            token = str(RefreshToken.for_user(admin).access_token)
+            count = len(modes) * args.threads * args.requests
+            password = make_password(None)
+            users = User.objects.bulk_create(
+                User(
+                    email=f"user{index}@bench.test",
+                    username=f"user {index}",
+                    password=password,
+                )
+                for index in range(count)
+            )
+            for name, options in modes:
+                connection.close()
+                connection.settings_dict["OPTIONS"] = options
+                latencies, errors, elapsed = run(
+                    token, company.pk, department.pk, users, args.threads, args.requests
+                )
+                rows.append(
+                    (
+                        name,
+                        f"{len(latencies) / elapsed:,.0f}",
+                        f"{statistics.median(latencies) * 1000:.1f}",
+                        f"{latencies[int(len(latencies) * 0.99)] * 1000:.1f}",
+                        errors,
+                    )
+                )
+
+    report(
+        f"{args.threads} threads x {args.requests} POSTs",
+        rows,
+        ["connection options", "req/s", "p50 ms", "p99 ms", "errors"],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Stage-transition throughput when many threads race on the same reviews,
+comparing the compare-and-swap ``update_stage`` with the previous
+read-check-``save()``.
+
+Every thread walks each review along pending -> scheduled -> feedback ->
+approval, so exactly three transitions per review are legitimate. "wins" is
+how many transitions callers were told succeeded; with ``save()`` racing
+threads both win and the surplus is reported as "double wins". Runs against
+a file-backed SQLite database so writers wait on each other instead of
+failing.
+
+    python -m benchmarks.stage_contention [--threads 1 4 16] [--reviews 200]
+"""
+
+import argparse
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from benchmarks.common import report, seed_org, test_database
+
+from django.db import connection
+
+from company.choices import Stages
+from company.models import PerformanceReview, StageConflict
+from user.models import Employee
+
+PATH = [Stages.REVIEW_SCHEDULED, Stages.FEEDBACK_PROVIDED, Stages.UNDER_APPROVAL]
+
+
+def save_stage(review, new_stage):
+    """The read-check-save ``update_stage`` this replaced."""
+    if review.can_transition(new_stage):
+        review.stage = new_stage
+        review.save()
+        return True
+    return False
+
+
+def cas_stage(review, new_stage):
+    try:
+        return review.update_stage(new_stage)
+    except StageConflict:
+        return False
+
+
+def race(pks, threads, transition):
+    wins = [0] * threads
+    barrier = threading.Barrier(threads)
+
+    def walk(index):
+        try:
+            barrier.wait()
+            for pk in pks:
+                for stage in PATH:
+                    review = PerformanceReview.objects.get(pk=pk)
+                    if transition(review, stage):
+                        wins[index] += 1
+        finally:
+            connection.close()
+
+    workers = [threading.Thread(target=walk, args=(index,)) for index in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return sum(wins), time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--reviews", type=int, default=200)
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        with test_database(Path(directory) / "bench.sqlite3"):
+            seed_org(companies=1, departments=1, employees=1)
+            employee_id = Employee.objects.values_list("pk", flat=True).get()
+            for threads in args.threads:
+                for name, transition in (("save()", save_stage), ("CAS", cas_stage)):
+                    PerformanceReview.objects.all().delete()
+                    reviews = PerformanceReview.objects.bulk_create(
+                        PerformanceReview(employee_id=employee_id)
+                        for _ in range(args.reviews)
+                    )
+                    pks = [review.pk for review in reviews]
+                    wins, elapsed = race(pks, threads, transition)
+                    expected = len(pks) * len(PATH)
+                    rows.append(
+                        (
+                            threads,
+                            name,
+                            wins,
+                            wins - expected,
+                            f"{expected / elapsed:.0f}",
+                        )
+                    )
+
+    report(
+        "Concurrent stage transitions",
+        rows,
+        ["threads", "write", "wins", "double wins", "transitions/s"],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+from django.core.exceptions import ObjectDoesNotExist
+from django.http import HttpResponse, JsonResponse
+from django.urls import path
+from django.views import View
+from rest_framework.exceptions import (
+    APIException,
+    NotAuthenticated,
+    NotFound,
+    PermissionDenied,
+)
+from rest_framework.request import Request
+from rest_framework.utils.encoders import JSONEncoder
+
+from common.middleware import record_serialization
+from common.renderers import dumps
+from user.authentication import CachedJWTAuthentication
+from user.scope import aget_scope
+
+
+def related_paths(queryset, serializer_class):
+    """``select_related`` paths for every dotted ``source`` of the serializer."""
+    paths = set()
+    for field in serializer_class().fields.values():
+        parts = field.source.split(".")
+        if len(parts) < 2:
+            continue
+        try:
+            if queryset.model._meta.get_field(parts[0]).is_relation:
+                paths.add("__".join(parts[:-1]))
+        except LookupError:
+            continue
+    return paths
+
+
+class AsyncReadView(View):
+    """
+    ASGI-native ``list``/``retrieve`` for an existing ModelViewSet.
+
+    Authentication, permissions, ``get_queryset``, ``filter_queryset``,
+    pagination and the read serializer all come from ``viewset_class``; only
+    the database access differs and goes through ``aget``/``aiterator``, so no
+    worker thread is held while the query or the client is slow. Relations
+    traversed by the serializer are loaded with ``select_related`` because lazy
+    loads are not allowed in async code.
+    """
+
+    viewset_class = None
+    chunk_size = 2000
+    http_method_names = ["get"]
+
+    async def get(self, request, pk=None):
+        try:
+            return await self.read(request, pk)
+        except APIException as exc:
+            response = JsonResponse(
+                {"detail": exc.detail}, status=exc.status_code, encoder=JSONEncoder
+            )
+            if exc.status_code == 401:
+                response["WWW-Authenticate"] = 'Bearer realm="api"'
+            return response
+
+    async def read(self, request, pk):
+        authenticated = await CachedJWTAuthentication().aauthenticate(request)
+        if authenticated is None:
+            raise NotAuthenticated()
+        drf_request = Request(request, authenticators=())
+        drf_request.user, drf_request.auth = authenticated
+
+        viewset = self.viewset_class(
+            request=drf_request,
+            args=(),
+            kwargs={} if pk is None else {"pk": pk},
+            action="list" if pk is None else "retrieve",
+            format_kwarg=None,
+            headers={},
+        )
+        for permission in viewset.get_permissions():
+            if not permission.has_permission(drf_request, viewset):
+                raise PermissionDenied(getattr(permission, "message", None))
+
+        # get_queryset scopes rows by the caller's employee record; resolve it
+        # here so the sync call below finds it memoized.
+        await aget_scope(drf_request.user)
+        queryset = viewset.filter_queryset(viewset.get_queryset())
+        serializer_class = type(viewset.get_serializer())
+        queryset = queryset.select_related(*related_paths(queryset, serializer_class))
+
+        if pk is not None:
+            try:
+                instance = await queryset.aget(pk=pk)
+            except (ObjectDoesNotExist, ValueError):
+                raise NotFound()
+            for permission in viewset.get_permissions():
+                if not permission.has_object_permission(drf_request, viewset, instance):
+                    raise PermissionDenied(getattr(permission, "message", None))
+            with record_serialization(request):
+                data = viewset.get_serializer(instance).data
+            return HttpResponse(dumps(data), content_type="application/json")
+
+        paginator = viewset.paginator
+        page_queryset = None
+        if paginator is not None:
+            page_queryset = paginator.get_page_queryset(queryset, drf_request, viewset)
+        if page_queryset is not None:
+            page = paginator.set_page([obj async for obj in page_queryset])
+            with record_serialization(request):
+                data = viewset.get_serializer(page, many=True).data
+            data = paginator.get_paginated_data(data)
+        else:
+            rows = [obj async for obj in queryset.aiterator(chunk_size=self.chunk_size)]
+            with record_serialization(request):
+                data = viewset.get_serializer(rows, many=True).data
+        return HttpResponse(dumps(data), content_type="application/json")
+
+
+def async_read_urls(prefix, viewset_class, basename):
+    view = AsyncReadView.as_view(viewset_class=viewset_class)
+    return [
+        path(f"async/{prefix}/", view, name=f"async-{basename}-list"),
+        path(f"async/{prefix}/<int:pk>/", view, name=f"async-{basename}-detail"),
+    ]
@@ -0,0 +1,273 @@
+from collections import defaultdict
+
+from django.utils import timezone
+from rest_framework import serializers, status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.validators import UniqueValidator
+
+from common import response_cache, search
+from company import counters
+from user import scope
+from user.permission import IsAdminOrManager
+
+
+class PrefetchedRelatedField(serializers.PrimaryKeyRelatedField):
+    """Resolves primary keys from a dict loaded up front with ``in_bulk``."""
+
+    def __init__(self, objects, **kwargs):
+        self.objects = objects
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            return self.objects[pk]
+        except KeyError:
+            self.fail("does_not_exist", pk_value=data)
+
+
+def as_pk(value):
+    return getattr(value, "pk", value)
+
+
+def bulk_status(results, success):
+    """``success`` if every item passed, 400 if none did, otherwise 207."""
+    failed = sum(1 for result in results if result["status"] >= 400)
+    if not failed:
+        return success
+    if failed == len(results):
+        return status.HTTP_400_BAD_REQUEST
+    return status.HTTP_207_MULTI_STATUS
+
+
+class BulkMixin:
+    """
+    Adds ``POST/PATCH/DELETE <prefix>/bulk/`` to a ModelViewSet.
+
+    Items are validated in one pass by the child of a single ``many=True``
+    serializer: foreign keys listed in ``bulk_relations`` are loaded with one
+    ``in_bulk`` query per related model and unique fields are checked with
+    one ``IN`` query per field. Valid items are written with
+    ``bulk_create``/``bulk_update`` and the denormalized counters are updated
+    once per affected parent. The response holds one result per item. Only
+    admins and managers may use it, on top of the view's own permissions.
+    """
+
+    bulk_max_items = 1000
+    bulk_relations = {}
+
+    def get_permissions(self):
+        permissions = super().get_permissions()
+        if self.action == "bulk":
+            permissions.append(IsAdminOrManager())
+        return permissions
+
+    @action(detail=False, methods=["post", "patch", "delete"], url_path="bulk")
+    def bulk(self, request):
+        items = request.data
+        if request.method == "DELETE" and isinstance(items, dict):
+            items = items.get("ids")
+        if not isinstance(items, list) or not items:
+            return Response(
+                {"error": "expected a non-empty list"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(items) > self.bulk_max_items:
+            return Response(
+                {"error": f"at most {self.bulk_max_items} items per request"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if request.method == "POST":
+            results, success = self.bulk_create(items), status.HTTP_201_CREATED
+        elif request.method == "PATCH":
+            results, success = self.bulk_update(items), status.HTTP_200_OK
+        else:
+            results, success = self.bulk_destroy(items), status.HTTP_200_OK
+        return Response({"results": results}, status=self.bulk_status(results, success))
+
+    def bulk_status(self, results, success):
+        return bulk_status(results, success)
+
+    def load_relations(self, items):
+        pks = {name: set() for name in self.bulk_relations}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            for name in self.bulk_relations:
+                try:
+                    pks[name].add(int(item[name]))
+                except (KeyError, TypeError, ValueError):
+                    pass
+        return {
+            name: model.objects.in_bulk(pks[name])
+            for name, model in self.bulk_relations.items()
+        }
+
+    def prepare_serializer(self, serializer, relations):
+        for name, objects in relations.items():
+            field = serializer.fields[name]
+            serializer.fields[name] = PrefetchedRelatedField(
+                objects,
+                queryset=field.queryset,
+                required=field.required,
+                allow_null=field.allow_null,
+                validators=field.validators,
+            )
+        unique = {}
+        for name, field in serializer.fields.items():
+            validators = [v for v in field.validators if isinstance(v, UniqueValidator)]
+            if validators:
+                field.validators = [v for v in field.validators if v not in validators]
+                unique[name] = (field.source, str(validators[0].message))
+        return unique
+
+    def validate_items(self, items, instances=None):
+        """Return ``[(validated_data or None, errors or None)]`` in item order."""
+        serializer = self.get_serializer(
+            data=items, many=True, partial=instances is not None
+        )
+        child = serializer.child
+        unique = self.prepare_serializer(child, self.load_relations(items))
+        validated = []
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                validated.append((None, {"non_field_errors": ["expected an object"]}))
+                continue
+            # What ListSerializer.run_child_validation would do, but one
+            # invalid item must not discard the others.
+            child.instance = instances[index] if instances is not None else None
+            child.initial_data = item
+            try:
+                validated.append((child.run_validation(item), None))
+            except ValidationError as exc:
+                validated.append((None, exc.detail))
+        self.check_unique(validated, unique, instances)
+        return validated
+
+    def check_unique(self, validated, unique, instances=None):
+        model = self.get_queryset().model
+        for name, (source, message) in unique.items():
+            values = {}
+            for index, (data, _) in enumerate(validated):
+                if data is not None and source in data:
+                    values[index] = as_pk(data[source])
+            if not values:
+                continue
+            taken = dict(
+                model.objects.filter(**{f"{source}__in": set(values.values())})
+                .values_list(source, "pk")
+                .iterator()
+            )
+            seen = set()
+            for index, value in values.items():
+                owner = instances[index].pk if instances is not None else None
+                if taken.get(value, owner) != owner or value in seen:
+                    validated[index] = (None, {name: [message]})
+                else:
+                    seen.add(value)
+
+    def bulk_create(self, items):
+        validated = self.validate_items(items)
+        model = self.get_queryset().model
+        objs = [model(**data) for data, _ in validated if data is not None]
+        with counters.deferred():
+            model.objects.bulk_create(objs)
+            for obj in objs:
+                counters.track_create(obj)
+        search.index(objs)
+        scope.invalidate_owners(map(scope.owner, objs))
+        response_cache.bump(model)
+
+        created = iter(objs)
+        results = []
+        for index, (_, errors) in enumerate(validated):
+            if errors is not None:
+                results.append({"index": index, "status": 400, "errors": errors})
+            else:
+                results.append({"index": index, "status": 201, "id": next(created).pk})
+        return results
+
+    def bulk_update(self, items):
+        ids = []
+        for item in items:
+            try:
+                ids.append(int(item["id"]))
+            except (KeyError, TypeError, ValueError):
+                ids.append(None)
+        found = self.get_queryset().in_bulk([pk for pk in ids if pk is not None])
+
+        results = [None] * len(items)
+        indexes = []
+        for index, pk in enumerate(ids):
+            if pk in found:
+                indexes.append(index)
+            else:
+                results[index] = {"index": index, "status": 404, "id": pk}
+
+        instances = [found[ids[index]] for index in indexes]
+        validated = self.validate_items([items[index] for index in indexes], instances)
+        now = timezone.now()
+        model = self.get_queryset().model
+        counted = counters.COUNTED_RELATIONS.get(model, {})
+        objs, fields, owners, moves = [], {"updated_at"}, [], defaultdict(dict)
+        for index, obj, (data, errors) in zip(indexes, instances, validated):
+            if errors is not None:
+                results[index] = {
+                    "index": index,
+                    "status": 400,
+                    "id": ids[index],
+                    "errors": errors,
+                }
+                continue
+            original = dict(getattr(obj, "_counted_parents", {}))
+            owners.append(scope.owner(obj))
+            for attr, value in data.items():
+                setattr(obj, attr, value)
+                fields.add(attr)
+            owners.append(scope.owner(obj))
+            for attname in counted:
+                if attname in original:
+                    moves[attname][obj.pk] = (original[attname], getattr(obj, attname))
+            obj.updated_at = now
+            objs.append(obj)
+            results[index] = {"index": index, "status": 200, "id": obj.pk}
+
+        if objs:
+            # One conditional UPDATE per (old, new) parent pair, then one
+            # counter UPDATE per affected parent and the batched row write.
+            with counters.deferred():
+                if moves:
+                    counters.track_moves(model, moves)
+                model.objects.bulk_update(objs, sorted(fields))
+            search.index(objs)
+            scope.invalidate_owners(owners)
+            response_cache.bump(model)
+        return results
+
+    def bulk_destroy(self, items):
+        ids = []
+        for item in items:
+            try:
+                ids.append(int(item))
+            except (TypeError, ValueError):
+                ids.append(None)
+        queryset = self.get_queryset()
+        existing = set(
+            queryset.filter(pk__in=[pk for pk in ids if pk is not None]).values_list(
+                "pk", flat=True
+            )
+        )
+        with counters.deferred():
+            queryset.model.objects.filter(pk__in=existing).delete()
+        return [
+            {"index": index, "status": 204 if pk in existing else 404, "id": pk}
+            for index, pk in enumerate(ids)
+        ]
@@ -0,0 +1,124 @@
+import hashlib
+from datetime import datetime, time
+
+from django.db.models import Count, Max
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from common import response_cache
+from common.async_views import related_paths
+from user import scope
+
+
+class ConditionalGetMixin:
+    """
+    Weak ``ETag`` and ``Last-Modified`` for ``list``/``retrieve`` of a
+    ModelViewSet over ``TimeStampedModel`` rows.
+
+    Before anything is serialized, a list's state is read from the
+    response-cache generations of the view's ``cache_dependencies``, which
+    every write to those models bumps, when they live in a cache shared by
+    all processes; otherwise one small query reads ``COUNT(*)`` and
+    ``MAX(updated_at)`` of the filtered list and of every relation the read
+    serializer renders. A detail reads the row's ``updated_at`` with those
+    relations' ``MAX(updated_at)``. Views whose queryset depends on the
+    caller's employee record set ``row_scoped``: for non-admins the state
+    then also holds that scope, so moving the record changes the ETag. A matching ``If-None-Match`` (or, for details,
+    ``If-Modified-Since``) is answered with 304 right away. Lists ignore
+    ``If-Modified-Since`` because a delete does not move
+    ``MAX(updated_at)``. Views whose output also changes with the date, such
+    as ``days_employed``, set ``conditional_changes_daily``.
+    """
+
+    conditional_changes_daily = False
+    row_scoped = False
+
+    def list(self, request, *args, **kwargs):
+        not_modified = self.conditional_response(request)
+        if not_modified is not None:
+            return not_modified
+        return super().list(request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        not_modified = self.conditional_response(request)
+        if not_modified is not None:
+            return not_modified
+        return super().retrieve(request, *args, **kwargs)
+
+    def get_modified_fields(self, queryset):
+        serializer_class = self.get_serializer_class()
+        paths = sorted(related_paths(queryset, serializer_class))
+        return ["updated_at", *(f"{path}__updated_at" for path in paths)]
+
+    def get_conditional_state(self):
+        """Return ``(state, last_modified)`` or ``None`` for a missing row."""
+        user = self.request.user
+        if self.action == "list" and response_cache.is_shared():
+            state = list(response_cache.get_generations(self.cache_dependencies))
+        elif self.action == "list":
+            queryset = self.filter_queryset(self.get_queryset()).order_by()
+            fields = self.get_modified_fields(queryset)
+            aggregates = {f"max_{i}": Max(field) for i, field in enumerate(fields)}
+            row = queryset.aggregate(count=Count("pk"), **aggregates)
+            state = [row["count"], *(row[f"max_{i}"] for i in range(len(fields)))]
+        else:
+            queryset = self.filter_queryset(self.get_queryset()).order_by()
+            fields = self.get_modified_fields(queryset)
+            lookup = self.lookup_url_kwarg or self.lookup_field
+            try:
+                state = list(
+                    queryset.filter(**{self.lookup_field: self.kwargs[lookup]})
+                    .values_list(*fields)
+                    .get()
+                )
+            except (queryset.model.DoesNotExist, ValueError):
+                return None
+        if self.action == "list" and self.row_scoped and user.role != "admin":
+            state.append(scope.get_scope(user))
+        if self.conditional_changes_daily:
+            state.append(timezone.localdate())
+        modified = [value for value in state if isinstance(value, datetime)]
+        if modified and self.conditional_changes_daily:
+            midnight = datetime.combine(timezone.localdate(), time.min)
+            modified.append(timezone.make_aware(midnight))
+        return state, max(modified) if modified else None
+
+    def get_conditional_etag(self, request, state):
+        parts = [
+            f"{type(self).__module__}.{type(self).__qualname__}",
+            self.action,
+            repr(sorted(request.query_params.lists())),
+            request.accepted_media_type,
+            str(request.user.pk),
+            repr(state),
+        ]
+        digest = hashlib.blake2b("\n".join(parts).encode(), digest_size=16)
+        return f'W/"{digest.hexdigest()}"'
+
+    def conditional_response(self, request):
+        self.conditional_headers = None
+        if self.action not in ("list", "retrieve"):
+            return None
+        found = self.get_conditional_state()
+        if found is None:
+            return None
+        state, last_modified = found
+        etag = self.get_conditional_etag(request, state)
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        self.conditional_headers = {"ETag": etag}
+        if timestamp is not None:
+            self.conditional_headers["Last-Modified"] = http_date(timestamp)
+        return get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=timestamp if self.action == "retrieve" else None,
+        )
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        headers = getattr(self, "conditional_headers", None)
+        if headers and response.status_code in (200, 304):
+            for name, value in headers.items():
+                response[name] = value
+        return response
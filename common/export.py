@@ -0,0 +1,117 @@
+import csv
+import io
+from datetime import date
+
+from django.http import StreamingHttpResponse
+from rest_framework.decorators import action
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class CSVRenderer(BaseRenderer):
+    # Only used for content negotiation of ``?format=csv``; the export itself
+    # is streamed, so anything rendered here is an error payload such as
+    # ``{"detail": ...}``, written as a header row and one row of values.
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if not isinstance(data, dict):
+            data = {"detail": data}
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(data)
+        writer.writerow(data.values())
+        return output.getvalue().encode(self.charset)
+
+
+# A single JSON object is a valid one-line NDJSON document, so error payloads
+# render as JSON.
+class NDJSONRenderer(JSONRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+
+
+class Echo:
+    def write(self, value):
+        return value
+
+
+class ExportMixin:
+    """
+    Adds ``GET <prefix>/export/?format=csv|ndjson`` to a ModelViewSet.
+
+    Rows are read with ``values_list(...).iterator(chunk_size=...)`` and
+    streamed, so memory stays flat regardless of the table size.
+    ``export_fields`` is a sequence of ``(column, ORM path)``; a ``None`` path
+    marks a computed column filled in by ``export_row``.
+    """
+
+    export_fields = ()
+    export_chunk_size = 2000
+
+    @action(
+        detail=False,
+        methods=["get"],
+        renderer_classes=[CSVRenderer, NDJSONRenderer, JSONRenderer],
+    )
+    def export(self, request):
+        columns = [column for column, _ in self.export_fields]
+        selected = [column for column, path in self.export_fields if path]
+        paths = [path for _, path in self.export_fields if path]
+        queryset = self.filter_queryset(self.get_queryset()).order_by("pk")
+        rows = (
+            self.export_row(dict(zip(selected, values)))
+            for values in queryset.values_list(*paths).iterator(
+                chunk_size=self.export_chunk_size
+            )
+        )
+        if request.accepted_renderer.format == "ndjson":
+            export_format, content = "ndjson", self.stream_ndjson(rows)
+            content_type = NDJSONRenderer.media_type
+        else:
+            export_format, content = "csv", self.stream_csv(columns, rows)
+            content_type = CSVRenderer.media_type
+
+        response = StreamingHttpResponse(content, content_type=content_type)
+        response["Content-Disposition"] = (
+            f'attachment; filename="{self.basename}.{export_format}"'
+        )
+        return response
+
+    def export_row(self, row):
+        return row
+
+    def stream_csv(self, columns, rows):
+        writer = csv.writer(Echo())
+        encoder = JSONEncoder()
+        yield writer.writerow(columns)
+        chunk = []
+        for row in rows:
+            chunk.append(
+                writer.writerow(
+                    [
+                        encoder.default(value) if isinstance(value, date) else value
+                        for value in (row[column] for column in columns)
+                    ]
+                )
+            )
+            if len(chunk) >= self.export_chunk_size:
+                yield "".join(chunk)
+                chunk = []
+        if chunk:
+            yield "".join(chunk)
+
+    def stream_ndjson(self, rows):
+        encoder = JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+        chunk = []
+        for row in rows:
+            chunk.append(encoder.encode(row) + "\n")
+            if len(chunk) >= self.export_chunk_size:
+                yield "".join(chunk)
+                chunk = []
+        if chunk:
+            yield "".join(chunk)
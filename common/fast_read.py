@@ -0,0 +1,287 @@
+"""
+Serializer-free ``list`` for the plain read serializers.
+
+A serializer whose fields are model columns, ``source="a.b"`` traversals of
+forward relations or queryset annotations is compiled once into a
+``values_list()`` plan: traversals become SQL joins and every row tuple is
+turned into a dict by the fields' own ``to_representation``, so the output is
+byte-identical to ``serializer.data`` without walking attributes through a
+field graph per row. Model properties listed in the view's
+``sparse_field_sources`` are computed from those columns. Anything else
+(nested serializers, method fields, related fields) is not compiled and the
+view keeps the regular DRF path.
+
+The one difference: a traversal through a null foreign key renders ``null``
+where the DRF serializer would raise.
+"""
+
+from datetime import datetime
+from itertools import chain
+from types import SimpleNamespace
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.relations import ManyRelatedField, RelatedField
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from common.middleware import record_serialization
+from common.renderers import chunked, stream_json_array
+
+UNSUPPORTED_FIELDS = (
+    serializers.BaseSerializer,
+    serializers.SerializerMethodField,
+    RelatedField,
+    ManyRelatedField,
+)
+
+_plans = {}
+
+
+def resolve_path(model, attrs, annotations):
+    """Return the ORM path for ``source_attrs`` or ``None`` if it is not a column."""
+    if len(attrs) == 1 and attrs[0] in annotations:
+        return attrs[0]
+    for index, attr in enumerate(attrs):
+        try:
+            field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            return None
+        last = index == len(attrs) - 1
+        if field.is_relation:
+            if (
+                last
+                or not (field.many_to_one or field.one_to_one)
+                or not field.concrete
+            ):
+                return None
+            model = field.related_model
+        elif not last or not field.concrete:
+            return None
+    return "__".join(attrs) if attrs else None
+
+
+def representation(field, zone):
+    """
+    ``field.to_representation``, except that ISO 8601 datetimes use the
+    ``zone`` looked up once per render instead of once per value.
+    """
+    if not (
+        isinstance(field, serializers.DateTimeField)
+        and zone is not None
+        and not hasattr(field, "timezone")
+        and getattr(field, "format", api_settings.DATETIME_FORMAT) == ISO_8601
+    ):
+        return field.to_representation
+
+    def represent(value):
+        if not isinstance(value, datetime) or value.utcoffset() is None:
+            return field.to_representation(value)
+        try:
+            value = value.astimezone(zone).isoformat()
+        except OverflowError:
+            return field.to_representation(value)
+        return value[:-6] + "Z" if value.endswith("+00:00") else value
+
+    return represent
+
+
+class CompiledSerializer:
+    def __init__(self, names, paths, steps):
+        self.names = names
+        self.paths = paths
+        # One (position or columns, property getter or None, field) per
+        # serializer field, in the serializer's field order.
+        self.steps = steps
+
+    def values(self, queryset, named=False):
+        paths = list(self.paths)
+        if named:
+            # KeysetPagination builds its cursors from these attributes.
+            paths += [path for path in ("created_at", "pk") if path not in paths]
+        return queryset.values_list(*paths, named=named)
+
+    def render(self, rows):
+        zone = timezone.get_current_timezone() if settings.USE_TZ else None
+        steps = [
+            (name, position, getter, representation(field, zone))
+            for name, (position, getter, field) in zip(self.names, self.steps)
+        ]
+
+        def to_dict(row):
+            data = {}
+            for name, position, getter, represent in steps:
+                if getter is None:
+                    value = row[position]
+                else:
+                    value = getter(
+                        SimpleNamespace(**{path: row[i] for path, i in position})
+                    )
+                data[name] = None if value is None else represent(value)
+            return data
+
+        return [to_dict(row) for row in rows]
+
+
+def compile_serializer(serializer, queryset, computed_sources=None):
+    """Return a ``CompiledSerializer`` for ``serializer`` or ``None``."""
+    model = queryset.model
+    annotations = queryset.query.annotations
+    computed_sources = computed_sources or {}
+    names, paths, steps = [], [], []
+
+    def position(path):
+        if path not in paths:
+            paths.append(path)
+        return paths.index(path)
+
+    for field in serializer._readable_fields:
+        if isinstance(field, UNSUPPORTED_FIELDS):
+            return None
+        path = resolve_path(model, field.source_attrs, annotations)
+        if path is not None:
+            steps.append((position(path), None, field))
+        elif field.field_name in computed_sources and len(field.source_attrs) == 1:
+            prop = getattr(model, field.source_attrs[0], None)
+            if not isinstance(prop, property):
+                return None
+            columns = tuple(
+                (column, position(column))
+                for column in computed_sources[field.field_name]
+            )
+            steps.append((columns, prop.fget, field))
+        else:
+            return None
+        names.append(field.field_name)
+    return CompiledSerializer(names, paths, steps)
+
+
+def get_plan(view, queryset):
+    serializer = view.get_serializer()
+    key = (
+        type(view),
+        tuple(serializer.fields),
+        tuple(sorted(queryset.query.annotations)),
+    )
+    if key not in _plans:
+        _plans[key] = compile_serializer(
+            serializer, queryset, getattr(view, "sparse_field_sources", None)
+        )
+    return _plans[key]
+
+
+class FastReadMixin:
+    """
+    Serves ``list`` of a ModelViewSet from a compiled ``values_list()`` plan
+    when ``FAST_READ_SERIALIZERS`` is on; filters, ordering, ``?fields=`` and
+    keyset pagination behave exactly as on the DRF path. ``list`` and
+    ``retrieve`` time their serializer work for ``QueryMetricsMiddleware``.
+
+    Unpaginated JSON lists of more than ``JSON_STREAM_THRESHOLD`` rows are
+    read and rendered that many rows at a time and streamed, with or without
+    a compiled plan. Only under WSGI: ASGI consumes a sync iterator in a
+    thread and buffers it, which keeps the cursor open and saves nothing.
+    """
+
+    def list(self, request, *args, **kwargs):
+        fast = getattr(settings, "FAST_READ_SERIALIZERS", False)
+        chunk_size = getattr(settings, "JSON_STREAM_THRESHOLD", 0)
+        if (
+            not chunk_size
+            or request.accepted_renderer.format != "json"
+            or isinstance(request._request, ASGIRequest)
+        ):
+            chunk_size = 0
+            if not fast:
+                return self.list_serialized(self.filter_queryset(self.get_queryset()))
+        queryset = self.filter_queryset(self.get_queryset())
+        plan = get_plan(self, queryset) if fast else None
+        if plan is None and not chunk_size:
+            return self.list_serialized(queryset)
+
+        paginator = self.paginator
+        if plan is None:
+            page = self.paginate_queryset(queryset)
+            if page is not None:
+                return self.get_paginated_response(self.serialize(page, many=True))
+        elif paginator is not None:
+            page_queryset = paginator.get_page_queryset(
+                plan.values(queryset, named=True), request, self
+            )
+            if page_queryset is not None:
+                page = paginator.set_page(list(page_queryset))
+                with record_serialization(request):
+                    data = plan.render(page)
+                return paginator.get_paginated_response(data)
+
+        if not chunk_size:
+            with record_serialization(request):
+                return Response(plan.render(plan.values(queryset)))
+        chunks = self.list_chunks(queryset, plan, chunk_size)
+        first = next(chunks, [])
+        second = next(chunks, None)
+        if second is None:
+            return Response(first)
+        content = stream_json_array(
+            chain([first, second], chunks),
+            request.accepted_renderer,
+            self.get_renderer_context(),
+        )
+        return StreamingHttpResponse(
+            ClosingStream(content, chunks.close),
+            content_type=request.accepted_renderer.media_type,
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        return Response(self.serialize(self.get_object()))
+
+    def list_serialized(self, queryset):
+        """DRF's ``list`` with the serializer work timed."""
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.serialize(page, many=True))
+        return Response(self.serialize(queryset, many=True))
+
+    def serialize(self, instance, many=False):
+        with record_serialization(self.request):
+            return self.get_serializer(instance, many=many).data
+
+    def list_chunks(self, queryset, plan, size):
+        if plan is not None:
+            rows = plan.values(queryset).iterator(chunk_size=size)
+            render = plan.render
+        else:
+            rows = queryset.iterator(chunk_size=size)
+
+            def render(chunk):
+                return self.get_serializer(chunk, many=True).data
+
+        try:
+            for chunk in chunked(rows, size):
+                yield render(chunk)
+        finally:
+            # Releases the server-side cursor of an abandoned stream.
+            rows.close()
+
+
+class ClosingStream:
+    """
+    Iterable for ``StreamingHttpResponse`` whose ``close()``, called by
+    ``response.close()``, also closes the row source even if the body was
+    never read.
+    """
+
+    def __init__(self, content, close):
+        self.content = content
+        self.close_source = close
+
+    def __iter__(self):
+        return iter(self.content)
+
+    def close(self):
+        self.content.close()
+        self.close_source()
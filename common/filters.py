@@ -0,0 +1,167 @@
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import models
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+LIST_LOOKUPS = ("in", "range")
+TRUE_VALUES = ("1", "t", "true", "True")
+FALSE_VALUES = ("0", "f", "false", "False")
+
+
+class FieldFilter(BaseFilterBackend):
+    """
+    Whitelisted ``?<field>=`` / ``?<field>__<lookup>=`` filters.
+
+    Views declare ``filter_fields = {"start_date": ["gte", "lte"], ...}``;
+    ``exact`` is spelled as the bare field name, ``in`` and ``range`` take
+    comma separated values. Values are converted with the model field so bad
+    input is a 400 instead of a database error, and parameters that are not
+    declared are ignored.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        conditions = {}
+        errors = {}
+        for param, (name, lookup) in self.get_params(view).items():
+            raw = request.query_params.get(param)
+            if raw is None:
+                continue
+            field = queryset.model._meta.get_field(name)
+            try:
+                conditions[f"{name}__{lookup}"] = self.to_python(field, lookup, raw)
+            except DjangoValidationError as exc:
+                errors[param] = exc.messages
+        if errors:
+            raise ValidationError(errors)
+        return queryset.filter(**conditions) if conditions else queryset
+
+    def get_params(self, view):
+        params = {}
+        for name, lookups in getattr(view, "filter_fields", {}).items():
+            for lookup in lookups:
+                param = name if lookup == "exact" else f"{name}__{lookup}"
+                params[param] = (name, lookup)
+        return params
+
+    def to_python(self, field, lookup, raw):
+        if lookup == "isnull":
+            return self.to_bool(raw)
+        if lookup in LIST_LOOKUPS:
+            values = [self.to_value(field, value) for value in raw.split(",") if value]
+            if lookup == "range" and len(values) != 2:
+                raise DjangoValidationError("Expected two comma separated values.")
+            return values
+        if lookup in ("contains", "icontains", "startswith", "istartswith"):
+            return raw
+        return self.to_value(field, raw)
+
+    def to_value(self, field, raw):
+        if field.is_relation:
+            field = field.target_field
+        if isinstance(field, models.BooleanField):
+            return self.to_bool(raw)
+        value = field.to_python(raw)
+        if isinstance(field, models.DateTimeField) and settings.USE_TZ:
+            if timezone.is_naive(value):
+                value = timezone.make_aware(value)
+        return value
+
+    def to_bool(self, raw):
+        if raw in TRUE_VALUES:
+            return True
+        if raw in FALSE_VALUES:
+            return False
+        raise DjangoValidationError("Expected true or false.")
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": param,
+                "required": False,
+                "in": "query",
+                "description": f"Filter on {name} ({lookup}).",
+                "schema": {"type": "string"},
+            }
+            for param, (name, lookup) in self.get_params(view).items()
+        ]
+
+
+class SparseFieldsMixin:
+    """
+    ``?fields=id,name`` on ``list``/``retrieve`` of a ModelViewSet.
+
+    The read serializer is narrowed to the requested fields and the query to
+    the columns their sources need, through ``.only()``, so unused columns are
+    neither fetched nor serialized. Sources that are not model fields, such as
+    properties, are mapped to the columns they read in ``sparse_field_sources``;
+    annotations are always kept.
+    """
+
+    sparse_fields_param = "fields"
+    sparse_field_sources = {}
+
+    def get_sparse_fields(self):
+        if getattr(self, "action", None) not in ("list", "retrieve"):
+            return None
+        raw = self.request.query_params.get(self.sparse_fields_param)
+        if not raw:
+            return None
+        return [name for name in raw.split(",") if name]
+
+    def get_serializer(self, *args, **kwargs):
+        serializer_class = self.get_sparse_serializer_class()
+        kwargs.setdefault("context", self.get_serializer_context())
+        return serializer_class(*args, **kwargs)
+
+    def get_sparse_serializer_class(self):
+        serializer_class = self.get_serializer_class()
+        names = self.get_sparse_fields()
+        if not names:
+            return serializer_class
+
+        unknown = set(names) - set(serializer_class().fields)
+        if unknown:
+            raise ValidationError(
+                {self.sparse_fields_param: [f"Unknown field(s): {sorted(unknown)}"]}
+            )
+
+        class SparseSerializer(serializer_class):
+            def get_fields(self):
+                fields = super().get_fields()
+                return {name: fields[name] for name in fields if name in names}
+
+        SparseSerializer.__name__ = serializer_class.__name__
+        return SparseSerializer
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if not self.get_sparse_fields():
+            return queryset
+
+        # KeysetPagination builds its cursors from created_at.
+        columns, related = {"created_at"}, set()
+        for name, field in self.get_sparse_serializer_class()().fields.items():
+            if name in self.sparse_field_sources:
+                columns.update(self.sparse_field_sources[name])
+                continue
+            if field.source in queryset.query.annotations:
+                continue
+            parts = field.source.split(".")
+            try:
+                model_field = queryset.model._meta.get_field(parts[0])
+            except FieldDoesNotExist:
+                # Unknown source: load the full row rather than one query per
+                # object for a deferred column.
+                return queryset
+            if model_field.is_relation and len(parts) > 1:
+                related.add("__".join(parts[:-1]))
+            columns.add("__".join(parts))
+
+        if queryset.query.select_related:
+            queryset = queryset.select_related(None)
+            if related:
+                queryset = queryset.select_related(*related)
+        return queryset.only(*columns)
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from common import search
+
+
+class Command(BaseCommand):
+    help = "Recreate the employee/project full-text search index."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        counts = search.rebuild(batch_size=options["batch_size"])
+        for kind, count in counts.items():
+            self.stdout.write(f"{kind}: indexed {count} document(s)")
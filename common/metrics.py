@@ -0,0 +1,90 @@
+import threading
+from bisect import bisect_left
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+# name -> (help text, buckets)
+METRICS = {
+    "http_request_duration_seconds": (
+        "Total time spent handling the request.",
+        DURATION_BUCKETS,
+    ),
+    "http_request_db_queries": ("SQL queries issued per request.", QUERY_BUCKETS),
+    "http_request_db_duration_seconds": (
+        "Time spent executing SQL per request.",
+        DURATION_BUCKETS,
+    ),
+    "http_request_serialization_duration_seconds": (
+        "Time spent building serializer data for list and detail reads, less SQL.",
+        DURATION_BUCKETS,
+    ),
+    "http_request_render_duration_seconds": (
+        "Time spent rendering the response body.",
+        DURATION_BUCKETS,
+    ),
+}
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """In-process histograms per metric and resolved URL name."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+
+    def observe(self, view, **values):
+        with self._lock:
+            for name, value in values.items():
+                key = (name, view)
+                if key not in self._histograms:
+                    self._histograms[key] = Histogram(METRICS[name][1])
+                self._histograms[key].observe(value)
+
+    def clear(self):
+        with self._lock:
+            self._histograms.clear()
+
+    def render(self):
+        """Prometheus text exposition format, version 0.0.4."""
+        lines = []
+        with self._lock:
+            for name, (help_text, _) in METRICS.items():
+                series = sorted(
+                    (view, histogram)
+                    for (metric, view), histogram in self._histograms.items()
+                    if metric == name
+                )
+                if not series:
+                    continue
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} histogram")
+                for view, histogram in series:
+                    label = view.replace("\\", "\\\\").replace('"', '\\"')
+                    cumulative = 0
+                    for bound, count in zip(
+                        histogram.buckets + ("+Inf",), histogram.counts
+                    ):
+                        cumulative += count
+                        lines.append(
+                            f'{name}_bucket{{view="{label}",le="{bound}"}} {cumulative}'
+                        )
+                    lines.append(f'{name}_sum{{view="{label}"}} {histogram.sum}')
+                    lines.append(f'{name}_count{{view="{label}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
@@ -0,0 +1,117 @@
+import time
+from contextlib import ExitStack, contextmanager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+
+from common.metrics import registry
+
+
+class RequestStats:
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.serialize_time = 0.0
+        self.render_time = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - start
+            self.queries += 1
+
+
+def record_render(request, seconds):
+    """Add the time a renderer spent on ``request``'s response body."""
+    stats = getattr(request, "_request_stats", None)
+    if stats is not None:
+        stats.render_time += seconds
+
+
+@contextmanager
+def record_serialization(request):
+    """Time the block as serializer work for ``request``, less the SQL it ran."""
+    stats = getattr(request, "_request_stats", None)
+    if stats is None:
+        yield
+        return
+    start, db_time = time.perf_counter(), stats.db_time
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start - (stats.db_time - db_time)
+        stats.serialize_time += max(0.0, elapsed)
+
+
+class QueryMetricsMiddleware:
+    """
+    Records query count, SQL time, serialization time, rendering time and
+    total time per resolved URL name into ``common.metrics.registry``.
+    Rendering is timed by ``common.renderers`` and serialization, without the
+    SQL it triggers, by the read paths of ``common.fast_read`` and
+    ``common.async_views``. With ``METRICS["SERVER_TIMING"]`` enabled the same
+    numbers are returned in a ``Server-Timing`` header.
+
+    Works in both modes, so under ASGI async views are not pushed into a
+    worker thread on its account.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        stats, start = self.start(request)
+        with self.wrap_connections(stats):
+            response = self.get_response(request)
+        return self.finish(request, response, stats, start)
+
+    async def __acall__(self, request):
+        stats, start = self.start(request)
+        with self.wrap_connections(stats):
+            response = await self.get_response(request)
+        return self.finish(request, response, stats, start)
+
+    def start(self, request):
+        stats = RequestStats()
+        request._request_stats = stats
+        return stats, time.perf_counter()
+
+    def wrap_connections(self, stats):
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(stats))
+        return stack
+
+    def finish(self, request, response, stats, start):
+        total = time.perf_counter() - start
+        match = request.resolver_match
+        view = match.view_name if match is not None else "<unresolved>"
+        registry.observe(
+            view,
+            http_request_duration_seconds=total,
+            http_request_db_queries=stats.queries,
+            http_request_db_duration_seconds=stats.db_time,
+            http_request_serialization_duration_seconds=stats.serialize_time,
+            http_request_render_duration_seconds=stats.render_time,
+        )
+
+        if getattr(settings, "METRICS", {}).get("SERVER_TIMING", False):
+            response["Server-Timing"] = ", ".join(
+                [
+                    f'db;dur={stats.db_time * 1000:.1f};desc="{stats.queries} queries"',
+                    f"serialize;dur={stats.serialize_time * 1000:.1f}",
+                    f"render;dur={stats.render_time * 1000:.1f}",
+                    f"total;dur={total * 1000:.1f}",
+                ]
+            )
+        return response
@@ -0,0 +1,28 @@
+from django.db import migrations
+
+from common import search
+
+
+def create_search_index(apps, schema_editor):
+    search.rebuild(registry=apps)
+
+
+def drop_search_index(apps, schema_editor):
+    backend = search.get_backend(schema_editor.connection)
+    if backend is not None:
+        with schema_editor.connection.cursor() as cursor:
+            backend.drop(cursor)
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("company", "0005_query_indexes"),
+        ("user", "0005_query_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
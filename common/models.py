@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, router, transaction
 from django.utils.translation import gettext_lazy as _
 
 # Create your models here.
@@ -10,3 +10,22 @@ class TimeStampedModel(models.Model):
 
     class Meta:
         abstract = True
+
+
+class CountedModel(TimeStampedModel):
+    """
+    A row counted in its parents' denormalized counters (``company.counters``).
+    Updates are saved in one transaction, so a move's foreign key swap and
+    counter updates, done before the row is written, commit or roll back
+    together with it.
+    """
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        if self._state.adding:
+            return super().save(*args, **kwargs)
+        using = kwargs.get("using") or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            super().save(*args, **kwargs)
@@ -0,0 +1,176 @@
+import base64
+import json
+from datetime import datetime
+
+from django.conf import settings
+from django.db.models import Q
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.settings import api_settings
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination keyed on ``(created_at, id)`` of ``TimeStampedModel``.
+
+    Every page is a ``WHERE (created_at, id) < (cursor)`` range scan followed by
+    ``LIMIT page_size + 1``, so deep pages cost the same as the first one.
+    Pagination is opt-in: a list is only paginated when the client sends
+    ``?page_size=`` or ``?cursor=``, otherwise the full list is returned as
+    before. Views can override ``page_size`` and ``max_page_size``; the latter
+    is always clamped to ``KEYSET_PAGINATION["MAX_PAGE_SIZE"]``. Pages are
+    always newest first, so ``?ordering=`` on a paginated list is a 400 rather
+    than being silently dropped.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    ordering_query_param = api_settings.ORDERING_PARAM
+    invalid_cursor_message = "Invalid cursor"
+    ordering_message = "Ordering is not supported on paginated lists."
+
+    def __init__(self):
+        config = getattr(settings, "KEYSET_PAGINATION", {})
+        self.page_size = config.get("PAGE_SIZE", 50)
+        self.max_page_size = config.get("MAX_PAGE_SIZE", 500)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page_queryset = self.get_page_queryset(queryset, request, view)
+        if page_queryset is None:
+            return None
+        return self.set_page(list(page_queryset))
+
+    def get_page_queryset(self, queryset, request, view=None):
+        """Return the unevaluated ``LIMIT page_size + 1`` query, or ``None``."""
+        params = request.query_params
+        if (
+            self.cursor_query_param not in params
+            and self.page_size_query_param not in params
+        ):
+            return None
+        if params.get(self.ordering_query_param):
+            raise ValidationError({self.ordering_query_param: [self.ordering_message]})
+
+        self.request = request
+        self.page_size = self.get_page_size(request, view)
+        created_at, pk, self.reverse = self.decode_cursor(request)
+        self.has_cursor = created_at is not None
+
+        if self.reverse:
+            queryset = queryset.order_by("created_at", "id")
+            if created_at is not None:
+                queryset = queryset.filter(
+                    Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk)
+                )
+        else:
+            queryset = queryset.order_by("-created_at", "-id")
+            if created_at is not None:
+                queryset = queryset.filter(
+                    Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+                )
+        return queryset[: self.page_size + 1]
+
+    def set_page(self, results):
+        """Trim the rows fetched by ``get_page_queryset`` into the current page."""
+        has_more = len(results) > self.page_size
+        self.page = results[: self.page_size]
+
+        if self.reverse:
+            self.page.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = self.has_cursor
+        return self.page
+
+    def get_page_size(self, request, view):
+        max_page_size = min(
+            getattr(view, "max_page_size", self.max_page_size), self.max_page_size
+        )
+        page_size = getattr(view, "page_size", self.page_size)
+        raw = request.query_params.get(self.page_size_query_param)
+        if raw:
+            try:
+                page_size = int(raw)
+            except ValueError:
+                pass
+        return max(1, min(page_size, max_page_size))
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, None, False
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            created_at = datetime.fromisoformat(payload["t"])
+            pk = int(payload["i"])
+            reverse = bool(payload.get("r", False))
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        return created_at, pk, reverse
+
+    def encode_cursor(self, instance, reverse):
+        payload = {"t": instance.created_at.isoformat(), "i": instance.pk}
+        if reverse:
+            payload["r"] = 1
+        raw = json.dumps(payload, separators=(",", ":")).encode("ascii")
+        encoded = base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.page_size_query_param, self.page_size)
+        return replace_query_param(url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            url = self.request.build_absolute_uri()
+            return remove_query_param(url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_data(self, data):
+        return {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "The pagination cursor value.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Number of results to return per page.",
+                "schema": {"type": "integer"},
+            },
+        ]
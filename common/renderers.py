@@ -0,0 +1,92 @@
+"""
+JSON renderer and parser backed by ``orjson`` when it is installed.
+
+``orjson`` encodes ``date``/``datetime``/``time``/``UUID`` itself and hands
+everything else (``Decimal``, lazy strings, querysets, ...) to DRF's
+``JSONEncoder``, so the bytes are the same as ``JSONRenderer`` produces for
+compact output. Without ``orjson``, or when indentation is requested (the
+browsable API), both classes are plain DRF.
+"""
+
+import time
+from itertools import islice
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from common.middleware import record_render
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Like ``JSONRenderer``: these are valid JSON but not valid JavaScript.
+LINE_SEPARATORS = ((b"\xe2\x80\xa8", b"\\u2028"), (b"\xe2\x80\xa9", b"\\u2029"))
+
+
+def dumps(data):
+    """Compact UTF-8 JSON of ``data``, as ``JSONRenderer`` would render it."""
+    if orjson is None:
+        return JSONRenderer().render(data)
+    content = orjson.dumps(
+        data,
+        default=JSONEncoder().default,
+        option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+    )
+    for character, escaped in LINE_SEPARATORS:
+        if character in content:
+            content = content.replace(character, escaped)
+    return content
+
+
+class FastJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        renderer_context = renderer_context or {}
+        start = time.perf_counter()
+        if (
+            orjson is None
+            or data is None
+            or self.get_indent(accepted_media_type, renderer_context)
+        ):
+            content = super().render(data, accepted_media_type, renderer_context)
+        else:
+            content = dumps(data)
+        record_render(renderer_context.get("request"), time.perf_counter() - start)
+        return content
+
+
+class FastJSONParser(JSONParser):
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get("encoding", "utf-8")
+        if orjson is None or encoding.lower().replace("-", "") != "utf8":
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except ValueError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def stream_json_array(chunks, renderer=None, renderer_context=None):
+    """
+    Yield a JSON array of the rows in ``chunks`` (an iterable of lists of
+    rows), one pre-encoded fragment per chunk, so only one chunk of rows and
+    its bytes are held in memory at a time.
+    """
+    renderer = renderer or FastJSONRenderer()
+    separator = b"["
+    for chunk in chunks:
+        if not chunk:
+            continue
+        content = renderer.render(chunk, renderer.media_type, renderer_context)
+        yield separator + content.strip()[1:-1]
+        separator = b","
+    yield b"[]" if separator == b"[" else b"]"
@@ -0,0 +1,214 @@
+"""
+Read-through cache of rendered ``list``/``retrieve`` responses.
+
+Every model a view reads has a generation counter in the Django cache and the
+current generations are part of each response's key, so bumping a counter on
+write makes all pages built from the old data unreachable at once; they then
+simply expire. Counters start from a timestamp rather than zero so an evicted
+counter can never come back to a value an old page was stored under.
+
+A write only bumps the counters in the cache its own process sees, so the
+cache is on by default only when ``ALIAS`` names a backend shared by every
+process; with the per-process ``LocMemCache`` other workers would keep
+serving stale pages. ``ENABLED`` forces it either way.
+"""
+
+import hashlib
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.core import checks
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
+
+INVALIDATING_MODELS = (
+    "company.Company",
+    "company.Department",
+    "company.Project",
+    "company.PerformanceReview",
+    "user.Employee",
+)
+CACHED_ACTIONS = ("list", "retrieve")
+
+
+def get_config():
+    config = {"ENABLED": None, "ALIAS": "default", "TIMEOUT": 300}
+    config.update(getattr(settings, "RESPONSE_CACHE", {}))
+    return config
+
+
+def is_enabled():
+    enabled = get_config()["ENABLED"]
+    return is_shared() if enabled is None else enabled
+
+
+def get_cache():
+    return caches[get_config()["ALIAS"]]
+
+
+def is_shared():
+    """Whether every process sees the same generations in the cache."""
+    return not isinstance(get_cache(), (LocMemCache, DummyCache))
+
+
+def generation_key(model):
+    return f"response-cache:generation:{model._meta.label_lower}"
+
+
+def get_generations(models):
+    cache = get_cache()
+    keys = [generation_key(model) for model in models]
+    found = cache.get_many(keys)
+    for key in keys:
+        if key not in found:
+            cache.add(key, time.time_ns(), timeout=None)
+            found[key] = cache.get(key)
+    return [found[key] for key in keys]
+
+
+def _bump(models):
+    cache = get_cache()
+    for model in models:
+        key = generation_key(model)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), timeout=None)
+
+
+def bump(*models):
+    """
+    Invalidate every cached response that read ``models``.
+
+    The counters are bumped immediately, so the writing request never sees
+    its own stale pages, and again on commit, so a page built by a concurrent
+    request from the pre-commit data is not served afterwards.
+    """
+    _bump(models)
+    transaction.on_commit(lambda: _bump(models))
+
+
+def invalidating_models():
+    return [apps.get_model(label) for label in INVALIDATING_MODELS]
+
+
+def etag_for(content):
+    return f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(request, etag):
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    tags = parse_etags(header)
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+
+class CachedResponseMixin:
+    """
+    Serves ``list``/``retrieve`` of a ModelViewSet from the response cache.
+
+    The key covers the view, action, ``pk``, query string, negotiated media
+    type, host and the caller's role, plus the generations of
+    ``cache_dependencies``, which must list every model the response reads.
+    Roles in ``cache_per_user_roles`` also vary on the user, for views whose
+    queryset depends on who is asking. Cached and fresh responses carry an
+    ``ETag`` and answer a matching ``If-None-Match`` with 304.
+    """
+
+    cache_dependencies = ()
+    cache_per_user_roles = ()
+
+    def list(self, request, *args, **kwargs):
+        cached = self.cached_response(request)
+        if cached is not None:
+            return cached
+        return super().list(request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        cached = self.cached_response(request)
+        if cached is not None:
+            return cached
+        return super().retrieve(request, *args, **kwargs)
+
+    def get_response_cache_key(self, request):
+        user = request.user
+        role = getattr(user, "role", None)
+        parts = [
+            f"{type(self).__module__}.{type(self).__qualname__}",
+            self.action,
+            str(self.kwargs.get(self.lookup_url_kwarg or self.lookup_field, "")),
+            repr(sorted(request.query_params.lists())),
+            request.accepted_media_type,
+            request.get_host(),
+            str(role),
+            str(user.pk) if role in self.cache_per_user_roles else "",
+            repr(get_generations(self.cache_dependencies)),
+        ]
+        digest = hashlib.blake2b("\n".join(parts).encode(), digest_size=20)
+        return f"response-cache:{digest.hexdigest()}"
+
+    def cached_response(self, request):
+        self.response_cache_key = None
+        if self.action not in CACHED_ACTIONS or not is_enabled():
+            return None
+        key = self.get_response_cache_key(request)
+        entry = get_cache().get(key)
+        if entry is None:
+            self.response_cache_key = key
+            return None
+        headers, content_type, content = entry
+        if etag_matches(request, headers["ETag"]):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(content, content_type=content_type)
+        for name, value in headers.items():
+            response[name] = value
+        return response
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        key = getattr(self, "response_cache_key", None)
+        # Streamed lists are too big to cache whole.
+        if key is None or response.status_code != 200 or response.streaming:
+            return response
+
+        response.render()
+        # Keep an ETag set further down, e.g. by ConditionalGetMixin, so hits
+        # and misses validate against the same tag.
+        etag = response.get("ETag") or etag_for(response.content)
+        headers = {"ETag": etag}
+        if response.has_header("Last-Modified"):
+            headers["Last-Modified"] = response["Last-Modified"]
+        get_cache().set(
+            key,
+            (headers, response["Content-Type"], response.content),
+            get_config()["TIMEOUT"],
+        )
+        if etag_matches(request, etag):
+            response = HttpResponseNotModified()
+        for name, value in headers.items():
+            response[name] = value
+        return response
+
+
+@checks.register(checks.Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    if get_config()["ENABLED"] and not is_shared():
+        return [
+            checks.Warning(
+                "The response cache is enabled on a per-process cache.",
+                hint=(
+                    "Writes only invalidate the pages of the process that made "
+                    "them; point RESPONSE_CACHE['ALIAS'] at a shared backend "
+                    "when running several processes."
+                ),
+                id="common.W001",
+            )
+        ]
+    return []
@@ -0,0 +1,241 @@
+"""
+Full-text index of employees and projects.
+
+Documents live in one shadow table, ``search_index``: an FTS5 virtual table on
+SQLite, or a ``tsvector`` column with a GIN index on PostgreSQL. Each row has a
+``title`` (names, weighted higher) and a ``body``. The table is kept in sync
+by the signals in ``common.signals`` and by the bulk write paths, which call
+``index()`` themselves; ``rebuild_search_index`` refills it from scratch.
+"""
+
+import re
+
+from django.apps import apps
+from django.db import connection
+
+# model label -> (kind, title fields, body fields)
+DOCUMENTS = {
+    "user.Employee": (
+        "employee",
+        ("first_name", "middle_name", "last_name"),
+        ("email", "position"),
+    ),
+    "company.Project": ("project", ("name",), ("description",)),
+}
+KINDS = [kind for kind, _, _ in DOCUMENTS.values()]
+BODY_PREVIEW = 200
+MAX_TERMS = 8
+
+
+def get_document(model):
+    return DOCUMENTS.get(model._meta.label)
+
+
+def terms(query):
+    return re.findall(r"\w+", query.lower())[:MAX_TERMS]
+
+
+def company_filter(id_column, kinds, company_id):
+    """
+    SQL restricting ``kinds`` to the documents of one company, as the scoped
+    employee and project lists do; empty when ``company_id`` is ``None``.
+    """
+    if company_id is None:
+        return "", []
+    clauses, params = [], []
+    for label, (kind, _, _) in DOCUMENTS.items():
+        if kind not in kinds:
+            continue
+        meta = apps.get_model(label)._meta
+        clauses.append(
+            f"(kind = %s AND {id_column} IN (SELECT "
+            f"{connection.ops.quote_name(meta.pk.column)} FROM "
+            f"{connection.ops.quote_name(meta.db_table)} WHERE company_id = %s))"
+        )
+        params += [kind, company_id]
+    return f" AND ({' OR '.join(clauses)})", params
+
+
+class SQLiteSearch:
+    # The kind is folded into the rowid so upserts and deletes are rowid
+    # lookups instead of scans of the UNINDEXED kind column.
+
+    def create(self, cursor):
+        cursor.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5("
+            "kind UNINDEXED, title, body, "
+            "tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+        )
+        # Sorting on the configured rank column lets FTS5 rank internally,
+        # which is about twice as fast as ORDER BY bm25(...) on broad terms.
+        cursor.execute(
+            "INSERT INTO search_index(search_index, rank) "
+            "VALUES ('rank', 'bm25(0, 4.0, 1.0)')"
+        )
+
+    def drop(self, cursor):
+        cursor.execute("DROP TABLE IF EXISTS search_index")
+
+    def clear(self, cursor):
+        cursor.execute("DELETE FROM search_index")
+
+    def rowid(self, kind, pk):
+        return pk * len(KINDS) + KINDS.index(kind)
+
+    def upsert(self, cursor, kind, rows):
+        cursor.executemany(
+            "INSERT OR REPLACE INTO search_index(rowid, kind, title, body) "
+            "VALUES (%s, %s, %s, %s)",
+            [(self.rowid(kind, pk), kind, title, body) for pk, title, body in rows],
+        )
+
+    def delete(self, cursor, kind, pks):
+        cursor.executemany(
+            "DELETE FROM search_index WHERE rowid = %s",
+            [(self.rowid(kind, pk),) for pk in pks],
+        )
+
+    def search(self, cursor, words, kinds, limit, company_id=None):
+        match = " ".join(f'"{word}"*' for word in words)
+        placeholders = ", ".join(["%s"] * len(kinds))
+        scope, scope_params = company_filter(f"rowid / {len(KINDS)}", kinds, company_id)
+        cursor.execute(
+            f"SELECT kind, rowid / {len(KINDS)}, title, substr(body, 1, %s), rank "
+            "FROM search_index WHERE search_index MATCH %s "
+            f"AND kind IN ({placeholders}){scope} ORDER BY rank LIMIT %s",
+            [BODY_PREVIEW, match, *kinds, *scope_params, limit],
+        )
+        return [
+            (kind, pk, title, body, -rank)
+            for kind, pk, title, body, rank in cursor.fetchall()
+        ]
+
+
+class PostgresSearch:
+    def create(self, cursor):
+        cursor.execute(
+            "CREATE TABLE IF NOT EXISTS search_index ("
+            "kind varchar(16) NOT NULL, "
+            "object_id bigint NOT NULL, "
+            "title text NOT NULL, "
+            "body text NOT NULL, "
+            "document tsvector GENERATED ALWAYS AS ("
+            "setweight(to_tsvector('simple', title), 'A') || "
+            "setweight(to_tsvector('simple', body), 'B')) STORED, "
+            "PRIMARY KEY (kind, object_id))"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS search_index_document_idx "
+            "ON search_index USING GIN (document)"
+        )
+
+    def drop(self, cursor):
+        cursor.execute("DROP TABLE IF EXISTS search_index")
+
+    def clear(self, cursor):
+        cursor.execute("DELETE FROM search_index")
+
+    def upsert(self, cursor, kind, rows):
+        cursor.executemany(
+            "INSERT INTO search_index (kind, object_id, title, body) "
+            "VALUES (%s, %s, %s, %s) ON CONFLICT (kind, object_id) "
+            "DO UPDATE SET title = EXCLUDED.title, body = EXCLUDED.body",
+            [(kind, pk, title, body) for pk, title, body in rows],
+        )
+
+    def delete(self, cursor, kind, pks):
+        cursor.execute(
+            "DELETE FROM search_index WHERE kind = %s AND object_id = ANY(%s)",
+            [kind, list(pks)],
+        )
+
+    def search(self, cursor, words, kinds, limit, company_id=None):
+        query = " & ".join(f"{word}:*" for word in words)
+        scope, scope_params = company_filter("object_id", kinds, company_id)
+        cursor.execute(
+            "SELECT kind, object_id, title, left(body, %s), "
+            "ts_rank(document, query) AS rank "
+            "FROM search_index, to_tsquery('simple', %s) query "
+            f"WHERE document @@ query AND kind = ANY(%s){scope} "
+            "ORDER BY rank DESC LIMIT %s",
+            [BODY_PREVIEW, query, list(kinds), *scope_params, limit],
+        )
+        return cursor.fetchall()
+
+
+BACKENDS = {"sqlite": SQLiteSearch, "postgresql": PostgresSearch}
+
+
+def get_backend(using=connection):
+    backend = BACKENDS.get(using.vendor)
+    return backend() if backend else None
+
+
+def build_rows(model, objs):
+    _, title_fields, body_fields = get_document(model)
+    for obj in objs:
+        title = " ".join(filter(None, (getattr(obj, f) for f in title_fields)))
+        body = " ".join(filter(None, (getattr(obj, f) for f in body_fields)))
+        yield obj.pk, title, body
+
+
+def index(objs):
+    """Add or refresh the documents of saved ``objs`` (all of one model)."""
+    objs = list(objs)
+    backend = get_backend()
+    if not objs or backend is None:
+        return
+    model = type(objs[0])
+    if get_document(model) is None:
+        return
+    with connection.cursor() as cursor:
+        backend.upsert(cursor, get_document(model)[0], build_rows(model, objs))
+
+
+def remove(model, pks):
+    backend = get_backend()
+    if backend is None or get_document(model) is None:
+        return
+    with connection.cursor() as cursor:
+        backend.delete(cursor, get_document(model)[0], pks)
+
+
+def search(query, kinds=None, limit=20, company_id=None):
+    """
+    Return ``[(kind, id, title, body preview, score)]`` best match first,
+    only from ``company_id`` when it is given.
+    """
+    words = terms(query)
+    backend = get_backend()
+    if not words or backend is None:
+        return []
+    with connection.cursor() as cursor:
+        return backend.search(cursor, words, kinds or KINDS, limit, company_id)
+
+
+def rebuild(batch_size=2000, registry=apps):
+    """Recreate the index; migrations pass their historical app registry."""
+    backend = get_backend()
+    if backend is None:
+        return {}
+    counts = {}
+    with connection.cursor() as cursor:
+        # Emptied rather than dropped: rolling back a DROP of the FTS5 table
+        # to a savepoint (a failed migration, a test) corrupts the index.
+        backend.create(cursor)
+        backend.clear(cursor)
+        for label, (kind, title_fields, body_fields) in DOCUMENTS.items():
+            model = registry.get_model(label)
+            batch, counts[kind] = [], 0
+            fields = ("pk", *title_fields, *body_fields)
+            for values in model.objects.values_list(*fields).iterator(batch_size):
+                title = " ".join(filter(None, values[1 : 1 + len(title_fields)]))
+                body = " ".join(filter(None, values[1 + len(title_fields) :]))
+                batch.append((values[0], title, body))
+                if len(batch) >= batch_size:
+                    backend.upsert(cursor, kind, batch)
+                    counts[kind] += len(batch)
+                    batch = []
+            backend.upsert(cursor, kind, batch)
+            counts[kind] += len(batch)
+    return counts
@@ -0,0 +1,33 @@
+from rest_framework import serializers
+from rest_framework.serializers import raise_errors_on_nested_writes
+from rest_framework.utils import model_meta
+
+
+class UpdateFieldsModelSerializer(serializers.ModelSerializer):
+    """
+    ``ModelSerializer`` whose ``update`` writes only the submitted columns,
+    plus ``auto_now`` ones, with ``save(update_fields=...)``. Two requests
+    changing different fields of the same row no longer overwrite each other.
+    """
+
+    def update(self, instance, validated_data):
+        raise_errors_on_nested_writes("update", self, validated_data)
+        info = model_meta.get_field_info(instance)
+
+        fields = {
+            field.name
+            for field in instance._meta.concrete_fields
+            if getattr(field, "auto_now", False)
+        }
+        many_to_many = {}
+        for attr, value in validated_data.items():
+            if attr in info.relations and info.relations[attr].to_many:
+                many_to_many[attr] = value
+            else:
+                setattr(instance, attr, value)
+                fields.add(attr)
+        instance.save(update_fields=fields)
+
+        for attr, value in many_to_many.items():
+            getattr(instance, attr).set(value)
+        return instance
@@ -0,0 +1,32 @@
+from django.apps import apps
+from django.db.models.signals import post_delete, post_save
+
+from common import response_cache, search
+
+
+def index_on_save(sender, instance, update_fields=None, **kwargs):
+    _, title_fields, body_fields = search.get_document(sender)
+    if update_fields is not None and not set(update_fields) & {
+        *title_fields,
+        *body_fields,
+    }:
+        return
+    search.index([instance])
+
+
+def remove_on_delete(sender, instance, **kwargs):
+    search.remove(sender, [instance.pk])
+
+
+def invalidate_responses(sender, **kwargs):
+    response_cache.bump(sender)
+
+
+def connect():
+    for label in search.DOCUMENTS:
+        model = apps.get_model(label)
+        post_save.connect(index_on_save, sender=model)
+        post_delete.connect(remove_on_delete, sender=model)
+    for model in response_cache.invalidating_models():
+        post_save.connect(invalidate_responses, sender=model)
+        post_delete.connect(invalidate_responses, sender=model)
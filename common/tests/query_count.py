@@ -0,0 +1,37 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+
+
+class QueryCountMixin:
+    """
+    Asserts that an endpoint's query count does not grow with the number of
+    rows it returns, i.e. that it has no N+1. The response cache is disabled
+    so every request reaches the database.
+    """
+
+    row_counts = (1, 10, 100)
+
+    def assertConstantQueries(self, url, create_rows):
+        """
+        ``create_rows(n)`` must add ``n`` rows visible at ``url``; the endpoint
+        is requested after growing the table to each of ``row_counts``.
+        """
+        counts, sizes = {}, []
+        existing = 0
+        for total in self.row_counts:
+            create_rows(total - existing)
+            existing = total
+            with override_settings(RESPONSE_CACHE={"ENABLED": False}):
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            counts[total] = len(queries)
+            sizes.append(len(response.data))
+        self.assertEqual(
+            sizes, sorted(set(sizes)), f"{url} did not return the new rows: {sizes}"
+        )
+        self.assertEqual(
+            len(set(counts.values())),
+            1,
+            f"query count of {url} grows with the number of rows: {counts}",
+        )
@@ -0,0 +1,104 @@
+from django.contrib.auth.hashers import make_password
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from company.models import Company, Department, PerformanceReview, Project
+from user.authentication import user_snapshots
+from user.models import Employee, User
+
+
+class AsyncReadViewTestCase(TestCase):
+    def setUp(self):
+        user_snapshots.clear()
+        self.admin = User.objects.create(
+            email="test@admin.com",
+            username="test admin",
+            password=make_password(None),
+            role="admin",
+        )
+        self.company = Company.objects.create(name="Test Company")
+        self.department = Department.objects.create(
+            name="Test Department", company=self.company
+        )
+        Project.objects.create(
+            name="Project", company=self.company, department=self.department
+        )
+        self.employee = Employee.objects.create(
+            first_name="test",
+            last_name="Employee",
+            email="test@Employee.com",
+            user=self.admin,
+            company=self.company,
+            department=self.department,
+            hired_on="2024-01-01",
+        )
+        PerformanceReview.objects.create(employee=self.employee, feedback="OK")
+        self.auth = self.header_for(self.admin)
+
+    def header_for(self, user):
+        token = RefreshToken.for_user(user).access_token
+        return {"HTTP_AUTHORIZATION": f"Bearer {token}"}
+
+    def test_list_matches_sync_view(self):
+        for basename in (
+            "company",
+            "department",
+            "project",
+            "employee",
+            "performance-review",
+        ):
+            with self.subTest(basename=basename):
+                sync = self.client.get(reverse(f"{basename}-list"), **self.auth)
+                response = self.client.get(
+                    reverse(f"async-{basename}-list"), **self.auth
+                )
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.content, sync.content)
+
+    def test_filters_and_fields_match_sync_view(self):
+        query = {"company": self.company.id, "fields": "first_name,department"}
+        sync = self.client.get(reverse("employee-list"), query, **self.auth)
+        response = self.client.get(reverse("async-employee-list"), query, **self.auth)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, sync.content)
+        self.assertEqual(
+            response.json(),
+            [{"first_name": "test", "department": "Test Department"}],
+        )
+
+    def test_retrieve_matches_sync_view(self):
+        sync = self.client.get(
+            reverse("employee-detail", args=[self.employee.id]), **self.auth
+        )
+        response = self.client.get(
+            reverse("async-employee-detail", args=[self.employee.id]), **self.auth
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, sync.content)
+
+    def test_retrieve_missing(self):
+        response = self.client.get(
+            reverse("async-company-detail", args=[999999]), **self.auth
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_paginated_list(self):
+        response = self.client.get(
+            reverse("async-company-list"), {"page_size": 1}, **self.auth
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["results"]), 1)
+
+    def test_unauthenticated(self):
+        response = self.client.get(reverse("async-company-list"))
+        self.assertEqual(response.status_code, 401)
+
+    def test_permission_denied(self):
+        user = User.objects.create(
+            email="test@user.com", username="test user", password=make_password(None)
+        )
+        response = self.client.get(
+            reverse("async-employee-list"), **self.header_for(user)
+        )
+        self.assertEqual(response.status_code, 403)
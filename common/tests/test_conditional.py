@@ -0,0 +1,147 @@
+from datetime import date, timedelta
+from unittest import mock
+
+from django.core.cache import caches
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from common.tests.base_test import BaseTest
+from company.models import Company, Department, PerformanceReview, Project
+from user.models import Employee, User
+
+
+@override_settings(RESPONSE_CACHE={"ENABLED": False})
+class ConditionalGetTestCase(BaseTest):
+    def setUp(self):
+        super().setUp()
+        self.company = Company.objects.create(name="Test Company")
+        self.department = Department.objects.create(
+            name="Test Department", company=self.company
+        )
+        self.project = Project.objects.create(
+            name="Project", company=self.company, department=self.department
+        )
+        # Projects are scoped to the caller's company.
+        Employee.objects.create(
+            company=self.company,
+            department=self.department,
+            user=self.user,
+            first_name="test",
+            last_name="employee",
+            email="test@employee.com",
+            hired_on=date(2020, 1, 1),
+        )
+        self.project_url = reverse("project-list")
+        self.detail_url = reverse("project-detail", args=[self.project.id])
+
+    def test_list_headers_and_304_without_serializing(self):
+        response = self.client.get(self.project_url)
+        etag = response["ETag"]
+        self.assertTrue(etag.startswith('W/"'))
+        self.assertIn("Last-Modified", response)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.project_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+    @mock.patch("common.response_cache.is_shared", return_value=True)
+    def test_shared_generations_validate_lists_without_querying(self, shared):
+        response = self.client.get(self.project_url)
+        etag = response["ETag"]
+        self.assertNotIn("Last-Modified", response)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.project_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        # Writes to models the list does not read leave it valid.
+        PerformanceReview.objects.create(employee=Employee.objects.get(user=self.user))
+        response = self.client.get(self.project_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_list_etag_follows_the_callers_scope(self):
+        other = Company.objects.create(name="Other Company")
+        department = Department.objects.create(name="Other", company=other)
+        Project.objects.create(name="Other", company=other, department=department)
+        for shared in (False, True):
+            with self.subTest(shared=shared), mock.patch(
+                "common.response_cache.is_shared", return_value=shared
+            ):
+                employee = Employee.objects.get(user=self.user)
+                etag = self.client.get(self.project_url)["ETag"]
+                company = other if employee.company == self.company else self.company
+                employee.company = company
+                employee.department = company.departments.first()
+                employee.save()
+                # A fresh user per request, as the authentication would give.
+                self.client.force_authenticate(user=User.objects.get(pk=self.user.pk))
+                response = self.client.get(self.project_url, HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(
+                    sorted(project["name"] for project in response.json()),
+                    sorted(company.company_projects.values_list("name", flat=True)),
+                )
+
+    def test_list_etag_follows_rows_relations_and_deletes(self):
+        etags = [self.client.get(self.project_url)["ETag"]]
+        self.company.name = "Renamed"
+        self.company.save()
+        etags.append(self.client.get(self.project_url)["ETag"])
+        other = Project.objects.create(
+            name="Other", company=self.company, department=self.department
+        )
+        etags.append(self.client.get(self.project_url)["ETag"])
+        other.delete()
+        etags.append(self.client.get(self.project_url)["ETag"])
+        self.assertEqual(len(set(etags)), 4)
+
+    def test_list_etag_depends_on_query(self):
+        plain = self.client.get(self.project_url)["ETag"]
+        filtered = self.client.get(self.project_url, {"is_active": "true"})["ETag"]
+        self.assertNotEqual(plain, filtered)
+
+    def test_detail_if_modified_since(self):
+        response = self.client.get(self.detail_url)
+        last_modified = response["Last-Modified"]
+        response = self.client.get(
+            self.detail_url, HTTP_IF_MODIFIED_SINCE=last_modified
+        )
+        self.assertEqual(response.status_code, 304)
+
+        Project.objects.filter(pk=self.project.pk).update(
+            updated_at=timezone.now() + timedelta(seconds=5)
+        )
+        response = self.client.get(
+            self.detail_url, HTTP_IF_MODIFIED_SINCE=last_modified
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_missing_detail_is_404(self):
+        response = self.client.get(reverse("project-detail", args=[999]))
+        self.assertEqual(response.status_code, 404)
+
+    def test_employee_etag_changes_daily(self):
+        self.user.role = "admin"
+        url = reverse("employee-list")
+        etag = self.client.get(url)["ETag"]
+        tomorrow = timezone.localdate() + timedelta(days=1)
+        with mock.patch("django.utils.timezone.localdate", return_value=tomorrow):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+
+@override_settings(RESPONSE_CACHE={"ENABLED": True})
+class ConditionalCachedTestCase(BaseTest):
+    def setUp(self):
+        super().setUp()
+        caches["default"].clear()
+        Company.objects.create(name="Test Company")
+
+    def test_cache_hits_keep_the_conditional_etag(self):
+        url = reverse("company-list")
+        etag = self.client.get(url)["ETag"]
+        with self.assertNumQueries(0):
+            hit = self.client.get(url)
+            not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(hit["ETag"], etag)
+        self.assertEqual(not_modified.status_code, 304)
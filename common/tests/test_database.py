@@ -0,0 +1,132 @@
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections
+from django.db.utils import load_backend
+
+from common.tests.base_test import BaseTest
+from company_sys import database
+from company_sys.database import database_settings
+
+BASE_DIR = Path("/srv/app")
+
+
+class DatabaseSettingsTestCase(BaseTest):
+    def test_sqlite_default(self):
+        self.assertEqual(
+            database_settings({}, BASE_DIR),
+            {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": BASE_DIR / "db.sqlite3",
+                "CONN_MAX_AGE": 60,
+                "CONN_HEALTH_CHECKS": True,
+                "OPTIONS": {
+                    "init_command": (
+                        "PRAGMA journal_mode=WAL;PRAGMA synchronous=NORMAL;"
+                        "PRAGMA busy_timeout=10000;PRAGMA mmap_size=134217728;"
+                        "PRAGMA cache_size=-65536"
+                    ),
+                    "transaction_mode": "IMMEDIATE",
+                },
+            },
+        )
+
+    def test_postgresql_persistent(self):
+        config = database_settings(
+            {
+                "DB_ENGINE": "postgresql",
+                "DB_NAME": "company",
+                "DB_HOST": "db",
+                "DB_CONN_MAX_AGE": "300",
+                "DB_CONN_HEALTH_CHECKS": "0",
+                "DB_STATEMENT_TIMEOUT": "5000",
+            },
+            BASE_DIR,
+        )
+        self.assertEqual(config["ENGINE"], "django.db.backends.postgresql")
+        self.assertEqual((config["NAME"], config["HOST"]), ("company", "db"))
+        self.assertEqual(config["CONN_MAX_AGE"], 300)
+        self.assertFalse(config["CONN_HEALTH_CHECKS"])
+        self.assertEqual(config["OPTIONS"], {"options": "-c statement_timeout=5000"})
+
+    def test_pool_replaces_persistent_connections(self):
+        environ = {"DB_ENGINE": "postgresql", "DB_POOL": "1", "DB_POOL_MAX_SIZE": "4"}
+        with mock.patch.object(database, "find_spec", return_value=object()):
+            config = database_settings(environ, BASE_DIR)
+        self.assertEqual(config["CONN_MAX_AGE"], 0)
+        self.assertEqual(
+            config["OPTIONS"]["pool"], {"min_size": 2, "max_size": 4, "timeout": 10}
+        )
+        with mock.patch.object(database, "find_spec", return_value=None):
+            config = database_settings(environ, BASE_DIR)
+        self.assertNotIn("pool", config["OPTIONS"])
+        self.assertEqual(config["CONN_MAX_AGE"], 60)
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ImproperlyConfigured):
+            database_settings({"DB_ENGINE": "oracle"}, BASE_DIR)
+
+
+class SQLiteWritersTestCase(BaseTest):
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        # A file database of its own: the in-memory test database has no WAL
+        # and reports table locks instead of waiting for them.
+        self.database = connections.settings["default"] | database_settings(
+            {}, Path(directory.name)
+        )
+        connection = self.connect()
+        with connection.cursor() as cursor:
+            cursor.execute("CREATE TABLE counter (value INTEGER)")
+            cursor.execute("INSERT INTO counter VALUES (0)")
+        connection.close()
+
+    def connect(self):
+        backend = load_backend(self.database["ENGINE"])
+        return backend.DatabaseWrapper(self.database, "sqlite_writers")
+
+    def query(self, sql):
+        connection = self.connect()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(sql)
+                return cursor.fetchone()[0]
+        finally:
+            connection.close()
+
+    def test_pragmas(self):
+        self.assertEqual(self.query("PRAGMA journal_mode"), "wal")
+        self.assertEqual(self.query("PRAGMA synchronous"), 1)
+        self.assertEqual(self.query("PRAGMA busy_timeout"), 10000)
+
+    def test_concurrent_read_then_write_transactions(self):
+        threads, increments = 32, 10
+
+        def write(_):
+            connection = self.connect()
+            try:
+                for _ in range(increments):
+                    # Read, then write in one transaction: after a deferred
+                    # BEGIN two readers cannot both upgrade to the write lock
+                    # and SQLite fails one at once with "database is locked".
+                    # BEGIN as transaction.atomic() does on SQLite.
+                    connection.set_autocommit(
+                        False, force_begin_transaction_with_broken_autocommit=True
+                    )
+                    with connection.cursor() as cursor:
+                        cursor.execute("SELECT value FROM counter")
+                        value = cursor.fetchone()[0]
+                        cursor.execute("UPDATE counter SET value = %s", [value + 1])
+                    connection.commit()
+                    connection.set_autocommit(True)
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(threads) as pool:
+            list(pool.map(write, range(threads)))
+        self.assertEqual(self.query("SELECT value FROM counter"), threads * increments)
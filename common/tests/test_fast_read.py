@@ -0,0 +1,91 @@
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import serializers
+
+from common import fast_read
+from common.tests.test_filters import OrgTestCase
+from company.models import PerformanceReview, Project
+from company.serializers import ReadProjectSerializer
+
+
+@override_settings(RESPONSE_CACHE={"ENABLED": False})
+class FastReadTestCase(OrgTestCase):
+    def setUp(self):
+        super().setUp()
+        self.manager.role = "admin"
+        PerformanceReview.objects.create(employee=self.employee, feedback="OK")
+        PerformanceReview.objects.create(
+            employee=self.employee,
+            stage="review_scheduled",
+            scheduled_date="2025-09-01T10:00:00Z",
+        )
+
+    def assertSameOutput(self, url, params=None):
+        with override_settings(FAST_READ_SERIALIZERS=False):
+            expected = self.client.get(url, params)
+        with override_settings(FAST_READ_SERIALIZERS=True):
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, expected.status_code)
+        self.assertEqual(response.content, expected.content)
+        return response
+
+    def test_lists_are_byte_identical(self):
+        for basename in (
+            "company",
+            "department",
+            "project",
+            "employee",
+            "performance-review",
+        ):
+            with self.subTest(basename=basename):
+                response = self.assertSameOutput(reverse(f"{basename}-list"))
+                self.assertTrue(response.json())
+
+    def test_params_are_byte_identical(self):
+        cases = [
+            ("project-list", {"is_active": "true", "ordering": "-start_date"}),
+            ("project-list", {"fields": "name,department"}),
+            ("employee-list", {"fields": "days_employed,company"}),
+            ("company-list", {"exact_counts": "1"}),
+            ("performance-review-list", {"page_size": 1}),
+        ]
+        for name, params in cases:
+            with self.subTest(name=name, params=params):
+                self.assertSameOutput(reverse(name), params)
+
+    @override_settings(TIME_ZONE="Africa/Cairo")
+    def test_datetimes_follow_current_timezone(self):
+        response = self.assertSameOutput(reverse("performance-review-list"))
+        self.assertFalse(response.json()[0]["created_at"].endswith("Z"))
+
+    def test_cursor_pages_are_byte_identical(self):
+        url = reverse("project-list")
+        with override_settings(FAST_READ_SERIALIZERS=True):
+            first = self.client.get(url, {"page_size": 2}).json()
+        self.assertEqual(len(first["results"]), 2)
+        self.assertSameOutput(first["next"])
+
+    def test_join_replaces_per_row_attribute_access(self):
+        with override_settings(FAST_READ_SERIALIZERS=True):
+            # The conditional GET state query and one joined SELECT.
+            with self.assertNumQueries(2):
+                response = self.client.get(reverse("project-list"))
+        self.assertEqual(response.json()[0]["company"], "Test Company")
+
+    def test_null_relation_renders_null(self):
+        Project.objects.create(company=self.company, name="Orphan")
+        with override_settings(FAST_READ_SERIALIZERS=True):
+            response = self.client.get(reverse("project-list"), {"name": "Orphan"})
+        self.assertIsNone(response.json()[0]["department"])
+
+    def test_unsupported_serializer_is_not_compiled(self):
+        class NestedSerializer(serializers.Serializer):
+            name = serializers.CharField()
+            summary = serializers.SerializerMethodField()
+
+        self.assertIsNone(
+            fast_read.compile_serializer(NestedSerializer(), Project.objects.all())
+        )
+        self.assertIsNotNone(
+            fast_read.compile_serializer(ReadProjectSerializer(), Project.objects.all())
+        )
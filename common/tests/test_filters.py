@@ -0,0 +1,168 @@
+from datetime import date
+
+from django.contrib.auth.hashers import make_password
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from common.tests.base_test import BaseTest
+from company.models import Company, Department, PerformanceReview, Project
+from user.models import Employee, User
+
+
+class OrgTestCase(BaseTest):
+    def setUp(self):
+        super().setUp()
+        self.manager = User.objects.create(
+            email="test@manager.com",
+            username="test manager",
+            password=make_password(None),
+            role="manager",
+        )
+        self.client.force_authenticate(user=self.manager)
+        self.company = Company.objects.create(name="Test Company")
+        self.other_company = Company.objects.create(name="Other Company")
+        self.department = Department.objects.create(
+            name="Test Department", company=self.company
+        )
+        self.other_department = Department.objects.create(
+            name="Other Department", company=self.company
+        )
+        self.projects = [
+            Project.objects.create(
+                company=self.company,
+                department=self.department,
+                name="Alpha",
+                start_date=date(2024, 1, 1),
+                is_active=True,
+            ),
+            Project.objects.create(
+                company=self.company,
+                department=self.department,
+                name="Beta",
+                start_date=date(2024, 6, 1),
+                is_active=False,
+            ),
+            Project.objects.create(
+                company=self.company,
+                department=self.other_department,
+                name="Gamma",
+                start_date=date(2025, 1, 1),
+                is_active=True,
+            ),
+        ]
+        # The manager's own employee record puts them in self.company.
+        self.employee = Employee.objects.create(
+            company=self.company,
+            department=self.department,
+            user=self.manager,
+            first_name="test",
+            last_name="employee",
+            email="test@employee.com",
+            position="Developer",
+            hired_on=date(2020, 1, 1),
+        )
+        self.project_url = reverse("project-list")
+        self.employee_url = reverse("employee-list")
+        self.review_url = reverse("performance-review-list")
+
+    def names(self, response):
+        self.assertEqual(response.status_code, 200)
+        return [item["name"] for item in response.data]
+
+
+class FilterTestCase(OrgTestCase):
+
+    def test_filter_active_projects_of_department(self):
+        response = self.client.get(
+            self.project_url,
+            {"department": self.department.id, "is_active": "true"},
+        )
+        self.assertEqual(self.names(response), ["Alpha"])
+
+    def test_date_range_filters(self):
+        response = self.client.get(
+            self.project_url,
+            {"start_date__gte": "2024-03-01", "start_date__lte": "2024-12-31"},
+        )
+        self.assertEqual(self.names(response), ["Beta"])
+        response = self.client.get(
+            self.project_url, {"start_date__range": "2024-01-01,2024-06-01"}
+        )
+        self.assertCountEqual(self.names(response), ["Alpha", "Beta"])
+
+    def test_invalid_value_is_rejected(self):
+        response = self.client.get(self.project_url, {"start_date__gte": "soon"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("start_date__gte", response.data)
+
+    def test_undeclared_params_are_ignored(self):
+        response = self.client.get(self.project_url, {"description": "x"})
+        self.assertEqual(len(self.names(response)), 3)
+
+    def test_ordering(self):
+        response = self.client.get(self.project_url, {"ordering": "-start_date"})
+        self.assertEqual(self.names(response), ["Gamma", "Beta", "Alpha"])
+
+    def test_employees_of_company(self):
+        response = self.client.get(self.employee_url, {"company": self.company.id})
+        self.assertEqual(len(response.data), 1)
+        response = self.client.get(
+            self.employee_url, {"company": self.other_company.id}
+        )
+        self.assertEqual(response.data, [])
+
+    def test_stage_in(self):
+        PerformanceReview.objects.create(employee=self.employee, stage="under_approval")
+        PerformanceReview.objects.create(
+            employee=self.employee, stage="review_approved"
+        )
+        PerformanceReview.objects.create(employee=self.employee)
+        response = self.client.get(
+            self.review_url, {"stage__in": "under_approval,review_approved"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertCountEqual(
+            [item["stage"] for item in response.data],
+            ["under_approval", "review_approved"],
+        )
+
+
+class SparseFieldsTestCase(OrgTestCase):
+    def test_fields_narrow_output_and_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.project_url, {"fields": "id,name"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.data[0]), {"id", "name"})
+        select = queries.captured_queries[-1]["sql"]
+        self.assertNotIn("description", select)
+        self.assertNotIn("JOIN", select)
+
+    def test_related_field_keeps_join(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                self.employee_url, {"fields": "first_name,company"}
+            )
+        self.assertEqual(
+            response.data, [{"first_name": "test", "company": "Test Company"}]
+        )
+        select = queries.captured_queries[-1]["sql"]
+        self.assertNotIn("address", select)
+        self.assertNotIn("department", select)
+
+    def test_mapped_source_and_pagination(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                self.employee_url, {"fields": "days_employed", "page_size": 10}
+            )
+        # The manager's employee scope (cached from then on), the conditional
+        # GET state query and the page itself.
+        self.assertEqual(len(queries), 3)
+        self.assertEqual(
+            response.data["results"],
+            [{"days_employed": (date.today() - date(2020, 1, 1)).days}],
+        )
+
+    def test_unknown_field(self):
+        response = self.client.get(self.project_url, {"fields": "id,secret"})
+        self.assertEqual(response.status_code, 400)
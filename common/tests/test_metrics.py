@@ -0,0 +1,98 @@
+import time
+
+from asgiref.sync import iscoroutinefunction
+from django.contrib.auth.hashers import make_password
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from django.urls import reverse
+
+from common.metrics import registry
+from common.middleware import (
+    QueryMetricsMiddleware,
+    RequestStats,
+    record_serialization,
+)
+from common.tests.base_test import BaseTest
+from company.models import Company
+from user.models import User
+
+
+@override_settings(RESPONSE_CACHE={"ENABLED": False})
+class QueryMetricsTestCase(BaseTest):
+    def setUp(self):
+        super().setUp()
+        registry.clear()
+        self.admin = User.objects.create(
+            email="test@admin.com",
+            username="test admin",
+            password=make_password(None),
+            role="admin",
+        )
+        Company.objects.create(name="Test Company")
+
+    def test_metrics_are_recorded_per_url_name(self):
+        self.client.get(reverse("company-list"))
+        self.client.get(reverse("company-list"))
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(reverse("metrics"))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        body = response.content.decode()
+        self.assertIn("# TYPE http_request_db_queries histogram", body)
+        self.assertIn(
+            'http_request_duration_seconds_count{view="company-list"} 2', body
+        )
+        self.assertIn(
+            'http_request_db_queries_bucket{view="company-list",le="0"} 0', body
+        )
+        self.assertIn(
+            'http_request_serialization_duration_seconds_count{view="company-list"} 2',
+            body,
+        )
+        self.assertIn(
+            'http_request_render_duration_seconds_count{view="company-list"} 2', body
+        )
+
+    def test_metrics_require_admin(self):
+        response = self.client.get(reverse("metrics"))
+        self.assertEqual(response.status_code, 403)
+
+    def test_server_timing_header(self):
+        with self.settings(METRICS={"SERVER_TIMING": True}):
+            response = self.client.get(reverse("company-list"))
+        self.assertIn("db;dur=", response["Server-Timing"])
+        self.assertIn('desc="2 queries"', response["Server-Timing"])
+        self.assertIn("serialize;dur=", response["Server-Timing"])
+        self.assertIn("render;dur=", response["Server-Timing"])
+
+    def test_serialization_is_timed_without_sql(self):
+        request = RequestFactory().get("/")
+        request._request_stats = stats = RequestStats()
+        with record_serialization(request):
+            stats.db_time += 1.0
+        self.assertEqual(stats.serialize_time, 0.0)
+        with record_serialization(request):
+            time.sleep(0.01)
+        self.assertGreaterEqual(stats.serialize_time, 0.01)
+
+    def test_views_without_serializers_report_no_serialization(self):
+        self.client.force_authenticate(user=self.admin)
+        with self.settings(METRICS={"SERVER_TIMING": True}):
+            response = self.client.get(reverse("metrics"))
+        self.assertIn("serialize;dur=0.0,", response["Server-Timing"])
+
+    async def test_async_chain_stays_async(self):
+        async def view(request):
+            return HttpResponse()
+
+        middleware = QueryMetricsMiddleware(view)
+        self.assertTrue(iscoroutinefunction(middleware))
+        self.assertFalse(iscoroutinefunction(QueryMetricsMiddleware(lambda r: None)))
+        with self.settings(METRICS={"SERVER_TIMING": True}):
+            response = await middleware(RequestFactory().get("/"))
+        self.assertIn("total;dur=", response["Server-Timing"])
+
+    def test_server_timing_disabled_by_default(self):
+        with self.settings(METRICS={}):
+            response = self.client.get(reverse("company-list"))
+        self.assertNotIn("Server-Timing", response)
@@ -0,0 +1,63 @@
+from django.urls import reverse
+from django.utils import timezone
+
+from common.tests.base_test import BaseTest
+from company.models import Company
+
+
+class KeysetPaginationTestCase(BaseTest):
+    def setUp(self):
+        super().setUp()
+        self.company_url = reverse("company-list")
+        self.companies = [
+            Company.objects.create(name=f"Company {index}") for index in range(7)
+        ]
+
+    def collect_pages(self, url):
+        names = []
+        while url:
+            response = self.client.get(url, format="json")
+            self.assertEqual(response.status_code, 200)
+            names.extend(item["name"] for item in response.data["results"])
+            url = response.data["next"]
+        return names
+
+    def test_list_without_pagination_params_is_unpaginated(self):
+        response = self.client.get(self.company_url, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response.data, list)
+        self.assertEqual(len(response.data), 7)
+
+    def test_pages_walk_newest_first_without_duplicates(self):
+        names = self.collect_pages(f"{self.company_url}?page_size=3")
+        expected = [company.name for company in reversed(self.companies)]
+        self.assertEqual(names, expected)
+
+    def test_ties_on_created_at_are_broken_by_id(self):
+        Company.objects.update(created_at=timezone.now())
+        names = self.collect_pages(f"{self.company_url}?page_size=2")
+        expected = [company.name for company in reversed(self.companies)]
+        self.assertEqual(names, expected)
+
+    def test_previous_link_returns_to_earlier_page(self):
+        first = self.client.get(f"{self.company_url}?page_size=3", format="json")
+        second = self.client.get(first.data["next"], format="json")
+        self.assertIsNotNone(second.data["previous"])
+        back = self.client.get(second.data["previous"], format="json")
+        self.assertEqual(back.data["results"], first.data["results"])
+
+    def test_page_size_is_clamped_to_maximum(self):
+        with self.settings(KEYSET_PAGINATION={"PAGE_SIZE": 2, "MAX_PAGE_SIZE": 4}):
+            response = self.client.get(f"{self.company_url}?page_size=100")
+        self.assertEqual(len(response.data["results"]), 4)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(f"{self.company_url}?cursor=not-a-cursor")
+        self.assertEqual(response.status_code, 404)
+
+    def test_ordering_is_rejected_on_paginated_lists(self):
+        response = self.client.get(f"{self.company_url}?page_size=2&ordering=name")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("ordering", response.data)
+        response = self.client.get(f"{self.company_url}?ordering=name")
+        self.assertEqual(response.status_code, 200)
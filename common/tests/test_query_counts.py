@@ -0,0 +1,93 @@
+from itertools import count
+
+from django.contrib.auth.hashers import make_password
+from django.urls import reverse
+
+from common.tests.base_test import BaseTest
+from common.tests.query_count import QueryCountMixin
+from company.models import Company, Department, PerformanceReview, Project
+from user.models import Employee, User
+
+
+class ListQueryCountTestCase(QueryCountMixin, BaseTest):
+    def setUp(self):
+        super().setUp()
+        self.admin = User.objects.create(
+            email="test@admin.com",
+            username="test admin",
+            password=make_password(None),
+            role="admin",
+        )
+        self.client.force_authenticate(user=self.admin)
+        self.company = Company.objects.create(name="Test Company")
+        self.department = Department.objects.create(
+            name="Test Department", company=self.company
+        )
+        self.sequence = count()
+
+    def create_companies(self, n):
+        Company.objects.bulk_create([Company(name=f"Company {i}") for i in range(n)])
+
+    def create_departments(self, n):
+        Department.objects.bulk_create(
+            [
+                Department(
+                    company=Company.objects.create(name=f"Company {i}"), name="D"
+                )
+                for i in range(n)
+            ]
+        )
+
+    def create_projects(self, n):
+        Project.objects.bulk_create(
+            [
+                Project(company=self.company, department=self.department, name=f"P {i}")
+                for i in range(n)
+            ]
+        )
+
+    def create_employees(self, n):
+        users = User.objects.bulk_create(
+            [
+                User(email=f"u{i}@test.com", username=f"u{i}", password="!")
+                for i in (next(self.sequence) for _ in range(n))
+            ]
+        )
+        return Employee.objects.bulk_create(
+            [
+                Employee(
+                    company=self.company,
+                    department=self.department,
+                    user=user,
+                    first_name="test",
+                    last_name=user.username,
+                    email=f"employee-{user.email}",
+                )
+                for user in users
+            ]
+        )
+
+    def create_reviews(self, n):
+        PerformanceReview.objects.bulk_create(
+            [
+                PerformanceReview(employee=employee)
+                for employee in self.create_employees(n)
+            ]
+        )
+
+    def test_company_list(self):
+        self.assertConstantQueries(reverse("company-list"), self.create_companies)
+
+    def test_department_list(self):
+        self.assertConstantQueries(reverse("department-list"), self.create_departments)
+
+    def test_project_list(self):
+        self.assertConstantQueries(reverse("project-list"), self.create_projects)
+
+    def test_employee_list(self):
+        self.assertConstantQueries(reverse("employee-list"), self.create_employees)
+
+    def test_performance_review_list(self):
+        self.assertConstantQueries(
+            reverse("performance-review-list"), self.create_reviews
+        )
@@ -0,0 +1,125 @@
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+from io import BytesIO
+from unittest import mock
+
+from django.db.models import QuerySet
+from django.test import AsyncClient, override_settings
+from django.urls import reverse
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from common import renderers
+from common.renderers import FastJSONParser, FastJSONRenderer, stream_json_array
+from common.tests.test_filters import OrgTestCase
+from company.models import Project
+
+DATA = [
+    {
+        "id": 1,
+        "name": "Zoë  ",
+        "hired_on": date(2025, 1, 2),
+        "created_at": datetime(2025, 1, 2, 3, 4, 5, 6000, tzinfo=timezone.utc),
+        "starts": time(9, 30),
+        "salary": Decimal("1234.50"),
+        "tags": ("a", "b"),
+        "active": True,
+        "manager": None,
+    }
+]
+
+
+@override_settings(RESPONSE_CACHE={"ENABLED": False})
+class FastJSONTestCase(OrgTestCase):
+    def test_render_matches_drf(self):
+        expected = JSONRenderer().render(DATA)
+        self.assertEqual(FastJSONRenderer().render(DATA), expected)
+        with mock.patch.object(renderers, "orjson", None):
+            self.assertEqual(FastJSONRenderer().render(DATA), expected)
+
+    def test_indent_uses_drf(self):
+        context = {"indent": 4}
+        self.assertEqual(
+            FastJSONRenderer().render(DATA, renderer_context=context),
+            JSONRenderer().render(DATA, renderer_context=context),
+        )
+
+    def test_parse(self):
+        body = b'{"ids": [1, 2], "name": "Zo\xc3\xab"}'
+        for parser in (FastJSONParser(), JSONParser()):
+            self.assertEqual(
+                parser.parse(BytesIO(body)), {"ids": [1, 2], "name": "Zoë"}
+            )
+            with self.assertRaises(ParseError):
+                parser.parse(BytesIO(b"{nope"))
+
+    def test_stream_json_array(self):
+        chunks = [[{"id": 1}, {"id": 2}], [], [{"id": 3}]]
+        self.assertEqual(
+            b"".join(stream_json_array(chunks)), b'[{"id":1},{"id":2},{"id":3}]'
+        )
+        self.assertEqual(b"".join(stream_json_array([])), b"[]")
+
+    def create_projects(self, count):
+        for index in range(count):
+            Project.objects.create(
+                company=self.company,
+                department=self.department,
+                name=f"Project {index}",
+            )
+
+    @override_settings(JSON_STREAM_THRESHOLD=2)
+    def test_big_lists_are_streamed(self):
+        self.create_projects(3)
+        url = reverse("project-list")
+        with override_settings(JSON_STREAM_THRESHOLD=0):
+            expected = self.client.get(url).content
+        for fast in (False, True):
+            with self.subTest(fast=fast), override_settings(FAST_READ_SERIALIZERS=fast):
+                response = self.client.get(url)
+                self.assertTrue(response.streaming)
+                self.assertEqual(b"".join(response.streaming_content), expected)
+
+        response = self.client.get(url, {"name": "Project 1"})
+        self.assertFalse(response.streaming)
+        response = self.client.get(url, {"page_size": 2})
+        self.assertFalse(response.streaming)
+        self.assertEqual(len(response.json()["results"]), 2)
+
+        cache = {"ENABLED": True, "ALIAS": "default", "TIMEOUT": 300}
+        with override_settings(RESPONSE_CACHE=cache):
+            for _ in range(2):
+                response = self.client.get(url)
+                self.assertTrue(response.streaming)
+                # Closing releases the open cursor of the unread stream.
+                response.close()
+
+    @override_settings(JSON_STREAM_THRESHOLD=2)
+    def test_closing_an_unread_stream_closes_the_rows(self):
+        self.create_projects(5)
+        closed = []
+        iterator = QuerySet.iterator
+
+        def tracked(queryset, *args, **kwargs):
+            try:
+                yield from iterator(queryset, *args, **kwargs)
+            finally:
+                closed.append(True)
+
+        with mock.patch.object(QuerySet, "iterator", tracked):
+            response = self.client.get(reverse("project-list"))
+            self.assertTrue(response.streaming)
+            response.close()
+        self.assertEqual(closed, [True])
+
+    @override_settings(JSON_STREAM_THRESHOLD=2)
+    async def test_asgi_is_not_streamed(self):
+        token = RefreshToken.for_user(self.manager).access_token
+        response = await AsyncClient().get(
+            reverse("project-list"), headers={"authorization": f"Bearer {token}"}
+        )
+        self.assertFalse(response.streaming)
+        self.assertEqual(len(response.json()), await Project.objects.acount())
+        self.assertGreater(len(response.json()), 2)
@@ -0,0 +1,160 @@
+import tempfile
+
+from django.contrib.auth.hashers import make_password
+from django.core.cache import caches
+from django.test import override_settings
+from django.urls import reverse
+
+from common.response_cache import check_shared_cache
+from common.tests.base_test import BaseTest
+from company.models import Company, Department, PerformanceReview, Project
+from user.models import Employee, User
+
+
+@override_settings(RESPONSE_CACHE={"ENABLED": True})
+class ResponseCacheTestCase(BaseTest):
+    def setUp(self):
+        super().setUp()
+        caches["default"].clear()
+        self.company = Company.objects.create(name="Test Company")
+        self.company_url = reverse("company-list")
+
+    def test_repeated_list_is_served_without_queries(self):
+        first = self.client.get(self.company_url)
+        self.assertEqual(first.status_code, 200)
+        self.assertIn("ETag", first)
+        with self.assertNumQueries(0):
+            second = self.client.get(self.company_url)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second["ETag"], first["ETag"])
+        self.assertEqual(second["Content-Type"], first["Content-Type"])
+
+    def test_if_none_match_returns_304(self):
+        etag = self.client.get(self.company_url)["ETag"]
+        response = self.client.get(self.company_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], etag)
+
+    def test_query_params_and_detail_are_cached_separately(self):
+        listed = self.client.get(self.company_url)
+        filtered = self.client.get(self.company_url, {"name": "Nope"})
+        detail = self.client.get(reverse("company-detail", args=[self.company.id]))
+        self.assertEqual(len(listed.json()), 1)
+        self.assertEqual(filtered.json(), [])
+        self.assertEqual(detail.json()["name"], "Test Company")
+
+    def test_child_write_invalidates_parent_list(self):
+        self.client.get(self.company_url)
+        self.client.post(
+            reverse("department-list"),
+            {"company": self.company.id, "name": "Test Department"},
+            format="json",
+        )
+        response = self.client.get(self.company_url)
+        self.assertEqual(response.json()[0]["num_of_department"], 1)
+
+    def test_update_and_delete_invalidate(self):
+        detail_url = reverse("company-detail", args=[self.company.id])
+        self.client.get(detail_url)
+        self.client.patch(detail_url, {"name": "Renamed"}, format="json")
+        self.assertEqual(self.client.get(detail_url).json()["name"], "Renamed")
+        self.client.delete(detail_url)
+        self.assertEqual(self.client.get(self.company_url).json(), [])
+
+    def test_employees_do_not_share_cached_reviews(self):
+        department = Department.objects.create(name="D", company=self.company)
+        users = []
+        for index in range(2):
+            user = User.objects.create(
+                email=f"employee{index}@test.com",
+                username=f"employee {index}",
+                password=make_password(None),
+                role="employee",
+            )
+            employee = Employee.objects.create(
+                company=self.company,
+                department=department,
+                user=user,
+                first_name=f"employee {index}",
+                last_name="test",
+                email=user.email,
+            )
+            PerformanceReview.objects.create(employee=employee)
+            users.append(user)
+
+        seen = []
+        for user in users:
+            self.client.force_authenticate(user=user)
+            response = self.client.get(reverse("performance-review-list"))
+            seen.append([review["employee"] for review in response.json()])
+        self.assertEqual(seen, [["employee 0"], ["employee 1"]])
+
+    def test_project_page_follows_the_callers_company(self):
+        department = Department.objects.create(name="D", company=self.company)
+        other = Company.objects.create(name="Other Company")
+        other_department = Department.objects.create(name="D", company=other)
+        Project.objects.create(name="PA", company=self.company, department=department)
+        Project.objects.create(name="PB", company=other, department=other_department)
+        self.user.role = "manager"
+        employee = Employee.objects.create(
+            company=self.company,
+            department=department,
+            user=self.user,
+            first_name="test",
+            last_name="manager",
+            email=self.user.email,
+        )
+        url = reverse("project-list")
+        self.assertEqual([row["name"] for row in self.client.get(url).json()], ["PA"])
+        employee.company, employee.department = other, other_department
+        employee.save()
+        del self.user._employee_scope
+        self.assertEqual([row["name"] for row in self.client.get(url).json()], ["PB"])
+
+    @override_settings(RESPONSE_CACHE={})
+    def test_off_by_default_on_a_per_process_cache(self):
+        self.client.get(self.company_url)
+        with self.assertNumQueries(2):
+            self.client.get(self.company_url)
+        self.assertEqual(check_shared_cache(None), [])
+        with self.settings(RESPONSE_CACHE={"ENABLED": True}):
+            self.assertEqual(
+                [warning.id for warning in check_shared_cache(None)], ["common.W001"]
+            )
+
+    @override_settings(RESPONSE_CACHE={"ENABLED": False})
+    def test_disabled(self):
+        self.client.get(self.company_url)
+        with self.assertNumQueries(2):
+            response = self.client.get(self.company_url)
+        # The tag still comes from ConditionalGetMixin.
+        self.assertTrue(response["ETag"].startswith('W/"'))
+
+
+class FileBackendResponseCacheTestCase(BaseTest):
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings = override_settings(
+            CACHES={
+                "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+                "responses": {
+                    "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                    "LOCATION": directory.name,
+                },
+            },
+            RESPONSE_CACHE={"ALIAS": "responses"},
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+        Company.objects.create(name="Test Company")
+
+    def test_hit_and_invalidation(self):
+        url = reverse("company-list")
+        first = self.client.get(url)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(url).content, first.content)
+        Company.objects.create(name="Other Company")
+        self.assertEqual(len(self.client.get(url).json()), 2)
@@ -0,0 +1,146 @@
+from io import StringIO
+
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.urls import reverse
+
+from common import search
+from common.tests.base_test import BaseTest
+from company.models import Company, Department, Project
+from user.models import Employee, User
+
+
+class SearchAPITestCase(BaseTest):
+    def setUp(self):
+        super().setUp()
+        self.manager = User.objects.create(
+            email="test@manager.com",
+            username="test manager",
+            password=make_password(None),
+            role="manager",
+        )
+        self.search_url = reverse("search")
+        self.company = Company.objects.create(name="Test Company")
+        self.department = Department.objects.create(
+            name="Test Department", company=self.company
+        )
+        self.employee = Employee.objects.create(
+            company=self.company,
+            department=self.department,
+            user=self.user,
+            first_name="Margaret",
+            last_name="Hamilton",
+            email="margaret@apollo.com",
+            position="Software Engineer",
+        )
+        self.project = Project.objects.create(
+            company=self.company,
+            name="Apollo Guidance",
+            description="Flight software written by Margaret's team",
+        )
+        Employee.objects.create(
+            company=self.company,
+            department=self.department,
+            user=self.manager,
+            first_name="Team",
+            last_name="Lead",
+            email=self.manager.email,
+        )
+
+    def search(self, **params):
+        response = self.client.get(self.search_url, params)
+        self.assertEqual(response.status_code, 200)
+        return [(item["type"], item["id"]) for item in response.data]
+
+    def test_prefix_match_and_ranking(self):
+        self.client.force_authenticate(user=self.manager)
+        results = self.search(q="marg")
+        # The employee matches on a name, the project only on its description.
+        self.assertEqual(
+            results, [("employee", self.employee.id), ("project", self.project.id)]
+        )
+
+    def test_every_word_must_match(self):
+        self.client.force_authenticate(user=self.manager)
+        self.assertEqual(self.search(q="apollo guid"), [("project", self.project.id)])
+        self.assertEqual(self.search(q="apollo missing"), [])
+
+    def test_type_filter(self):
+        self.client.force_authenticate(user=self.manager)
+        self.assertEqual(
+            self.search(q="margaret", type="employee"),
+            [("employee", self.employee.id)],
+        )
+
+    def test_employees_hidden_from_regular_users(self):
+        self.assertEqual(self.search(q="margaret"), [("project", self.project.id)])
+
+    def test_index_follows_updates_and_deletes(self):
+        self.client.force_authenticate(user=self.manager)
+        self.employee.last_name = "Lovelace"
+        self.employee.save()
+        self.assertEqual(self.search(q="lovelace"), [("employee", self.employee.id)])
+        self.assertEqual(self.search(q="hamilton"), [])
+        self.project.delete()
+        self.assertEqual(self.search(q="apollo guidance"), [])
+
+    def test_bulk_created_rows_are_indexed(self):
+        self.client.force_authenticate(user=self.manager)
+        response = self.client.post(
+            reverse("project-bulk"),
+            [{"company": self.company.id, "name": "Gemini"}],
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            self.search(q="gemini"), [("project", response.data["results"][0]["id"])]
+        )
+
+    def test_rebuild(self):
+        self.client.force_authenticate(user=self.manager)
+        Project.objects.filter(pk=self.project.pk).update(name="Skylab")
+        self.assertEqual(self.search(q="skylab"), [])
+        call_command("rebuild_search_index", stdout=StringIO())
+        self.assertEqual(self.search(q="skylab"), [("project", self.project.id)])
+
+    def test_query_is_required(self):
+        response = self.client.get(self.search_url, {"q": " !"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_terms_cannot_inject_match_syntax(self):
+        self.assertEqual(search.terms('Marg" OR title:*'), ["marg", "or", "title"])
+        self.client.force_authenticate(user=self.manager)
+        self.assertEqual(self.search(q='"margaret" OR'), [])
+
+    def test_results_are_scoped_to_the_callers_company(self):
+        other = Company.objects.create(name="Other Company")
+        user = User.objects.create(
+            email="margo@other.com", username="margo", password=make_password(None)
+        )
+        employee = Employee.objects.create(
+            company=other,
+            department=Department.objects.create(name="Other", company=other),
+            user=user,
+            first_name="Margo",
+            last_name="Other",
+            email=user.email,
+        )
+        project = Project.objects.create(company=other, name="Margate")
+        self.assertEqual(self.search(q="marg"), [("project", self.project.id)])
+
+        self.client.force_authenticate(user=self.manager)
+        self.assertEqual(
+            {result for result in self.search(q="marg")},
+            {("employee", self.employee.id), ("project", self.project.id)},
+        )
+
+        self.manager.role = "admin"
+        self.assertEqual(
+            {result for result in self.search(q="marg")},
+            {
+                ("employee", self.employee.id),
+                ("employee", employee.id),
+                ("project", self.project.id),
+                ("project", project.id),
+            },
+        )
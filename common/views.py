@@ -1,3 +1,79 @@
-from django.shortcuts import render
+import json
 
-# Create your views here.
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import BaseRenderer
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from common import search
+from common.metrics import registry
+from user import scope
+from user.permission import IsAdmin, IsAdminOrManager
+
+
+class PrometheusRenderer(BaseRenderer):
+    media_type = "text/plain"
+    format = "txt"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if isinstance(data, str):
+            return data.encode(self.charset)
+        return json.dumps(data).encode(self.charset)
+
+
+class MetricsAPIView(APIView):
+    permission_classes = [IsAuthenticated, IsAdmin]
+    renderer_classes = [PrometheusRenderer]
+
+    def get(self, request):
+        return Response(
+            registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8"
+        )
+
+
+class SearchAPIView(APIView):
+    """
+    ``GET /api/search/?q=<words>[&type=employee,project][&limit=20]``.
+
+    Every word is matched as a prefix and all words must match; results are
+    ranked with names weighted above the other fields. Employees are only
+    returned to admins and managers, like the employee list, and non-admins
+    only find rows of their own company.
+    """
+
+    permission_classes = [IsAuthenticated]
+    max_limit = 100
+
+    def get(self, request):
+        query = request.query_params.get("q", "")
+        if not search.terms(query):
+            raise ValidationError({"q": ["This parameter is required."]})
+
+        kinds = request.query_params.get("type")
+        kinds = kinds.split(",") if kinds else list(search.KINDS)
+        unknown = set(kinds) - set(search.KINDS)
+        if unknown:
+            raise ValidationError({"type": [f"Unknown type(s): {sorted(unknown)}"]})
+        if not IsAdminOrManager().has_permission(request, self):
+            kinds = [kind for kind in kinds if kind != "employee"]
+
+        try:
+            limit = int(request.query_params.get("limit", 20))
+        except ValueError:
+            raise ValidationError({"limit": ["A valid integer is required."]})
+        limit = max(1, min(limit, self.max_limit))
+
+        company_id = None
+        if request.user.role != "admin":
+            company_id = scope.get_scope(request.user)[1]
+            if company_id is None:
+                kinds = []
+        results = search.search(query, kinds, limit, company_id) if kinds else []
+        return Response(
+            [
+                {"type": kind, "id": pk, "title": title, "body": body, "score": score}
+                for kind, pk, title, body, score in results
+            ]
+        )
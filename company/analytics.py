@@ -0,0 +1,159 @@
+"""
+Org-wide aggregates for ``/api/analytics/``.
+
+Every section is a fixed number of grouped queries, independent of how many
+companies, departments or employees exist, and its result is cached for
+``ANALYTICS["CACHE_TTL"]`` seconds.
+"""
+
+from datetime import date
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Avg, Count, FloatField, Func, Q
+from django.utils import timezone
+
+from company.choices import Stages
+from company.models import Department, PerformanceReview, Project
+from user.models import Employee
+
+EPOCH = date(1970, 1, 1)
+
+
+class DaysSinceEpoch(Func):
+    """Number of days between a date column and 1970-01-01."""
+
+    output_field = FloatField()
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler,
+            connection,
+            template="(julianday(%(expressions)s) - 2440587.5)",
+            **extra_context,
+        )
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler,
+            connection,
+            template="(%(expressions)s - DATE '1970-01-01')",
+            **extra_context,
+        )
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler,
+            connection,
+            template="DATEDIFF(%(expressions)s, '1970-01-01')",
+            **extra_context,
+        )
+
+
+def tenure_days(average_hire_day):
+    if average_hire_day is None:
+        return None
+    return round((timezone.localdate() - EPOCH).days - average_hire_day, 1)
+
+
+def headcount(company_id=None):
+    # Grouped from departments so one without employees reports 0.
+    departments = Department.objects.order_by()
+    if company_id is not None:
+        departments = departments.filter(company_id=company_id)
+    rows = (
+        departments.values("company_id", "company__name", "id", "name")
+        .annotate(headcount=Count("department_employee"))
+        .order_by("company_id", "id")
+    )
+    return [
+        {
+            "company_id": row["company_id"],
+            "company": row["company__name"],
+            "department_id": row["id"],
+            "department": row["name"],
+            "headcount": row["headcount"],
+        }
+        for row in rows
+    ]
+
+
+def projects(company_id=None):
+    queryset = Project.objects.order_by()
+    if company_id is not None:
+        queryset = queryset.filter(company_id=company_id)
+    rows = (
+        queryset.values("company_id", "company__name")
+        .annotate(total=Count("pk"), active=Count("pk", filter=Q(is_active=True)))
+        .order_by("company_id")
+    )
+    return [
+        {
+            "company_id": row["company_id"],
+            "company": row["company__name"],
+            "projects": row["total"],
+            "active_projects": row["active"],
+        }
+        for row in rows
+    ]
+
+
+def tenure(company_id=None):
+    employees = Employee.objects.order_by().filter(hired_on__isnull=False)
+    if company_id is not None:
+        employees = employees.filter(company_id=company_id)
+    hire_day = DaysSinceEpoch("hired_on")
+    rows = (
+        employees.values("company_id", "company__name")
+        .annotate(average=Avg(hire_day), employees=Count("pk"))
+        .order_by("company_id")
+    )
+    overall = employees.aggregate(average=Avg(hire_day), employees=Count("pk"))
+    return {
+        "average_days": tenure_days(overall["average"]),
+        "employees": overall["employees"],
+        "companies": [
+            {
+                "company_id": row["company_id"],
+                "company": row["company__name"],
+                "average_days": tenure_days(row["average"]),
+                "employees": row["employees"],
+            }
+            for row in rows
+        ],
+    }
+
+
+def reviews(company_id=None):
+    queryset = PerformanceReview.objects.order_by()
+    if company_id is not None:
+        queryset = queryset.filter(employee__company_id=company_id)
+    counts = dict(queryset.values_list("stage").annotate(total=Count("pk")))
+    return {stage: counts.get(stage, 0) for stage in Stages.values}
+
+
+SECTIONS = {
+    "headcount": headcount,
+    "projects": projects,
+    "tenure": tenure,
+    "reviews": reviews,
+}
+
+
+def get_config():
+    config = {"CACHE_TTL": 300, "CACHE_ALIAS": "default"}
+    config.update(getattr(settings, "ANALYTICS", {}))
+    return config
+
+
+def get_section(name, company_id=None):
+    """Return the cached result of ``SECTIONS[name]``, computing it on a miss."""
+    config = get_config()
+    cache = caches[config["CACHE_ALIAS"]]
+    key = f"analytics:{name}:{company_id or 'all'}"
+    result = cache.get(key)
+    if result is None:
+        result = SECTIONS[name](company_id)
+        if config["CACHE_TTL"]:
+            cache.set(key, result, config["CACHE_TTL"])
+    return result
@@ -1,3 +1,4 @@
+from .analytics import AnalyticsAPIView
 from .company import CompanyAPIView
 from .common import (
     DepartmentAPIView,
@@ -5,3 +6,4 @@ from .common import (
     AssignProjectToEmployeeAPIView,
     PerformanceReviewAPIView,
 )
+from .snapshots import DailySnapshotAPIView
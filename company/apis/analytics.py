@@ -0,0 +1,42 @@
+from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from company import analytics
+from user import scope
+from user.permission import IsAdminOrManager
+
+
+class AnalyticsAPIView(APIView):
+    """
+    ``GET /api/analytics/`` returns every section, ``/api/analytics/<section>/``
+    a single one; ``?company=<id>`` restricts them to one company. Managers
+    only get their own company's figures.
+    """
+
+    permission_classes = [IsAuthenticated, IsAdminOrManager]
+
+    def get(self, request, section=None):
+        if section is not None and section not in analytics.SECTIONS:
+            raise NotFound(f"Unknown section {section!r}")
+        company_id = request.query_params.get("company")
+        if company_id is not None:
+            try:
+                company_id = int(company_id)
+            except ValueError:
+                raise ValidationError({"company": ["A valid integer is required."]})
+        if request.user.role != "admin":
+            own_company = scope.get_scope(request.user)[1]
+            if own_company is None or company_id not in (None, own_company):
+                raise PermissionDenied("Analytics are limited to your own company.")
+            company_id = own_company
+
+        if section is not None:
+            return Response(analytics.get_section(section, company_id))
+        return Response(
+            {
+                name: analytics.get_section(name, company_id)
+                for name in analytics.SECTIONS
+            }
+        )
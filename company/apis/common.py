@@ -1,10 +1,31 @@
+from collections import defaultdict
+
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.generics import CreateAPIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
-from company.models import Department, Project, ProjectEmployee, PerformanceReview
+from common import response_cache
+from common.bulk import BulkMixin, bulk_status
+from common.conditional import ConditionalGetMixin
+from common.export import ExportMixin
+from common.fast_read import FastReadMixin
+from common.filters import SparseFieldsMixin
+from common.response_cache import CachedResponseMixin
+from company import counters
+from company.choices import Stages, can_transition
+from company.models import (
+    Company,
+    Department,
+    Project,
+    ProjectEmployee,
+    PerformanceReview,
+    StageConflict,
+)
 from company.serializers import (
     DepartmentSerializer,
     ReadDepartmentSerializer,
@@ -14,13 +35,26 @@ from company.serializers import (
     PerformanceReviewSerializer,
     ReadPerformanceReviewSerializer,
 )
+from user.models import Employee
+from user import scope
 from user.permission import IsAdminOrManager, IsAdmin
 
 
-class DepartmentAPIView(ModelViewSet):
+class DepartmentAPIView(
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    SparseFieldsMixin,
+    BulkMixin,
+    FastReadMixin,
+    ModelViewSet,
+):
     permission_classes = [IsAuthenticated]
     queryset = Department.objects.all()
     serializer_class = DepartmentSerializer
+    cache_dependencies = (Department, Company, Project, Employee)
+    bulk_relations = {"company": Company}
+    filter_fields = {"company": ["exact", "in"], "name": ["exact", "icontains"]}
+    ordering_fields = ["name", "number_of_employees", "created_at"]
 
     def get_queryset(self):
         return self.queryset.select_related("company").all()
@@ -30,14 +64,54 @@ class DepartmentAPIView(ModelViewSet):
             return ReadDepartmentSerializer
         return DepartmentSerializer
 
+    def perform_destroy(self, instance):
+        with counters.deferred():
+            instance.delete()
+
 
-class ProjectAPIView(ModelViewSet):
+class ProjectAPIView(
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    SparseFieldsMixin,
+    BulkMixin,
+    ExportMixin,
+    FastReadMixin,
+    ModelViewSet,
+):
     permission_classes = [IsAuthenticated]
     queryset = Project.objects.all()
     serializer_class = ProjectSerializer
+    # Non-admins only see their own company's projects, found through their
+    # Employee row.
+    cache_dependencies = (Project, Company, Department, Employee)
+    cache_per_user_roles = ("manager", "employee")
+    row_scoped = True
+    bulk_relations = {"company": Company, "department": Department}
+    filter_fields = {
+        "company": ["exact", "in"],
+        "department": ["exact", "in"],
+        "is_active": ["exact"],
+        "name": ["exact", "icontains"],
+        "start_date": ["exact", "gte", "lte", "range", "isnull"],
+        "end_date": ["exact", "gte", "lte", "range", "isnull"],
+    }
+    ordering_fields = ["name", "start_date", "end_date", "created_at"]
+    export_fields = (
+        ("id", "id"),
+        ("company", "company__name"),
+        ("department", "department__name"),
+        ("name", "name"),
+        ("description", "description"),
+        ("start_date", "start_date"),
+        ("end_date", "end_date"),
+        ("is_active", "is_active"),
+    )
 
     def get_queryset(self):
-        return self.queryset.select_related("company", "department").all()
+        queryset = self.queryset.select_related("company", "department").all()
+        if self.request.user.role != "admin":
+            return scope.company_rows(queryset, self.request.user)
+        return queryset
 
     def get_serializer_class(self):
         if self.request.method == "GET":
@@ -51,23 +125,57 @@ class AssignProjectToEmployeeAPIView(CreateAPIView):
     serializer_class = ProjectEmployeeSerializer
 
 
-class PerformanceReviewAPIView(ModelViewSet):
+class PerformanceReviewAPIView(
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    SparseFieldsMixin,
+    ExportMixin,
+    FastReadMixin,
+    ModelViewSet,
+):
     queryset = PerformanceReview.objects.all()
     serializer_class = PerformanceReviewSerializer
     permission_classes = [IsAuthenticated]
+    cache_dependencies = (PerformanceReview, Employee)
+    # Employees only see their own reviews.
+    cache_per_user_roles = ("employee",)
+    row_scoped = True
+    bulk_max_items = 1000
+    filter_fields = {
+        "employee": ["exact", "in"],
+        "stage": ["exact", "in"],
+        "scheduled_date": ["gte", "lte", "range", "isnull"],
+    }
+    ordering_fields = ["stage", "scheduled_date", "created_at", "updated_at"]
+    export_fields = (
+        ("id", "id"),
+        ("employee", "employee__first_name"),
+        ("employee_email", "employee__email"),
+        ("stage", "stage"),
+        ("scheduled_date", "scheduled_date"),
+        ("feedback", "feedback"),
+        ("created_at", "created_at"),
+        ("updated_at", "updated_at"),
+    )
 
     def get_queryset(self):
         user = self.request.user
+        queryset = self.queryset.select_related("employee")
         if user.role == "employee":
-            return self.queryset.filter(employee__email=user.email)
-        return self.queryset
+            return scope.own_rows(queryset, user)
+        return queryset
 
     def get_permissions(self):
         if self.action in ["create", "destroy"]:
             return [IsAdminOrManager()]
-        elif self.action in ["update", "partial_update", "change_stage"]:
+        elif self.action in [
+            "update",
+            "partial_update",
+            "change_stage",
+            "bulk_change_stage",
+        ]:
             return [IsAdminOrManager()]
-        elif self.action in ["list", "retrieve"]:
+        elif self.action in ["list", "retrieve", "export"]:
             return [IsAuthenticated()]
         return super().get_permissions()
 
@@ -84,9 +192,92 @@ class PerformanceReviewAPIView(ModelViewSet):
         if not new_stage:
             return Response({"error": "stage field is required"}, status=400)
 
-        if review.update_stage(new_stage):
+        try:
+            updated = review.update_stage(new_stage)
+        except StageConflict as conflict:
+            return Response({"error": str(conflict)}, status=409)
+        if updated:
             return Response({"status": f"Stage updated to {new_stage}"}, status=200)
         return Response(
             {"error": f"Invalid transition from {review.stage} to {new_stage}"},
             status=400,
         )
+
+    @action(detail=False, methods=["post"], url_path="bulk-change-stage")
+    def bulk_change_stage(self, request):
+        """
+        Move ``{"ids": [...], "stage": ...}`` to ``stage`` and report one
+        result per ID: 200 moved, 400 not allowed from its current stage,
+        404 missing, 409 changed by someone else in the meantime.
+
+        Current stages are read once, then every source stage is moved with a
+        single ``UPDATE ... WHERE stage = <source>``, so a review whose stage
+        changed after the read is left alone rather than overwritten.
+        """
+        new_stage = request.data.get("stage")
+        ids = request.data.get("ids")
+        if new_stage not in Stages.values:
+            return Response({"error": "a valid stage is required"}, status=400)
+        if not isinstance(ids, list) or not ids:
+            return Response({"error": "ids must be a non-empty list"}, status=400)
+        if len(ids) > self.bulk_max_items:
+            return Response(
+                {"error": f"at most {self.bulk_max_items} ids per request"},
+                status=400,
+            )
+
+        pks = []
+        for pk in ids:
+            try:
+                pks.append(int(pk))
+            except (TypeError, ValueError):
+                pks.append(None)
+        queryset = self.get_queryset().order_by()
+        current = dict(
+            queryset.filter(pk__in={pk for pk in pks if pk is not None}).values_list(
+                "pk", "stage"
+            )
+        )
+        sources = defaultdict(list)
+        for pk, stage in current.items():
+            if can_transition(stage, new_stage):
+                sources[stage].append(pk)
+
+        moved = set()
+        now = timezone.now()
+        with transaction.atomic():
+            for stage, group in sources.items():
+                count = PerformanceReview.objects.filter(
+                    pk__in=group, stage=stage
+                ).update(stage=new_stage, updated_at=now)
+                if count == len(group):
+                    moved.update(group)
+                elif count:
+                    # Only some rows still had the expected stage; ours are
+                    # the ones carrying this request's timestamp.
+                    moved.update(
+                        PerformanceReview.objects.filter(
+                            pk__in=group, stage=new_stage, updated_at=now
+                        ).values_list("pk", flat=True)
+                    )
+        if moved:
+            response_cache.bump(PerformanceReview)
+
+        results = []
+        for index, pk in enumerate(pks):
+            result = {"index": index, "id": pk}
+            if pk not in current:
+                result["status"] = 404
+            elif pk in moved:
+                result["status"] = 200
+            elif can_transition(current[pk], new_stage):
+                result.update(status=409, error="stage was changed concurrently")
+            else:
+                result.update(
+                    status=400,
+                    error=f"Invalid transition from {current[pk]} to {new_stage}",
+                )
+            results.append(result)
+        return Response(
+            {"results": results}, status=bulk_status(results, status.HTTP_200_OK)
+        )
@@ -1,15 +1,49 @@
-from django.db.models import Count
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.viewsets import ModelViewSet
 
-from company.models import Company
+from common.conditional import ConditionalGetMixin
+from common.fast_read import FastReadMixin
+from common.filters import SparseFieldsMixin
+from common.response_cache import CachedResponseMixin
+from company import counters
+from company.models import Company, Department, Project
 from company.serializers import CompanySerializer, ReadCompanySerializer
+from user.models import Employee
 
 
-class CompanyAPIView(ModelViewSet):
+def count_children(model):
+    children = (
+        model.objects.filter(company_id=OuterRef("pk"))
+        .order_by()
+        .values("company_id")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    return Coalesce(Subquery(children, output_field=IntegerField()), 0)
+
+
+class CompanyAPIView(
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    SparseFieldsMixin,
+    FastReadMixin,
+    ModelViewSet,
+):
     permission_classes = [IsAuthenticated]
     queryset = Company.objects.all()
     serializer_class = CompanySerializer
+    # Children are listed too: their writes move the number_of_* counters.
+    cache_dependencies = (Company, Department, Project, Employee)
+    filter_fields = {"name": ["exact", "icontains"]}
+    ordering_fields = [
+        "name",
+        "number_of_employees",
+        "number_of_departments",
+        "number_of_projects",
+        "created_at",
+    ]
 
     def get_serializer_class(self):
         if self.request.method == "GET":
@@ -17,8 +51,20 @@ class CompanyAPIView(ModelViewSet):
         return CompanySerializer
 
     def get_queryset(self):
+        # ``?exact_counts=1`` recounts with one correlated subquery per child
+        # table; by default the maintained number_of_* columns are served.
+        if self.request.query_params.get("exact_counts") in ("1", "true"):
+            return self.queryset.annotate(
+                num_of_employee=count_children(Employee),
+                num_of_department=count_children(Department),
+                num_of_project=count_children(Project),
+            )
         return self.queryset.annotate(
-            num_of_employee=Count("company_employee", distinct=True),
-            num_of_department=Count("departments", distinct=True),
-            num_of_project=Count("company_projects", distinct=True),
+            num_of_employee=F("number_of_employees"),
+            num_of_department=F("number_of_departments"),
+            num_of_project=F("number_of_projects"),
         )
+
+    def perform_destroy(self, instance):
+        with counters.deferred():
+            instance.delete()
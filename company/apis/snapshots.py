@@ -0,0 +1,92 @@
+from django.db.models import Sum
+from django.utils.dateparse import parse_date
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.generics import ListAPIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from company.models import DailySnapshot
+from company.serializers import DailySnapshotSerializer
+from user import scope
+from user.permission import IsAdminOrManager
+
+TOTAL_FIELDS = [
+    field.name
+    for field in DailySnapshot._meta.concrete_fields
+    if field.name not in ("id", "date", "company", "department")
+]
+MAX_RANGE_DAYS = 366
+
+
+class DailySnapshotAPIView(ListAPIView):
+    """
+    ``GET /api/snapshots/?date__gte=...&date__lte=...`` lists the rows written
+    by ``build_snapshots``; ``?group_by=company`` sums departments per company
+    and day. Both bounds (or ``date__range``) are required and may span at
+    most ``MAX_RANGE_DAYS`` days. Managers only get their own company's rows.
+    """
+
+    permission_classes = [IsAuthenticated, IsAdminOrManager]
+    queryset = DailySnapshot.objects.order_by("date", "company_id", "department_id")
+    serializer_class = DailySnapshotSerializer
+    # Rows have no created_at to page on; the required date range bounds the
+    # result instead.
+    pagination_class = None
+    filter_fields = {
+        "date": ["exact", "gte", "lte", "range"],
+        "company": ["exact", "in"],
+        "department": ["exact", "in"],
+    }
+    ordering_fields = ["date"]
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.request.user.role != "admin":
+            return scope.company_rows(queryset, self.request.user)
+        return queryset
+
+    def check_company(self, request):
+        if request.user.role == "admin":
+            return
+        own_company = scope.get_scope(request.user)[1]
+        params = request.query_params
+        requested = [params["company"]] if "company" in params else []
+        if "company__in" in params:
+            requested += params["company__in"].split(",")
+        if own_company is None or any(value != str(own_company) for value in requested):
+            raise PermissionDenied("Snapshots are limited to your own company.")
+
+    def check_date_range(self, request):
+        params = request.query_params
+        if "date__range" in params:
+            bounds = params["date__range"].split(",")
+        else:
+            bounds = [params.get("date__gte"), params.get("date__lte")]
+        try:
+            start, end = (parse_date(bound or "") for bound in bounds)
+        except ValueError:
+            start = end = None
+        if start is None or end is None:
+            raise ValidationError(
+                {"date": ["Pass date__gte and date__lte (YYYY-MM-DD)."]}
+            )
+        if not 0 <= (end - start).days < MAX_RANGE_DAYS:
+            raise ValidationError(
+                {"date": [f"The range must span 1 to {MAX_RANGE_DAYS} days."]}
+            )
+
+    def list(self, request, *args, **kwargs):
+        self.check_company(request)
+        self.check_date_range(request)
+        group_by = request.query_params.get("group_by")
+        if group_by is None:
+            return super().list(request, *args, **kwargs)
+        if group_by != "company":
+            raise ValidationError({"group_by": ["Only 'company' is supported."]})
+        rows = (
+            self.filter_queryset(self.get_queryset())
+            .values("date", "company")
+            .annotate(**{name: Sum(name) for name in TOTAL_FIELDS})
+            .order_by("date", "company")
+        )
+        return Response(list(rows))
@@ -8,3 +8,17 @@ class Stages(models.TextChoices):
     UNDER_APPROVAL = "under_approval", "Under Approval"
     REVIEW_APPROVED = "review_approved", "Review Approved"
     REVIEW_REJECTED = "review_rejected", "Review Rejected"
+
+
+# Allowed moves between review stages, keyed by the current stage.
+STAGE_TRANSITIONS = {
+    Stages.PENDING_REVIEW: frozenset({Stages.REVIEW_SCHEDULED}),
+    Stages.REVIEW_SCHEDULED: frozenset({Stages.FEEDBACK_PROVIDED}),
+    Stages.FEEDBACK_PROVIDED: frozenset({Stages.UNDER_APPROVAL}),
+    Stages.UNDER_APPROVAL: frozenset({Stages.REVIEW_APPROVED, Stages.REVIEW_REJECTED}),
+    Stages.REVIEW_REJECTED: frozenset({Stages.FEEDBACK_PROVIDED}),
+}
+
+
+def can_transition(stage, new_stage):
+    return new_stage in STAGE_TRANSITIONS.get(stage, ())
@@ -0,0 +1,170 @@
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+
+from django.db import transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+from common import response_cache
+from company.models import Company, Department, Project
+from user.models import Employee
+
+# child model -> {foreign key attname: (parent model, counter field)}
+COUNTED_RELATIONS = {
+    Department: {"company_id": (Company, "number_of_departments")},
+    Project: {
+        "company_id": (Company, "number_of_projects"),
+        "department_id": (Department, "number_of_projects"),
+    },
+    Employee: {
+        "company_id": (Company, "number_of_employees"),
+        "department_id": (Department, "number_of_employees"),
+    },
+}
+
+_state = threading.local()
+
+
+def adjust(model, pk, **deltas):
+    """
+    Apply ``deltas`` to the counter columns of ``model`` row ``pk`` with a
+    single ``UPDATE ... SET field = field + delta``. Inside ``deferred()`` the
+    deltas are accumulated and written once per parent row on exit.
+    """
+    if pk is None:
+        return
+    pending = getattr(_state, "pending", None)
+    if pending is not None:
+        bucket = pending.setdefault((model, pk), defaultdict(int))
+        for field, delta in deltas.items():
+            bucket[field] += delta
+        return
+    _apply(model, pk, deltas)
+
+
+def _apply(model, pk, deltas):
+    changes = {field: F(field) + delta for field, delta in deltas.items() if delta}
+    if changes:
+        model.objects.filter(pk=pk).update(updated_at=timezone.now(), **changes)
+
+
+@contextmanager
+def deferred():
+    """Coalesce every counter change made in the block into one UPDATE per parent."""
+    if getattr(_state, "pending", None) is not None:
+        yield
+        return
+    _state.pending = {}
+    try:
+        with transaction.atomic():
+            yield
+            pending, _state.pending = _state.pending, None
+            for (model, pk), deltas in pending.items():
+                _apply(model, pk, deltas)
+    finally:
+        _state.pending = None
+
+
+def track_create(instance):
+    for attname, (parent, field) in COUNTED_RELATIONS[type(instance)].items():
+        adjust(parent, getattr(instance, attname), **{field: 1})
+
+
+def track_delete(instance):
+    for attname, (parent, field) in COUNTED_RELATIONS[type(instance)].items():
+        adjust(parent, getattr(instance, attname), **{field: -1})
+
+
+def track_move(instance, original):
+    """Move ``instance`` between parents given its ``original`` FK values."""
+    model = type(instance)
+    track_moves(
+        model,
+        {
+            attname: {instance.pk: (original[attname], getattr(instance, attname))}
+            for attname in COUNTED_RELATIONS[model]
+            if attname in original
+        },
+    )
+
+
+def track_moves(model, moves):
+    """
+    Move rows of ``model`` between parents before they are written; call it
+    inside the transaction that writes them. ``moves`` maps an FK attname to
+    ``{pk: (old, new)}``.
+
+    Each ``(old, new)`` pair is one ``UPDATE ... WHERE pk IN (...) AND
+    fk = <old>``, so when two stale copies move the same row only the move
+    that actually changed it is counted. Rows that had already left ``old``
+    are re-read in one query and moved from their current parent.
+    """
+    for attname, (parent, field) in COUNTED_RELATIONS[model].items():
+        pending = {
+            pk: (old, new)
+            for pk, (old, new) in moves.get(attname, {}).items()
+            if old != new
+        }
+        while pending:
+            pairs = defaultdict(list)
+            for pk, pair in pending.items():
+                pairs[pair].append(pk)
+            missed = []
+            for (old, new), pks in pairs.items():
+                moved = model.objects.filter(pk__in=pks, **{attname: old}).update(
+                    **{attname: new}
+                )
+                if moved:
+                    adjust(parent, old, **{field: -moved})
+                    adjust(parent, new, **{field: moved})
+                if moved < len(pks):
+                    missed.extend(pks)
+            if not missed:
+                break
+            # Rows already on their new parent were moved by someone else and
+            # deleted rows were counted by the delete; the rest move from
+            # wherever they are now.
+            targets = moves[attname]
+            current = model.objects.filter(pk__in=missed).values_list("pk", attname)
+            pending = {
+                pk: (old, targets[pk][1])
+                for pk, old in current
+                if old != targets[pk][1]
+            }
+
+
+def reconcile(dry_run=False, batch_size=1000):
+    """
+    Recompute every counter with one grouped aggregate per child table and
+    write back only the parent rows that drifted. Returns ``{label: fixed}``.
+    """
+    expected = defaultdict(lambda: defaultdict(dict))
+    for child, relations in COUNTED_RELATIONS.items():
+        for attname, (parent, field) in relations.items():
+            rows = (
+                child.objects.order_by()
+                .values(attname)
+                .annotate(total=Count("pk"))
+                .values_list(attname, "total")
+            )
+            expected[parent][field] = dict(rows)
+
+    fixed = {}
+    for parent, fields in expected.items():
+        names = list(fields)
+        drifted = []
+        for row in parent.objects.only("pk", *names).iterator(chunk_size=batch_size):
+            changed = False
+            for name in names:
+                value = fields[name].get(row.pk, 0)
+                if getattr(row, name) != value:
+                    setattr(row, name, value)
+                    changed = True
+            if changed:
+                drifted.append(row)
+        if drifted and not dry_run:
+            parent.objects.bulk_update(drifted, names, batch_size=batch_size)
+            response_cache.bump(parent)
+        fixed[parent._meta.label] = len(drifted)
+    return fixed
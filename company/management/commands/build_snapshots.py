@@ -0,0 +1,30 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand
+
+from company import snapshots
+
+
+class Command(BaseCommand):
+    help = "Materialize daily per-department snapshots for days not yet written."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--since",
+            type=date.fromisoformat,
+            help="Rebuild from this date (YYYY-MM-DD), replacing existing rows.",
+        )
+        parser.add_argument(
+            "--until",
+            type=date.fromisoformat,
+            help="Last day to materialize (YYYY-MM-DD); defaults to yesterday.",
+        )
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        built = snapshots.build(
+            since=options["since"],
+            until=options["until"],
+            batch_size=options["batch_size"],
+        )
+        self.stdout.write(f"wrote {built['rows']} row(s) for {built['days']} day(s)")
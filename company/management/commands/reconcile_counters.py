@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from company import counters
+
+
+class Command(BaseCommand):
+    help = "Recompute the denormalized number_of_* counters on Company and Department."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report drifted rows without writing them.",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        fixed = counters.reconcile(
+            dry_run=options["dry_run"], batch_size=options["batch_size"]
+        )
+        verb = "would fix" if options["dry_run"] else "fixed"
+        for label, count in fixed.items():
+            self.stdout.write(f"{label}: {verb} {count} row(s)")
@@ -0,0 +1,72 @@
+# Generated by Django 5.2.5 on 2026-10-18 07:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("company", "0004_performancereview"),
+        ("user", "0004_remove_employee_days_employed_employee_hired_on"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="company",
+            index=models.Index(fields=["created_at", "id"], name="company_keyset_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="department",
+            index=models.Index(
+                fields=["created_at", "id"], name="department_keyset_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="performancereview",
+            index=models.Index(
+                fields=["employee", "stage"], name="review_employee_stage_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="performancereview",
+            index=models.Index(
+                fields=["stage", "scheduled_date"], name="review_stage_date_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="performancereview",
+            index=models.Index(fields=["created_at", "id"], name="review_keyset_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                fields=["company", "is_active"], name="project_company_active_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                fields=["start_date", "end_date"], name="project_dates_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["department"],
+                name="project_active_dept_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["start_date"],
+                name="project_active_start_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(fields=["created_at", "id"], name="project_keyset_idx"),
+        ),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 5.2.5 on 2026-10-18 08:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("company", "0005_query_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailySnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField(verbose_name="Date")),
+                (
+                    "headcount",
+                    models.PositiveIntegerField(default=0, verbose_name="Headcount"),
+                ),
+                (
+                    "active_projects",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Active projects"
+                    ),
+                ),
+                ("reviews_pending_review", models.PositiveIntegerField(default=0)),
+                ("reviews_review_scheduled", models.PositiveIntegerField(default=0)),
+                ("reviews_feedback_provided", models.PositiveIntegerField(default=0)),
+                ("reviews_under_approval", models.PositiveIntegerField(default=0)),
+                ("reviews_review_approved", models.PositiveIntegerField(default=0)),
+                ("reviews_review_rejected", models.PositiveIntegerField(default=0)),
+                (
+                    "company",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_snapshots",
+                        to="company.company",
+                    ),
+                ),
+                (
+                    "department",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_snapshots",
+                        to="company.department",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Daily Snapshot",
+                "verbose_name_plural": "Daily Snapshots",
+                "indexes": [
+                    models.Index(
+                        fields=["company", "date"], name="snapshot_company_date_idx"
+                    ),
+                    models.Index(fields=["date"], name="snapshot_date_idx"),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("department", "date"),
+                        name="snapshot_department_date_uniq",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.5 on 2026-10-18 09:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("company", "0006_dailysnapshot"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="dailysnapshot",
+            name="company",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="daily_snapshots",
+                to="company.company",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="dailysnapshot",
+            name="department",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="daily_snapshots",
+                to="company.department",
+            ),
+        ),
+    ]
@@ -1,8 +1,11 @@
 from django.db import models
+from django.db.models import Q
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
-from common.models import TimeStampedModel
-from company.choices import Stages
+from common import response_cache
+from common.models import CountedModel, TimeStampedModel
+from company.choices import Stages, can_transition
 
 
 # Create your models here.
@@ -17,9 +20,10 @@ class Company(TimeStampedModel):
     class Meta:
         verbose_name = _("Company")
         verbose_name_plural = _("Companies")
+        indexes = [models.Index(fields=["created_at", "id"], name="company_keyset_idx")]
 
 
-class Department(TimeStampedModel):
+class Department(CountedModel):
     company = models.ForeignKey(
         Company, on_delete=models.CASCADE, related_name="departments"
     )
@@ -30,9 +34,12 @@ class Department(TimeStampedModel):
     class Meta:
         verbose_name = _("Department")
         verbose_name_plural = _("Departments")
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="department_keyset_idx")
+        ]
 
 
-class Project(TimeStampedModel):
+class Project(CountedModel):
     company = models.ForeignKey(
         Company, on_delete=models.CASCADE, related_name="company_projects"
     )
@@ -52,6 +59,23 @@ class Project(TimeStampedModel):
     class Meta:
         verbose_name = _("Project")
         verbose_name_plural = _("Projects")
+        indexes = [
+            models.Index(
+                fields=["company", "is_active"], name="project_company_active_idx"
+            ),
+            models.Index(fields=["start_date", "end_date"], name="project_dates_idx"),
+            models.Index(
+                fields=["department"],
+                condition=Q(is_active=True),
+                name="project_active_dept_idx",
+            ),
+            models.Index(
+                fields=["start_date"],
+                condition=Q(is_active=True),
+                name="project_active_start_idx",
+            ),
+            models.Index(fields=["created_at", "id"], name="project_keyset_idx"),
+        ]
 
 
 class ProjectEmployee(models.Model):
@@ -69,6 +93,15 @@ class ProjectEmployee(models.Model):
         unique_together = ("project", "employee")
 
 
+class StageConflict(Exception):
+    """The review's stage changed after it was loaded."""
+
+    def __init__(self, pk, expected):
+        super().__init__(f"Review {pk} is no longer in stage {expected}")
+        self.pk = pk
+        self.expected = expected
+
+
 class PerformanceReview(TimeStampedModel):
     employee = models.ForeignKey(
         "user.Employee",
@@ -85,20 +118,78 @@ class PerformanceReview(TimeStampedModel):
         verbose_name = _("Performance Review")
         verbose_name_plural = _("Performance Reviews")
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["employee", "stage"], name="review_employee_stage_idx"
+            ),
+            models.Index(
+                fields=["stage", "scheduled_date"], name="review_stage_date_idx"
+            ),
+            models.Index(fields=["created_at", "id"], name="review_keyset_idx"),
+        ]
 
     def can_transition(self, new_stage):
-        allowed_transitions = {
-            Stages.PENDING_REVIEW: [Stages.REVIEW_SCHEDULED],
-            Stages.REVIEW_SCHEDULED: [Stages.FEEDBACK_PROVIDED],
-            Stages.FEEDBACK_PROVIDED: [Stages.UNDER_APPROVAL],
-            Stages.UNDER_APPROVAL: [Stages.REVIEW_APPROVED, Stages.REVIEW_REJECTED],
-            Stages.REVIEW_REJECTED: [Stages.FEEDBACK_PROVIDED],
-        }
-        return new_stage in allowed_transitions.get(self.stage, [])
+        return can_transition(self.stage, new_stage)
 
     def update_stage(self, new_stage):
-        if self.can_transition(new_stage):
-            self.stage = new_stage
-            self.save()
-            return True
-        return False
+        """
+        Move to ``new_stage`` if allowed from the loaded stage. The write is a
+        compare-and-swap on that stage and touches no other column, so it
+        raises ``StageConflict`` instead of overwriting a concurrent change.
+        """
+        if not self.can_transition(new_stage):
+            return False
+        now = timezone.now()
+        updated = PerformanceReview.objects.filter(pk=self.pk, stage=self.stage).update(
+            stage=new_stage, updated_at=now
+        )
+        if not updated:
+            raise StageConflict(self.pk, self.stage)
+        self.stage, self.updated_at = new_stage, now
+        # QuerySet.update() sends no post_save.
+        response_cache.bump(PerformanceReview)
+        return True
+
+
+class DailySnapshot(models.Model):
+    """
+    End-of-day aggregates per department, written by ``build_snapshots``.
+    Review counts are split per stage so range queries read a single row.
+    """
+
+    date = models.DateField(_("Date"))
+    # History outlives the rows it describes: deleting a company or department
+    # must not cascade into years of snapshots.
+    company = models.ForeignKey(
+        Company,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="daily_snapshots",
+    )
+    department = models.ForeignKey(
+        Department,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="daily_snapshots",
+    )
+    headcount = models.PositiveIntegerField(_("Headcount"), default=0)
+    active_projects = models.PositiveIntegerField(_("Active projects"), default=0)
+    reviews_pending_review = models.PositiveIntegerField(default=0)
+    reviews_review_scheduled = models.PositiveIntegerField(default=0)
+    reviews_feedback_provided = models.PositiveIntegerField(default=0)
+    reviews_under_approval = models.PositiveIntegerField(default=0)
+    reviews_review_approved = models.PositiveIntegerField(default=0)
+    reviews_review_rejected = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = _("Daily Snapshot")
+        verbose_name_plural = _("Daily Snapshots")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["department", "date"], name="snapshot_department_date_uniq"
+            )
+        ]
+        indexes = [
+            models.Index(fields=["company", "date"], name="snapshot_company_date_idx"),
+            models.Index(fields=["date"], name="snapshot_date_idx"),
+        ]
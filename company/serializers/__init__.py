@@ -7,4 +7,5 @@ from .common import (
     ProjectEmployeeSerializer,
     PerformanceReviewSerializer,
     ReadPerformanceReviewSerializer,
+    DailySnapshotSerializer,
 )
@@ -1,20 +1,21 @@
 from rest_framework import serializers
 
-from company.models import Department, Project, ProjectEmployee, PerformanceReview
+from common.serializers import UpdateFieldsModelSerializer
 
+from company.models import (
+    DailySnapshot,
+    Department,
+    Project,
+    ProjectEmployee,
+    PerformanceReview,
+)
 
-class DepartmentSerializer(serializers.ModelSerializer):
+
+class DepartmentSerializer(UpdateFieldsModelSerializer):
     class Meta:
         model = Department
         fields = "__all__"
 
-    def create(self, validated_data):
-        company = validated_data["company"]
-        department = Department.objects.create(**validated_data)
-        company.number_of_departments = company.departments.count()
-        company.save()
-        return department
-
 
 class ReadDepartmentSerializer(serializers.Serializer):
     id = serializers.IntegerField()
@@ -24,21 +25,11 @@ class ReadDepartmentSerializer(serializers.Serializer):
     number_of_projects = serializers.IntegerField()
 
 
-class ProjectSerializer(serializers.ModelSerializer):
+class ProjectSerializer(UpdateFieldsModelSerializer):
     class Meta:
         model = Project
         fields = "__all__"
 
-    def create(self, validated_data):
-        company = validated_data["company"]
-        department = validated_data["department"]
-        project = Project.objects.create(**validated_data)
-        company.number_of_projects = company.company_projects.count()
-        department.number_of_projects = department.department_projects.count()
-        company.save()
-        department.save()
-        return project
-
 
 class ReadProjectSerializer(serializers.Serializer):
     id = serializers.IntegerField()
@@ -59,14 +50,13 @@ class ProjectEmployeeSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         project = validated_data["project"]
-        employee = validated_data["employee"]
         assignment = ProjectEmployee.objects.create(**validated_data)
-        project.number_of_employees = project.project_employees.count()
-        project.save()
+        # Project has no stored employee count; only mark it as changed.
+        project.save(update_fields=["updated_at"])
         return assignment
 
 
-class PerformanceReviewSerializer(serializers.ModelSerializer):
+class PerformanceReviewSerializer(UpdateFieldsModelSerializer):
 
     class Meta:
         model = PerformanceReview
@@ -81,3 +71,9 @@ class ReadPerformanceReviewSerializer(serializers.Serializer):
     feedback = serializers.CharField()
     created_at = serializers.DateTimeField()
     updated_at = serializers.DateTimeField()
+
+
+class DailySnapshotSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = DailySnapshot
+        exclude = ["id"]
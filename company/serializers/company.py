@@ -1,9 +1,11 @@
 from rest_framework import serializers
 
+from common.serializers import UpdateFieldsModelSerializer
+
 from company.models import Company
 
 
-class CompanySerializer(serializers.ModelSerializer):
+class CompanySerializer(UpdateFieldsModelSerializer):
     class Meta:
         model = Company
         fields = "__all__"
@@ -0,0 +1,47 @@
+from django.db.models.signals import post_delete, post_init, post_save, pre_save
+
+from company import counters
+
+
+def remember_parents(sender, instance, **kwargs):
+    # Only fields already loaded are remembered so deferred fields never
+    # trigger a query.
+    instance._counted_parents = {
+        attname: instance.__dict__[attname]
+        for attname in counters.COUNTED_RELATIONS[sender]
+        if attname in instance.__dict__
+    }
+
+
+def move_counters_before_save(
+    sender, instance, raw=False, update_fields=None, **kwargs
+):
+    if instance._state.adding or raw:
+        return
+    original = getattr(instance, "_counted_parents", {})
+    if update_fields is not None:
+        # Only the foreign keys this save writes can move.
+        original = {
+            attname: value
+            for attname, value in original.items()
+            if attname in update_fields or attname.removesuffix("_id") in update_fields
+        }
+    counters.track_move(instance, original)
+
+
+def update_counters_on_save(sender, instance, created, **kwargs):
+    if created:
+        counters.track_create(instance)
+    remember_parents(sender, instance)
+
+
+def update_counters_on_delete(sender, instance, **kwargs):
+    counters.track_delete(instance)
+
+
+def connect():
+    for model in counters.COUNTED_RELATIONS:
+        post_init.connect(remember_parents, sender=model)
+        pre_save.connect(move_counters_before_save, sender=model)
+        post_save.connect(update_counters_on_save, sender=model)
+        post_delete.connect(update_counters_on_delete, sender=model)
@@ -0,0 +1,140 @@
+"""
+Daily per-department aggregates behind ``/api/snapshots/``.
+
+``build()`` materializes one ``DailySnapshot`` row per department and day,
+starting after the last day already written, so a nightly
+``manage.py build_snapshots`` only adds the days since its previous run.
+The whole history is read with four grouped queries (departments, hires,
+active projects, reviews) and replayed in Python as running totals, so the
+cost does not grow with the number of days being written.
+
+Past days are reconstructed from the current rows: an employee counts from
+``hired_on`` (or the day the row was created), an active project from
+``start_date`` through ``end_date`` and a review from its creation day in its
+current stage. Projects without a department are not attributed to any row.
+"""
+
+from collections import Counter, defaultdict
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Count, Max
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+from company.choices import Stages
+from company.models import DailySnapshot, Department, PerformanceReview, Project
+from user.models import Employee
+
+ONE_DAY = timedelta(days=1)
+REVIEW_FIELDS = {stage: f"reviews_{stage}" for stage in Stages.values}
+
+
+def get_changes():
+    """Return ``{day: [(department_id, field, delta), ...]}`` for all history."""
+    changes = defaultdict(list)
+
+    hires = (
+        Employee.objects.order_by()
+        .values("department_id", day=Coalesce("hired_on", TruncDate("created_at")))
+        .annotate(total=Count("pk"))
+    )
+    for row in hires:
+        changes[row["day"]].append((row["department_id"], "headcount", row["total"]))
+
+    active = (
+        Project.objects.order_by()
+        .filter(is_active=True, department__isnull=False)
+        .values(
+            "department_id",
+            "end_date",
+            day=Coalesce("start_date", TruncDate("created_at")),
+        )
+        .annotate(total=Count("pk"))
+    )
+    for row in active:
+        start, end = row["day"], row["end_date"]
+        if end is not None and end < start:
+            continue
+        changes[start].append((row["department_id"], "active_projects", row["total"]))
+        if end is not None:
+            changes[end + ONE_DAY].append(
+                (row["department_id"], "active_projects", -row["total"])
+            )
+
+    reviews = (
+        PerformanceReview.objects.order_by()
+        .values("employee__department_id", "stage", day=TruncDate("created_at"))
+        .annotate(total=Count("pk"))
+    )
+    for row in reviews:
+        changes[row["day"]].append(
+            (row["employee__department_id"], REVIEW_FIELDS[row["stage"]], row["total"])
+        )
+    return changes
+
+
+def build(since=None, until=None, batch_size=2000):
+    """
+    Write snapshots up to ``until`` (default: yesterday) and return
+    ``{"days": ..., "rows": ...}``.
+
+    Without ``since`` the build resumes after the last materialized day;
+    with it, rows from ``since`` on are replaced. Rows are flushed in
+    transactions that end on a day boundary, so an interrupted build leaves
+    only complete days behind and the next run picks up where it stopped.
+    """
+    until = until or timezone.localdate() - ONE_DAY
+    departments = list(
+        Department.objects.order_by("pk").values_list(
+            "pk", "company_id", TruncDate("created_at")
+        )
+    )
+    if not departments:
+        return {"days": 0, "rows": 0}
+
+    if since is None:
+        last = DailySnapshot.objects.aggregate(last=Max("date"))["last"]
+        start = last + ONE_DAY if last else min(row[2] for row in departments)
+    else:
+        start = since
+        DailySnapshot.objects.filter(date__gte=since).delete()
+    if start > until:
+        return {"days": 0, "rows": 0}
+
+    changes = get_changes()
+    pending = sorted(changes)
+    state = defaultdict(Counter)
+    position = 0
+    rows, written, days = [], 0, 0
+
+    def flush():
+        nonlocal rows, written
+        with transaction.atomic():
+            DailySnapshot.objects.bulk_create(rows)
+        written += len(rows)
+        rows = []
+
+    day = start
+    while day <= until:
+        while position < len(pending) and pending[position] <= day:
+            for department_id, field, delta in changes[pending[position]]:
+                state[department_id][field] += delta
+            position += 1
+        for department_id, company_id, created in departments:
+            if created <= day:
+                rows.append(
+                    DailySnapshot(
+                        date=day,
+                        company_id=company_id,
+                        department_id=department_id,
+                        **state[department_id],
+                    )
+                )
+        days += 1
+        if len(rows) >= batch_size:
+            flush()
+        day += ONE_DAY
+    if rows:
+        flush()
+    return {"days": days, "rows": written}
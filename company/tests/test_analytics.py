@@ -0,0 +1,139 @@
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.cache import caches
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from common.tests.base_test import BaseTest
+from company.models import Company, Department, PerformanceReview, Project
+from user.models import Employee, User
+
+
+@override_settings(ANALYTICS={"CACHE_TTL": 0})
+class AnalyticsAPITestCase(BaseTest):
+    def setUp(self):
+        super().setUp()
+        caches["default"].clear()
+        self.manager = User.objects.create(
+            email="test@manager.com",
+            username="test manager",
+            password=make_password(None),
+            role="admin",
+        )
+        self.client.force_authenticate(user=self.manager)
+        self.url = reverse("analytics")
+        self.today = timezone.localdate()
+        self.sequence = 0
+
+    def create_company(self, departments=2, employees=2, projects=1):
+        company = Company.objects.create(name=f"Company {self.sequence}")
+        for d in range(departments):
+            department = Department.objects.create(name=f"D{d}", company=company)
+            for e in range(employees):
+                self.sequence += 1
+                user = User.objects.create(
+                    email=f"user{self.sequence}@test.com",
+                    username=f"user {self.sequence}",
+                    password=make_password(None),
+                )
+                employee = Employee.objects.create(
+                    company=company,
+                    department=department,
+                    user=user,
+                    first_name="test",
+                    last_name=f"employee {self.sequence}",
+                    email=user.email,
+                    hired_on=self.today - timedelta(days=100 * (e + 1)),
+                )
+                PerformanceReview.objects.create(employee=employee)
+        for p in range(projects):
+            Project.objects.create(name=f"P{p}", company=company, is_active=p % 2 == 0)
+        self.sequence += 1
+        return company
+
+    def test_sections(self):
+        company = self.create_company(departments=2, employees=2, projects=3)
+        data = self.client.get(self.url).json()
+        self.assertEqual([row["headcount"] for row in data["headcount"]], [2, 2])
+        empty = Department.objects.create(name="Empty", company=company)
+        data = self.client.get(self.url).json()
+        self.assertEqual(
+            data["headcount"][-1],
+            {
+                "company_id": company.id,
+                "company": company.name,
+                "department_id": empty.id,
+                "department": "Empty",
+                "headcount": 0,
+            },
+        )
+        self.assertEqual(
+            data["projects"],
+            [
+                {
+                    "company_id": company.id,
+                    "company": company.name,
+                    "projects": 3,
+                    "active_projects": 2,
+                }
+            ],
+        )
+        self.assertEqual(data["tenure"]["average_days"], 150.0)
+        self.assertEqual(data["tenure"]["employees"], 4)
+        self.assertEqual(data["reviews"]["pending_review"], 4)
+        self.assertEqual(data["reviews"]["review_approved"], 0)
+
+    def test_single_section_and_company_filter(self):
+        first = self.create_company()
+        self.create_company(departments=1)
+        response = self.client.get(
+            reverse("analytics-section", args=["headcount"]), {"company": first.id}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual({row["company_id"] for row in response.json()}, {first.id})
+
+    def test_query_count_does_not_grow_with_companies(self):
+        self.create_company()
+        with self.assertNumQueries(5):
+            self.client.get(self.url)
+        for _ in range(5):
+            self.create_company()
+        with self.assertNumQueries(5):
+            self.client.get(self.url)
+
+    def test_results_are_cached(self):
+        self.create_company()
+        with self.settings(ANALYTICS={"CACHE_TTL": 60}):
+            self.client.get(self.url)
+            with self.assertNumQueries(0):
+                self.client.get(self.url)
+
+    def test_unknown_section(self):
+        response = self.client.get(reverse("analytics-section", args=["salary"]))
+        self.assertEqual(response.status_code, 404)
+
+    def test_managers_only_see_their_company(self):
+        first = self.create_company()
+        second = self.create_company(departments=1)
+        Employee.objects.filter(user__in=[self.user]).delete()
+        Employee.objects.create(
+            company=second,
+            department=Department.objects.filter(company=second).first(),
+            user=self.user,
+            first_name="test",
+            last_name="manager",
+            email=self.user.email,
+        )
+        self.user.role = "manager"
+        self.client.force_authenticate(user=self.user)
+        url = reverse("analytics-section", args=["headcount"])
+        response = self.client.get(url)
+        self.assertEqual({row["company_id"] for row in response.json()}, {second.id})
+        response = self.client.get(url, {"company": first.id})
+        self.assertEqual(response.status_code, 403)
+
+    def test_requires_admin_or_manager(self):
+        self.client.force_authenticate(user=self.user)
+        self.assertEqual(self.client.get(self.url).status_code, 403)
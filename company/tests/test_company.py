@@ -1,5 +1,10 @@
+from django.contrib.auth.hashers import make_password
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from common.tests.base_test import BaseTest
+from company.models import Company, Department, Project
+from user.models import Employee, User
 
 
 class CompanyAPITestCase(BaseTest):
@@ -53,3 +58,65 @@ class CompanyAPITestCase(BaseTest):
             reverse("company-detail", args=[company_id]), format="json"
         )
         self.assertEqual(get_response.status_code, 404)
+
+
+class CompanyCountsTestCase(BaseTest):
+    def setUp(self):
+        super().setUp()
+        self.company_url = reverse("company-list")
+        self.company = Company.objects.create(name="Counted Company")
+        Company.objects.create(name="Empty Company")
+        departments = [
+            Department.objects.create(name=f"Department {index}", company=self.company)
+            for index in range(3)
+        ]
+        for index in range(4):
+            Project.objects.create(
+                name=f"Project {index}",
+                company=self.company,
+                department=departments[index % 3],
+            )
+        for index in range(5):
+            user = User.objects.create(
+                email=f"user{index}@test.com",
+                username=f"user {index}",
+                password=make_password(None),
+            )
+            Employee.objects.create(
+                first_name="test",
+                last_name=f"employee {index}",
+                email=f"employee{index}@test.com",
+                user=user,
+                company=self.company,
+                department=departments[index % 3],
+            )
+
+    def test_stored_counts_match_exact_counts(self):
+        stored = self.client.get(self.company_url, format="json")
+        exact = self.client.get(f"{self.company_url}?exact_counts=1", format="json")
+        self.assertEqual(stored.status_code, 200)
+        self.assertEqual(exact.status_code, 200)
+        self.assertEqual(stored.data, exact.data)
+
+        counted = next(row for row in exact.data if row["id"] == self.company.id)
+        self.assertEqual(counted["num_of_employee"], 5)
+        self.assertEqual(counted["num_of_department"], 3)
+        self.assertEqual(counted["num_of_project"], 4)
+
+    def test_detail_counts_match_exact_counts(self):
+        detail_url = reverse("company-detail", args=[self.company.id])
+        stored = self.client.get(detail_url, format="json")
+        exact = self.client.get(f"{detail_url}?exact_counts=1", format="json")
+        self.assertEqual(stored.data, exact.data)
+
+    def test_stored_counts_do_not_join_children(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.company_url, format="json")
+        self.assertEqual(response.status_code, 200)
+        company_queries = [
+            query["sql"] for query in queries if "company_company" in query["sql"]
+        ]
+        # The conditional GET state query and the list itself.
+        self.assertEqual(len(company_queries), 2)
+        for sql in company_queries:
+            self.assertNotIn("JOIN", sql)
@@ -0,0 +1,155 @@
+from io import StringIO
+
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.db import IntegrityError
+from django.test import TestCase
+
+from company import counters
+from company.models import Company, Department, Project
+from user.models import Employee, User
+
+
+class CounterTestCase(TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(name="Test Company")
+        self.department = Department.objects.create(
+            name="Engineering", company=self.company
+        )
+        self.other_department = Department.objects.create(
+            name="Sales", company=self.company
+        )
+
+    def create_employee(self, index, department=None):
+        user = User.objects.create(
+            email=f"user{index}@test.com",
+            username=f"user {index}",
+            password=make_password(None),
+        )
+        return Employee.objects.create(
+            first_name="test",
+            last_name=f"employee {index}",
+            email=f"employee{index}@test.com",
+            user=user,
+            company=self.company,
+            department=department or self.department,
+        )
+
+    def refresh(self):
+        self.company.refresh_from_db()
+        self.department.refresh_from_db()
+        self.other_department.refresh_from_db()
+
+    def test_department_create_and_delete(self):
+        self.refresh()
+        self.assertEqual(self.company.number_of_departments, 2)
+        self.other_department.delete()
+        self.company.refresh_from_db()
+        self.assertEqual(self.company.number_of_departments, 1)
+
+    def test_employee_create_and_delete(self):
+        employee = self.create_employee(1)
+        self.create_employee(2)
+        self.refresh()
+        self.assertEqual(self.company.number_of_employees, 2)
+        self.assertEqual(self.department.number_of_employees, 2)
+
+        employee.delete()
+        self.refresh()
+        self.assertEqual(self.company.number_of_employees, 1)
+        self.assertEqual(self.department.number_of_employees, 1)
+
+    def test_employee_moving_department(self):
+        employee = self.create_employee(1)
+        employee = Employee.objects.get(pk=employee.pk)
+        employee.department = self.other_department
+        employee.save()
+        self.refresh()
+        self.assertEqual(self.company.number_of_employees, 1)
+        self.assertEqual(self.department.number_of_employees, 0)
+        self.assertEqual(self.other_department.number_of_employees, 1)
+
+    def test_moves_from_stale_copies(self):
+        employee = self.create_employee(1)
+        third = Department.objects.create(name="Support", company=self.company)
+        first = Employee.objects.get(pk=employee.pk)
+        second = Employee.objects.get(pk=employee.pk)
+        first.department = self.other_department
+        first.save()
+        # Still remembers Engineering, which the row has already left.
+        second.department = third
+        second.save()
+        self.refresh()
+        third.refresh_from_db()
+        self.assertEqual(self.department.number_of_employees, 0)
+        self.assertEqual(self.other_department.number_of_employees, 0)
+        self.assertEqual(third.number_of_employees, 1)
+
+    def test_failed_move_rolls_back_with_the_save(self):
+        employee = self.create_employee(1)
+        self.create_employee(2)
+        employee.department = self.other_department
+        employee.email = "employee2@test.com"
+        with self.assertRaises(IntegrityError):
+            employee.save()
+        self.refresh()
+        self.assertEqual(
+            Employee.objects.get(pk=employee.pk).department, self.department
+        )
+        self.assertEqual(self.department.number_of_employees, 2)
+        self.assertEqual(self.other_department.number_of_employees, 0)
+
+    def test_project_create_move_and_delete(self):
+        project = Project.objects.create(
+            name="Project", company=self.company, department=self.department
+        )
+        project.department = self.other_department
+        project.save()
+        self.refresh()
+        self.assertEqual(self.company.number_of_projects, 1)
+        self.assertEqual(self.department.number_of_projects, 0)
+        self.assertEqual(self.other_department.number_of_projects, 1)
+
+        project.delete()
+        self.refresh()
+        self.assertEqual(self.company.number_of_projects, 0)
+        self.assertEqual(self.other_department.number_of_projects, 0)
+
+    def test_deferred_writes_once_per_parent(self):
+        users = [
+            User.objects.create(
+                email=f"user{index}@test.com",
+                username=f"user {index}",
+                password=make_password(None),
+            )
+            for index in range(3)
+        ]
+        # Savepoints, 3 inserts, 3 search index upserts and 2 counter updates.
+        with self.assertNumQueries(10):
+            with counters.deferred():
+                for index, user in enumerate(users):
+                    Employee.objects.create(
+                        first_name="test",
+                        last_name=f"employee {index}",
+                        email=f"employee{index}@test.com",
+                        user=user,
+                        company=self.company,
+                        department=self.department,
+                    )
+        self.refresh()
+        self.assertEqual(self.company.number_of_employees, 3)
+        self.assertEqual(self.department.number_of_employees, 3)
+
+    def test_reconcile_command_fixes_drift(self):
+        self.create_employee(1)
+        Company.objects.update(number_of_employees=42, number_of_departments=0)
+        Department.objects.update(number_of_employees=7)
+
+        out = StringIO()
+        call_command("reconcile_counters", stdout=out)
+        self.refresh()
+        self.assertEqual(self.company.number_of_employees, 1)
+        self.assertEqual(self.company.number_of_departments, 2)
+        self.assertEqual(self.department.number_of_employees, 1)
+        self.assertEqual(self.other_department.number_of_employees, 0)
+        self.assertIn("company.Company: fixed 1 row(s)", out.getvalue())
@@ -1,7 +1,19 @@
+import json
+from unittest import mock
+
 from django.contrib.auth.hashers import make_password
 from django.urls import reverse
+from django.utils import timezone
+
 from common.tests.base_test import BaseTest
-from company.models import Company, Department, Project, PerformanceReview
+from company.models import (
+    Company,
+    Department,
+    Project,
+    PerformanceReview,
+    StageConflict,
+)
+from company.serializers import PerformanceReviewSerializer
 from user.models import Employee, User
 
 
@@ -94,6 +106,116 @@ class PerformanceReviewAPITestCase(BaseTest):
         )
         self.assertEqual(response.status_code, 403)
 
+    def test_stale_update_stage_conflicts(self):
+        review = PerformanceReview.objects.create(employee=self.employee)
+        first = PerformanceReview.objects.get(pk=review.pk)
+        second = PerformanceReview.objects.get(pk=review.pk)
+        first.feedback = "Kept"
+        first.save(update_fields=["feedback", "updated_at"])
+        with self.assertNumQueries(1):
+            self.assertTrue(second.update_stage("review_scheduled"))
+        with self.assertRaises(StageConflict):
+            first.update_stage("review_scheduled")
+        review.refresh_from_db()
+        self.assertEqual(review.stage, "review_scheduled")
+        self.assertEqual(review.feedback, "Kept")
+
+    def test_partial_update_keeps_concurrent_stage_change(self):
+        review = PerformanceReview.objects.create(employee=self.employee)
+        stale = PerformanceReview.objects.get(pk=review.pk)
+        review.update_stage("review_scheduled")
+        serializer = PerformanceReviewSerializer(
+            stale, data={"feedback": "Late"}, partial=True
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        review.refresh_from_db()
+        self.assertEqual(review.stage, "review_scheduled")
+        self.assertEqual(review.feedback, "Late")
+
+    def test_change_stage_conflict_returns_409(self):
+        self.client.force_authenticate(user=self.manager)
+        review = PerformanceReview.objects.create(employee=self.employee)
+        with mock.patch.object(
+            PerformanceReview,
+            "update_stage",
+            side_effect=StageConflict(review.pk, "pending_review"),
+        ):
+            response = self.client.post(
+                reverse("performance-review-change-stage", args=[review.id]),
+                {"stage": "review_scheduled"},
+                format="json",
+            )
+        self.assertEqual(response.status_code, 409)
+
+    def test_bulk_change_stage(self):
+        self.client.force_authenticate(user=self.manager)
+        scheduled = PerformanceReview.objects.create(
+            employee=self.employee, stage="review_scheduled"
+        )
+        rejected = PerformanceReview.objects.create(
+            employee=self.employee, stage="review_rejected", feedback="Redo"
+        )
+        pending = PerformanceReview.objects.create(employee=self.employee)
+        ids = [scheduled.id, rejected.id, pending.id, 0, "x"]
+        # One read, then one UPDATE per source stage inside a savepoint.
+        with self.assertNumQueries(5):
+            response = self.client.post(
+                reverse("performance-review-bulk-change-stage"),
+                {"ids": ids, "stage": "feedback_provided"},
+                format="json",
+            )
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual(
+            [result["status"] for result in response.data["results"]],
+            [200, 200, 400, 404, 404],
+        )
+        stages = dict(PerformanceReview.objects.values_list("pk", "stage"))
+        self.assertEqual(stages[scheduled.id], "feedback_provided")
+        self.assertEqual(stages[rejected.id], "feedback_provided")
+        self.assertEqual(stages[pending.id], "pending_review")
+        rejected.refresh_from_db()
+        self.assertEqual(rejected.feedback, "Redo")
+
+    def test_bulk_change_stage_reports_concurrent_changes(self):
+        self.client.force_authenticate(user=self.manager)
+        first = PerformanceReview.objects.create(employee=self.employee)
+        second = PerformanceReview.objects.create(employee=self.employee)
+        now = timezone.now()
+
+        def moved_by_someone_else():
+            # Runs between the read and the UPDATE.
+            PerformanceReview.objects.filter(pk=second.pk).update(
+                stage="review_scheduled"
+            )
+            return now
+
+        with mock.patch(
+            "company.apis.common.timezone.now", side_effect=moved_by_someone_else
+        ):
+            response = self.client.post(
+                reverse("performance-review-bulk-change-stage"),
+                {"ids": [first.id, second.id], "stage": "review_scheduled"},
+                format="json",
+            )
+        self.assertEqual(
+            [result["status"] for result in response.data["results"]], [200, 409]
+        )
+
+    def test_bulk_change_stage_validation(self):
+        url = reverse("performance-review-bulk-change-stage")
+        payload = {"ids": [1], "stage": "review_scheduled"}
+        self.client.force_authenticate(user=self.user)
+        self.assertEqual(self.client.post(url, payload, format="json").status_code, 403)
+        self.client.force_authenticate(user=self.manager)
+        for payload in (
+            {"ids": [1], "stage": "nope"},
+            {"ids": [], "stage": "review_scheduled"},
+        ):
+            self.assertEqual(
+                self.client.post(url, payload, format="json").status_code, 400
+            )
+
     def test_manager_can_view_reviews(self):
         self.client.force_authenticate(user=self.manager)
         PerformanceReview.objects.create(
@@ -102,3 +224,21 @@ class PerformanceReviewAPITestCase(BaseTest):
         response = self.client.get(self.performance_review_url, format="json")
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.data), 1)
+
+    def test_export_ndjson_streams_rows(self):
+        self.client.force_authenticate(user=self.manager)
+        PerformanceReview.objects.create(
+            employee=self.employee, scheduled_date="2025-09-01T10:00:00Z", feedback="OK"
+        )
+        response = self.client.get(
+            reverse("performance-review-export"), {"format": "ndjson"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 1)
+        row = json.loads(lines[0])
+        self.assertEqual(row["employee"], "test")
+        self.assertEqual(row["stage"], "pending_review")
+        self.assertEqual(row["scheduled_date"], "2025-09-01T10:00:00Z")
@@ -13,6 +13,15 @@ class ProjectAPITestCase(BaseTest):
         self.department = Department.objects.create(
             name="Test Department", company=self.company
         )
+        # Projects are scoped to the caller's company.
+        Employee.objects.create(
+            company=self.company,
+            department=self.department,
+            user=self.user,
+            first_name="test",
+            last_name="employee",
+            email="test@employee.com",
+        )
         self.project_data = {
             "name": "Test Project",
             "description": "A test project",
@@ -107,6 +116,26 @@ class ProjectAPITestCase(BaseTest):
             self.department.number_of_projects, initial_department_projects + 1
         )
 
+    def test_bulk_create_projects(self):
+        payload = [
+            {**self.project_data, "name": f"Project {index}"} for index in range(3)
+        ]
+        payload.append({**self.project_data, "company": 999999})
+        response = self.client.post(reverse("project-bulk"), payload, format="json")
+        self.assertEqual(response.status_code, 403)
+
+        self.user.role = "manager"
+        response = self.client.post(reverse("project-bulk"), payload, format="json")
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual(
+            [result["status"] for result in response.data["results"]],
+            [201, 201, 201, 400],
+        )
+        self.company.refresh_from_db()
+        self.department.refresh_from_db()
+        self.assertEqual(self.company.number_of_projects, 3)
+        self.assertEqual(self.department.number_of_projects, 3)
+
 
 class ProjectEmployeeAPITestCase(BaseTest):
     def setUp(self):
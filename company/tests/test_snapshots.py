@@ -0,0 +1,223 @@
+from datetime import date, datetime, timedelta
+from io import StringIO
+
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+from common.tests.base_test import BaseTest
+from company import snapshots
+from company.models import (
+    Company,
+    DailySnapshot,
+    Department,
+    PerformanceReview,
+    Project,
+)
+from user.models import Employee, User
+
+START = date(2025, 1, 1)
+
+
+def day(offset):
+    return START + timedelta(days=offset)
+
+
+def created_on(queryset, offset):
+    moment = timezone.make_aware(datetime.combine(day(offset), datetime.min.time()))
+    queryset.update(created_at=moment)
+
+
+class DailySnapshotTestCase(BaseTest):
+    def setUp(self):
+        super().setUp()
+        self.manager = User.objects.create(
+            email="test@manager.com",
+            username="test manager",
+            password=make_password(None),
+            role="manager",
+        )
+        self.company = Company.objects.create(name="Test Company")
+        self.department = Department.objects.create(
+            name="Test Department", company=self.company
+        )
+        self.other = Department.objects.create(
+            name="Other Department", company=self.company
+        )
+        created_on(Department.objects.filter(pk=self.department.pk), 0)
+        created_on(Department.objects.filter(pk=self.other.pk), 2)
+
+        for index, hired in enumerate([0, 1, 3]):
+            user = User.objects.create(
+                email=f"employee{index}@test.com",
+                username=f"employee {index}",
+                password=make_password(None),
+            )
+            employee = Employee.objects.create(
+                company=self.company,
+                department=self.department,
+                user=user,
+                first_name=f"employee {index}",
+                last_name="test",
+                email=user.email,
+                hired_on=day(hired),
+            )
+            review = PerformanceReview.objects.create(employee=employee)
+            created_on(PerformanceReview.objects.filter(pk=review.pk), hired)
+        Project.objects.create(
+            company=self.company,
+            department=self.department,
+            name="Short",
+            start_date=day(1),
+            end_date=day(2),
+        )
+        Project.objects.create(
+            company=self.company,
+            department=self.other,
+            name="Inactive",
+            start_date=day(0),
+            is_active=False,
+        )
+
+    def rows(self, department):
+        return list(
+            DailySnapshot.objects.filter(department=department)
+            .order_by("date")
+            .values_list(
+                "date", "headcount", "active_projects", "reviews_pending_review"
+            )
+        )
+
+    def test_running_totals(self):
+        result = snapshots.build(until=day(4))
+        self.assertEqual(result, {"days": 5, "rows": 8})
+        self.assertEqual(
+            self.rows(self.department),
+            [
+                (day(0), 1, 0, 1),
+                (day(1), 2, 1, 2),
+                (day(2), 2, 1, 2),
+                (day(3), 3, 0, 3),
+                (day(4), 3, 0, 3),
+            ],
+        )
+        self.assertEqual(
+            self.rows(self.other),
+            [(day(2), 0, 0, 0), (day(3), 0, 0, 0), (day(4), 0, 0, 0)],
+        )
+
+    def test_only_missing_days_are_built(self):
+        snapshots.build(until=day(2))
+        first = DailySnapshot.objects.get(department=self.department, date=day(2))
+        self.assertEqual(snapshots.build(until=day(2)), {"days": 0, "rows": 0})
+        # Five reads, then one INSERT wrapped in a savepoint.
+        with self.assertNumQueries(8):
+            self.assertEqual(
+                snapshots.build(until=day(4), batch_size=100), {"days": 2, "rows": 4}
+            )
+        self.assertEqual(
+            DailySnapshot.objects.get(department=self.department, date=day(2)).pk,
+            first.pk,
+        )
+
+    def test_since_rebuilds(self):
+        snapshots.build(until=day(4))
+        Employee.objects.filter(hired_on=day(3)).update(hired_on=day(2))
+        call_command(
+            "build_snapshots",
+            "--since=2025-01-02",
+            "--until=2025-01-05",
+            stdout=StringIO(),
+        )
+        self.assertEqual(
+            [row[1] for row in self.rows(self.department)], [1, 2, 3, 3, 3]
+        )
+
+    def employ_manager(self, company, department):
+        return Employee.objects.create(
+            company=company,
+            department=department,
+            user=self.manager,
+            first_name="test",
+            last_name="manager",
+            email=self.manager.email,
+        )
+
+    def test_api_range_and_group_by(self):
+        snapshots.build(until=day(4))
+        url = reverse("snapshots")
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 403)
+
+        self.employ_manager(self.company, self.other)
+        self.client.force_authenticate(user=self.manager)
+        response = self.client.get(
+            url,
+            {
+                "date__gte": "2025-01-03",
+                "date__lte": "2025-01-31",
+                "department": self.department.id,
+            },
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [(row["date"], row["headcount"]) for row in response.json()],
+            [("2025-01-03", 2), ("2025-01-04", 3), ("2025-01-05", 3)],
+        )
+
+        response = self.client.get(
+            url, {"group_by": "company", "date__range": "2025-01-03,2025-01-04"}
+        )
+        self.assertEqual(
+            [(row["date"], row["headcount"]) for row in response.json()],
+            [("2025-01-03", 2), ("2025-01-04", 3)],
+        )
+        self.assertEqual(response.json()[0]["company"], self.company.id)
+
+        response = self.client.get(
+            url, {"group_by": "department", "date__range": "2025-01-03,2025-01-04"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_managers_only_see_their_company(self):
+        snapshots.build(until=day(4))
+        other = Company.objects.create(name="Other Company")
+        self.employ_manager(other, Department.objects.create(name="D", company=other))
+        self.client.force_authenticate(user=self.manager)
+        url = reverse("snapshots")
+        week = {"date__gte": "2025-01-01", "date__lte": "2025-01-07"}
+        response = self.client.get(url, week)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [])
+        for params in ({"company": self.company.id}, {"company__in": self.company.id}):
+            with self.subTest(params=params):
+                response = self.client.get(url, {**week, **params})
+                self.assertEqual(response.status_code, 403)
+
+        self.manager.role = "admin"
+        response = self.client.get(url, {**week, "company": self.company.id})
+        self.assertEqual(len(response.json()), 8)
+
+    def test_api_requires_a_bounded_range(self):
+        self.employ_manager(self.company, self.other)
+        self.client.force_authenticate(user=self.manager)
+        url = reverse("snapshots")
+        for params in (
+            {},
+            {"date__gte": "2025-01-01"},
+            {"date__gte": "2025-01-01", "date__lte": "nope"},
+            {"date__gte": "2025-01-02", "date__lte": "2025-01-01"},
+            {"date__range": "2024-01-01,2025-01-01"},
+        ):
+            with self.subTest(params=params):
+                response = self.client.get(url, params)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("date", response.json())
+
+    def test_deleting_a_department_keeps_its_history(self):
+        snapshots.build(until=day(4))
+        Department.objects.filter(pk=self.other.pk).delete()
+        self.assertEqual(
+            DailySnapshot.objects.filter(department__isnull=True).count(), 3
+        )
@@ -1,12 +1,16 @@
 from django.urls import path
 from rest_framework.routers import DefaultRouter
 
+from common.async_views import async_read_urls
+
 from company.apis import (
+    AnalyticsAPIView,
     CompanyAPIView,
     DepartmentAPIView,
     ProjectAPIView,
     AssignProjectToEmployeeAPIView,
     PerformanceReviewAPIView,
+    DailySnapshotAPIView,
 )
 
 router = DefaultRouter()
@@ -18,10 +22,23 @@ router.register(
     r"performance-reviews", PerformanceReviewAPIView, basename="performance-review"
 )
 urlpatterns = [
+    path("analytics/", AnalyticsAPIView.as_view(), name="analytics"),
+    path(
+        "analytics/<str:section>/",
+        AnalyticsAPIView.as_view(),
+        name="analytics-section",
+    ),
+    path("snapshots/", DailySnapshotAPIView.as_view(), name="snapshots"),
     path(
         "project-assign-employee/",
         AssignProjectToEmployeeAPIView.as_view(),
         name="project-assign-employee",
     ),
 ]
+urlpatterns += async_read_urls("company", CompanyAPIView, "company")
+urlpatterns += async_read_urls("department", DepartmentAPIView, "department")
+urlpatterns += async_read_urls("project", ProjectAPIView, "project")
+urlpatterns += async_read_urls(
+    "performance-reviews", PerformanceReviewAPIView, "performance-review"
+)
 urlpatterns += router.urls
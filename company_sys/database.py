@@ -0,0 +1,84 @@
+"""
+``DATABASES["default"]`` from ``DB_*`` environment variables.
+
+``DB_ENGINE`` is ``sqlite`` (the bundled ``db.sqlite3``) or ``postgresql``.
+Connections are kept for ``DB_CONN_MAX_AGE`` seconds and health-checked
+before reuse. On PostgreSQL, ``DB_POOL=1`` switches to Django's native
+connection pool instead (psycopg 3 with ``psycopg_pool``; without it the
+persistent connections are kept), and ``DB_STATEMENT_TIMEOUT`` milliseconds
+cap every statement.
+
+Every SQLite connection switches to WAL with ``synchronous=NORMAL`` so
+readers never block the writer, waits up to ``DB_SQLITE_BUSY_TIMEOUT``
+milliseconds for the write lock instead of failing with "database is
+locked", and opens transactions with ``BEGIN IMMEDIATE``: a transaction that
+reads before it writes then takes the write lock up front rather than
+failing to upgrade a shared lock while another writer holds it.
+"""
+
+from importlib.util import find_spec
+
+from django.core.exceptions import ImproperlyConfigured
+
+ENGINES = {
+    "sqlite": "django.db.backends.sqlite3",
+    "postgresql": "django.db.backends.postgresql",
+}
+
+
+def flag(environ, name, default):
+    return environ.get(name, default) == "1"
+
+
+def sqlite_pragmas(environ):
+    return [
+        "journal_mode=WAL",
+        "synchronous=NORMAL",
+        f"busy_timeout={int(environ.get('DB_SQLITE_BUSY_TIMEOUT', 10000))}",
+        f"mmap_size={int(environ.get('DB_SQLITE_MMAP_SIZE', 128 * 2**20))}",
+        # Negative sizes are in KiB rather than pages.
+        f"cache_size=-{int(environ.get('DB_SQLITE_CACHE_SIZE', 64 * 2**10))}",
+    ]
+
+
+def database_settings(environ, base_dir):
+    engine = environ.get("DB_ENGINE", "sqlite")
+    if engine not in ENGINES:
+        raise ImproperlyConfigured(f"DB_ENGINE must be one of {', '.join(ENGINES)}")
+    database = {
+        "ENGINE": ENGINES[engine],
+        "CONN_MAX_AGE": int(environ.get("DB_CONN_MAX_AGE", 60)),
+        "CONN_HEALTH_CHECKS": flag(environ, "DB_CONN_HEALTH_CHECKS", "1"),
+        "OPTIONS": {},
+    }
+    if engine == "sqlite":
+        database["NAME"] = environ.get("DB_NAME", base_dir / "db.sqlite3")
+        database["OPTIONS"] = {
+            "init_command": ";".join(
+                f"PRAGMA {pragma}" for pragma in sqlite_pragmas(environ)
+            ),
+            "transaction_mode": "IMMEDIATE",
+        }
+        return database
+
+    database.update(
+        NAME=environ.get("DB_NAME", "company_sys"),
+        USER=environ.get("DB_USER", ""),
+        PASSWORD=environ.get("DB_PASSWORD", ""),
+        HOST=environ.get("DB_HOST", ""),
+        PORT=environ.get("DB_PORT", ""),
+    )
+    options = database["OPTIONS"]
+    statement_timeout = int(environ.get("DB_STATEMENT_TIMEOUT", 30000))
+    if statement_timeout:
+        options["options"] = f"-c statement_timeout={statement_timeout}"
+    if flag(environ, "DB_POOL", "") and find_spec("psycopg_pool") is not None:
+        # Pooled connections are returned to the pool at the end of each
+        # request; Django refuses a pool combined with CONN_MAX_AGE.
+        database["CONN_MAX_AGE"] = 0
+        options["pool"] = {
+            "min_size": int(environ.get("DB_POOL_MIN_SIZE", 2)),
+            "max_size": int(environ.get("DB_POOL_MAX_SIZE", 10)),
+            "timeout": int(environ.get("DB_POOL_TIMEOUT", 10)),
+        }
+    return database
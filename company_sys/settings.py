@@ -10,9 +10,13 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
+import os
 from datetime import timedelta
+from importlib.util import find_spec
 from pathlib import Path
 
+from company_sys.database import database_settings
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -46,6 +50,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "common.middleware.QueryMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -55,6 +60,11 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# Per-endpoint query/latency histograms, exposed at /api/metrics/.
+METRICS = {
+    "SERVER_TIMING": os.environ.get("METRICS_SERVER_TIMING", "") == "1",
+}
+
 ROOT_URLCONF = "company_sys.urls"
 
 TEMPLATES = [
@@ -78,13 +88,9 @@ WSGI_APPLICATION = "company_sys.wsgi.application"
 
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
+# Configured from DB_* environment variables, see company_sys/database.py.
 
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
-    }
-}
+DATABASES = {"default": database_settings(os.environ, BASE_DIR)}
 
 
 # Password validation
@@ -105,11 +111,93 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing
+# PASSWORD_HASHER_POLICY picks the hasher for new and re-hashed passwords;
+# the others stay listed so existing hashes verify and are upgraded on login.
+
+PASSWORD_HASHER_POLICY = os.environ.get("PASSWORD_HASHER_POLICY", "pbkdf2")
+if PASSWORD_HASHER_POLICY == "argon2" and find_spec("argon2") is None:
+    PASSWORD_HASHER_POLICY = "scrypt"
+
+_PASSWORD_HASHERS = {
+    "argon2": "user.hashers.TunedArgon2PasswordHasher",
+    "scrypt": "user.hashers.TunedScryptPasswordHasher",
+    "pbkdf2": "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+}
+PASSWORD_HASHERS = [_PASSWORD_HASHERS[PASSWORD_HASHER_POLICY]] + [
+    hasher
+    for policy, hasher in _PASSWORD_HASHERS.items()
+    if policy != PASSWORD_HASHER_POLICY
+]
+PASSWORD_HASHER_PARAMS = {
+    "scrypt": {
+        "work_factor": int(os.environ.get("SCRYPT_WORK_FACTOR", 2**14)),
+        "block_size": int(os.environ.get("SCRYPT_BLOCK_SIZE", 8)),
+        "parallelism": int(os.environ.get("SCRYPT_PARALLELISM", 1)),
+    },
+    "argon2": {
+        "time_cost": int(os.environ.get("ARGON2_TIME_COST", 2)),
+        "memory_cost": int(os.environ.get("ARGON2_MEMORY_COST", 65536)),
+        "parallelism": int(os.environ.get("ARGON2_PARALLELISM", 1)),
+    },
+}
+
+# Password checks of the async login view run in a pool of this many threads.
+LOGIN_THREAD_POOL_SIZE = int(os.environ.get("LOGIN_THREAD_POOL_SIZE", 4))
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "user.authentication.CachedJWTAuthentication",
     ],
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    "DEFAULT_PAGINATION_CLASS": "common.pagination.KeysetPagination",
+    "DEFAULT_FILTER_BACKENDS": [
+        "common.filters.FieldFilter",
+        "rest_framework.filters.OrderingFilter",
+    ],
+    # orjson when installed, otherwise the stdlib json module.
+    "DEFAULT_RENDERER_CLASSES": [
+        "common.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "common.renderers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
+}
+KEYSET_PAGINATION = {
+    "PAGE_SIZE": 50,
+    "MAX_PAGE_SIZE": 500,
+}
+# Rendered list/retrieve responses, invalidated per model on every write.
+RESPONSE_CACHE = {
+    # Unset: on only when ALIAS is a cache shared by every process.
+    "ENABLED": {"1": True, "0": False}.get(os.environ.get("RESPONSE_CACHE_ENABLED")),
+    # Any Django cache alias; use a shared backend (Redis, Memcached, file)
+    # when running several processes.
+    "ALIAS": "default",
+    "TIMEOUT": 300,
+}
+
+# Serve list endpoints from compiled values() queries instead of DRF
+# serializers; the JSON is the same.
+FAST_READ_SERIALIZERS = os.environ.get("FAST_READ_SERIALIZERS", "") == "1"
+# Unpaginated JSON lists longer than this are streamed in chunks of this many
+# rows instead of rendered at once, and skip the response cache (0 disables).
+JSON_STREAM_THRESHOLD = int(os.environ.get("JSON_STREAM_THRESHOLD", 2000))
+
+# /api/analytics/ results are cached for CACHE_TTL seconds (0 disables).
+ANALYTICS = {
+    "CACHE_TTL": int(os.environ.get("ANALYTICS_CACHE_TTL", "300")),
+    "CACHE_ALIAS": "default",
+}
+
+AUTH_USER_CACHE = {
+    "MAX_SIZE": 10000,
+    "TTL": 60,
+    # Name of a Django cache shared between processes, e.g. "default".
+    "BACKEND": None,
 }
 SPECTACULAR_SETTINGS = {
     "TITLE": "Your API Title",
@@ -19,6 +19,8 @@ from django.contrib import admin
 from django.urls import path, include
 from drf_spectacular.views import SpectacularSwaggerView, SpectacularAPIView
 
+from common.views import MetricsAPIView, SearchAPIView
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
@@ -27,6 +29,8 @@ urlpatterns = [
         SpectacularSwaggerView.as_view(url_name="schema"),
         name="swagger-ui",
     ),
+    path("api/metrics/", MetricsAPIView.as_view(), name="metrics"),
+    path("api/search/", SearchAPIView.as_view(), name="search"),
     path("api/user/", include("user.urls")),
     path("api/", include("company.urls")),
 ]
@@ -1,2 +1,2 @@
-from .login import LoginAPIView, RegisterAPI
+from .login import LoginAPIView, AsyncLoginView, RegisterAPI
 from .common import EmployeeAPIView
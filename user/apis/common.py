@@ -1,20 +1,76 @@
+from datetime import date
+
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.viewsets import ModelViewSet
 
-from user.models import Employee
+from common.bulk import BulkMixin
+from common.conditional import ConditionalGetMixin
+from common.export import ExportMixin
+from common.fast_read import FastReadMixin
+from common.filters import SparseFieldsMixin
+from common.response_cache import CachedResponseMixin
+from company.models import Company, Department
+from user import scope
+from user.models import Employee, User
 from user.permission import IsAdminOrManager
 from user.serializers import EmployeeSerializer, ReadEmployeeSerializer
 
 
-class EmployeeAPIView(ModelViewSet):
+class EmployeeAPIView(
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    SparseFieldsMixin,
+    BulkMixin,
+    ExportMixin,
+    FastReadMixin,
+    ModelViewSet,
+):
     permission_classes = [IsAuthenticated, IsAdminOrManager]
     queryset = Employee.objects.all()
     serializer_class = EmployeeSerializer
+    cache_dependencies = (Employee, Company, Department)
+    # Managers only see their own company's employees.
+    cache_per_user_roles = ("manager",)
+    row_scoped = True
+    page_size = 100
+    bulk_relations = {"company": Company, "department": Department, "user": User}
+    filter_fields = {
+        "company": ["exact", "in"],
+        "department": ["exact", "in"],
+        "position": ["exact", "in"],
+        "email": ["exact"],
+        "hired_on": ["exact", "gte", "lte", "range", "isnull"],
+    }
+    ordering_fields = ["first_name", "last_name", "hired_on", "created_at"]
+    sparse_field_sources = {"days_employed": ["hired_on"]}
+    conditional_changes_daily = True
+    export_fields = (
+        ("id", "id"),
+        ("first_name", "first_name"),
+        ("middle_name", "middle_name"),
+        ("last_name", "last_name"),
+        ("company", "company__name"),
+        ("department", "department__name"),
+        ("email", "email"),
+        ("mobile_number", "mobile_number"),
+        ("address", "address"),
+        ("position", "position"),
+        ("hired_on", "hired_on"),
+        ("days_employed", None),
+    )
 
     def get_queryset(self):
-        return self.queryset.select_related("company", "department").all()
+        queryset = self.queryset.select_related("company", "department").all()
+        if self.request.user.role == "manager":
+            return scope.company_rows(queryset, self.request.user)
+        return queryset
 
     def get_serializer_class(self):
         if self.request.method == "GET":
             return ReadEmployeeSerializer
         return EmployeeSerializer
+
+    def export_row(self, row):
+        hired_on = row["hired_on"]
+        row["days_employed"] = (date.today() - hired_on).days if hired_on else None
+        return row
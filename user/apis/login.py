@@ -1,3 +1,11 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.http import JsonResponse
+from django.views import View
 from rest_framework.views import APIView
 from rest_framework.generics import CreateAPIView
 from rest_framework.response import Response
@@ -27,6 +35,48 @@ class LoginAPIView(APIView):
         )
 
 
+login_executor = ThreadPoolExecutor(
+    max_workers=settings.LOGIN_THREAD_POOL_SIZE, thread_name_prefix="login"
+)
+
+
+class AsyncLoginView(View):
+    """
+    Async variant of ``LoginAPIView``. The CPU-bound password check runs in a
+    bounded thread pool (``LOGIN_THREAD_POOL_SIZE``) so the event loop keeps
+    serving other requests during a login storm.
+    """
+
+    http_method_names = ["post"]
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        view.csrf_exempt = True
+        return view
+
+    async def post(self, request):
+        try:
+            data = json.loads(request.body or b"{}")
+        except ValueError:
+            return JsonResponse({"detail": "JSON parse error"}, status=400)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(login_executor, self.login, request, data)
+
+    def login(self, request, data):
+        try:
+            serializer = LoginSerializer(data=data, context={"request": request})
+            if not serializer.is_valid():
+                return JsonResponse(serializer.errors, status=400)
+            refresh = RefreshToken.for_user(serializer.validated_data["user"])
+            return JsonResponse(
+                {"refresh": str(refresh), "access": str(refresh.access_token)},
+                status=200,
+            )
+        finally:
+            close_old_connections()
+
+
 class RegisterAPI(CreateAPIView):
     permission_classes = [AllowAny]
     queryset = User.objects.all()
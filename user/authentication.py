@@ -0,0 +1,138 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from common.cache import TTLCache
+from user.models import User
+
+SNAPSHOT_FIELDS = ("id", "email", "role", "is_active")
+
+
+def cache_config():
+    return {"MAX_SIZE": 10000, "TTL": 60, "BACKEND": None} | getattr(
+        settings, "AUTH_USER_CACHE", {}
+    )
+
+
+user_snapshots = TTLCache(cache_config()["MAX_SIZE"], cache_config()["TTL"])
+
+
+def shared_cache():
+    backend = cache_config()["BACKEND"]
+    return caches[backend] if backend else None
+
+
+def snapshot_key(user_id):
+    return f"auth-user:{user_id}"
+
+
+def get_snapshot(user_id):
+    # Tokens carry the id as a string while signals see the integer pk.
+    user_id = str(user_id)
+    shared = shared_cache()
+    if shared is None:
+        snapshot = user_snapshots.get(user_id)
+        if snapshot is None:
+            snapshot = load_snapshot(user_id)
+            if snapshot is not None:
+                user_snapshots.set(user_id, snapshot)
+        return snapshot
+    # A per-process copy would miss invalidations made by other processes,
+    # so with a shared backend it is the only tier.
+    snapshot = shared.get(snapshot_key(user_id))
+    if snapshot is None:
+        snapshot = load_snapshot(user_id)
+        if snapshot is not None:
+            shared.set(snapshot_key(user_id), snapshot, cache_config()["TTL"])
+    return snapshot
+
+
+async def aget_snapshot(user_id):
+    user_id = str(user_id)
+    shared = shared_cache()
+    if shared is None:
+        snapshot = user_snapshots.get(user_id)
+        if snapshot is None:
+            snapshot = await aload_snapshot(user_id)
+            if snapshot is not None:
+                user_snapshots.set(user_id, snapshot)
+        return snapshot
+    snapshot = await shared.aget(snapshot_key(user_id))
+    if snapshot is None:
+        snapshot = await aload_snapshot(user_id)
+        if snapshot is not None:
+            await shared.aset(snapshot_key(user_id), snapshot, cache_config()["TTL"])
+    return snapshot
+
+
+def load_snapshot(user_id):
+    return User.objects.filter(pk=user_id).values(*SNAPSHOT_FIELDS).first()
+
+
+async def aload_snapshot(user_id):
+    return await User.objects.filter(pk=user_id).values(*SNAPSHOT_FIELDS).afirst()
+
+
+def invalidate(user_id):
+    user_id = str(user_id)
+    user_snapshots.delete(user_id)
+    shared = shared_cache()
+    if shared is not None:
+        shared.delete(snapshot_key(user_id))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    ``JWTAuthentication`` that rebuilds ``request.user`` from a cached
+    ``(id, email, role, is_active)`` snapshot instead of a ``SELECT`` per
+    request. The snapshot lives in the Django cache named in
+    ``AUTH_USER_CACHE["BACKEND"]``, shared by every process, or without one
+    in a per-process TTL LRU, and is dropped whenever the ``User`` row is
+    saved or deleted.
+
+    The returned user only loads the snapshot fields; any other field is
+    deferred and read from the database on first access.
+    """
+
+    def get_user(self, validated_token):
+        if api_settings.CHECK_REVOKE_TOKEN or api_settings.USER_ID_FIELD != "id":
+            return super().get_user(validated_token)
+        return self.build_user(get_snapshot(self.get_user_id(validated_token)))
+
+    async def aauthenticate(self, request):
+        """``authenticate`` for async views; only a cache miss touches the DB."""
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = self.get_validated_token(raw_token)
+        if api_settings.CHECK_REVOKE_TOKEN or api_settings.USER_ID_FIELD != "id":
+            user = await sync_to_async(super().get_user)(validated_token)
+        else:
+            user_id = self.get_user_id(validated_token)
+            user = self.build_user(await aget_snapshot(user_id))
+        return user, validated_token
+
+    def get_user_id(self, validated_token):
+        try:
+            return validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(
+                _("Token contained no recognizable user identification")
+            ) from e
+
+    def build_user(self, snapshot):
+        if snapshot is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        if api_settings.CHECK_USER_IS_ACTIVE and not snapshot["is_active"]:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        # from_db() marks the other fields deferred, so reading one loads it
+        # instead of returning a model default.
+        return User.from_db(User.objects.db, list(snapshot), list(snapshot.values()))
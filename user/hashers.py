@@ -0,0 +1,38 @@
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher, ScryptPasswordHasher
+
+
+def hasher_params(algorithm):
+    return getattr(settings, "PASSWORD_HASHER_PARAMS", {}).get(algorithm, {})
+
+
+class TunedScryptPasswordHasher(ScryptPasswordHasher):
+    """Scrypt with cost parameters taken from ``PASSWORD_HASHER_PARAMS["scrypt"]``."""
+
+    @property
+    def work_factor(self):
+        return hasher_params("scrypt").get("work_factor", 2**14)
+
+    @property
+    def block_size(self):
+        return hasher_params("scrypt").get("block_size", 8)
+
+    @property
+    def parallelism(self):
+        return hasher_params("scrypt").get("parallelism", 1)
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """Argon2id with cost parameters taken from ``PASSWORD_HASHER_PARAMS["argon2"]``."""
+
+    @property
+    def time_cost(self):
+        return hasher_params("argon2").get("time_cost", 2)
+
+    @property
+    def memory_cost(self):
+        return hasher_params("argon2").get("memory_cost", 65536)
+
+    @property
+    def parallelism(self):
+        return hasher_params("argon2").get("parallelism", 1)
@@ -0,0 +1,254 @@
+import csv
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+
+import django
+from django.apps import apps
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils.dateparse import parse_date
+
+from common import response_cache, search
+from company import counters
+from company.models import Company, Department
+from user import scope
+from user.choices import UserRoles
+from user.models import Employee, User
+
+# Files are loaded in dependency order so every foreign key can be resolved
+# from the natural-key maps built by the previous steps.
+ENTITIES = {
+    "companies": Company,
+    "departments": Department,
+    "users": User,
+    "employees": Employee,
+}
+
+
+def read_rows(path):
+    with open(path, newline="", encoding="utf-8") as handle:
+        if Path(path).suffix in (".ndjson", ".jsonl"):
+            for line in handle:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from csv.DictReader(handle)
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def fingerprint(path):
+    """Identify an input file so a checkpoint is only resumed against it."""
+    stat = os.stat(path)
+    return {
+        "path": str(Path(path).resolve()),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+
+
+def setup_worker():
+    if not apps.ready:
+        django.setup()
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk import companies, departments, users and employees from CSV or "
+        "NDJSON files. Re-running after a failure resumes from the checkpoint "
+        "and skips rows whose natural key already exists."
+    )
+
+    def add_arguments(self, parser):
+        for entity in ENTITIES:
+            parser.add_argument(f"--{entity}", help=f"CSV/NDJSON file of {entity}")
+        parser.add_argument("--batch-size", type=int, default=2000)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count(),
+            help="Processes used to hash passwords; 0 hashes in-process.",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            default=".import_org.checkpoint.json",
+            help=(
+                "File recording how many rows of each input were committed, "
+                "with each input's path, size and mtime."
+            ),
+        )
+        parser.add_argument(
+            "--restart", action="store_true", help="Ignore an existing checkpoint."
+        )
+
+    def handle(self, *args, **options):
+        files = {entity: options[entity] for entity in ENTITIES if options[entity]}
+        if not files:
+            raise CommandError("Pass at least one of --companies, --departments, ...")
+
+        self.batch_size = options["batch_size"]
+        self.checkpoint_path = Path(options["checkpoint"])
+        self.checkpoint = {}
+        if self.checkpoint_path.exists() and not options["restart"]:
+            self.checkpoint = json.loads(self.checkpoint_path.read_text())
+        self.fingerprints = {
+            entity: fingerprint(path) for entity, path in files.items()
+        }
+        for entity, saved in self.checkpoint.items():
+            if entity in files and saved.get("file") != self.fingerprints[entity]:
+                raise CommandError(
+                    f"--{entity} is not the file the checkpoint "
+                    f"{self.checkpoint_path} was written for; pass --restart "
+                    "to import it from the start."
+                )
+
+        self.companies = dict(Company.objects.values_list("name", "pk"))
+        self.departments = {
+            (company, name): pk
+            for company, name, pk in Department.objects.values_list(
+                "company__name", "name", "pk"
+            )
+        }
+        self.users = dict(User.objects.values_list("email", "pk"))
+        self.employees = dict.fromkeys(Employee.objects.values_list("email", flat=True))
+
+        self.workers = options["workers"]
+        self.pool = None
+        if self.workers:
+            self.pool = ProcessPoolExecutor(self.workers, initializer=setup_worker)
+        try:
+            for entity in ENTITIES:
+                if entity in files:
+                    self.load(entity, files[entity])
+        finally:
+            if self.pool is not None:
+                self.pool.shutdown()
+
+        fixed = counters.reconcile(batch_size=self.batch_size)
+        self.stdout.write(f"Counters updated: {fixed}")
+        self.checkpoint_path.unlink(missing_ok=True)
+
+    def load(self, entity, path):
+        model, keys = ENTITIES[entity], getattr(self, entity)
+        build = getattr(self, f"build_{entity}")
+        done = self.checkpoint.get(entity, {}).get("rows", 0)
+        created = skipped = 0
+        rows = islice(read_rows(path), done, None)
+        for batch in batched(rows, self.batch_size):
+            pending, errors = build(batch)
+            objs = [obj for _, obj in pending]
+            with transaction.atomic():
+                model.objects.bulk_create(objs)
+                search.index(objs)
+                response_cache.bump(model)
+            scope.invalidate_owners(map(scope.owner, objs))
+            for key, obj in pending:
+                keys[key] = obj.pk
+            done += len(batch)
+            created += len(objs)
+            skipped += len(batch) - len(objs)
+            for error in errors:
+                self.stderr.write(f"{entity}: {error}")
+            self.save_checkpoint(entity, done)
+        self.stdout.write(f"{entity}: created {created}, skipped {skipped}")
+
+    def save_checkpoint(self, entity, done):
+        self.checkpoint[entity] = {"file": self.fingerprints[entity], "rows": done}
+        self.checkpoint_path.write_text(json.dumps(self.checkpoint))
+
+    def build_companies(self, rows):
+        objs, seen = [], set()
+        for row in rows:
+            name = row["name"]
+            if name in self.companies or name in seen:
+                continue
+            seen.add(name)
+            objs.append((name, Company(name=name)))
+        return objs, []
+
+    def build_departments(self, rows):
+        objs, errors, seen = [], [], set()
+        for row in rows:
+            key = (row["company"], row["name"])
+            if key in self.departments or key in seen:
+                continue
+            if row["company"] not in self.companies:
+                errors.append(f"unknown company {row['company']!r}")
+                continue
+            seen.add(key)
+            objs.append(
+                (
+                    key,
+                    Department(
+                        company_id=self.companies[row["company"]], name=row["name"]
+                    ),
+                )
+            )
+        return objs, errors
+
+    def build_users(self, rows):
+        pending, seen = [], set()
+        for row in rows:
+            email = row["email"]
+            if email in self.users or email in seen:
+                continue
+            seen.add(email)
+            pending.append(row)
+
+        passwords = [row.get("password") or None for row in pending]
+        if self.pool is not None:
+            chunksize = max(1, len(passwords) // (self.workers * 4))
+            hashed = list(self.pool.map(make_password, passwords, chunksize=chunksize))
+        else:
+            hashed = [make_password(password) for password in passwords]
+
+        objs = [
+            (
+                row["email"],
+                User(
+                    email=row["email"],
+                    username=row.get("username") or row["email"],
+                    role=row.get("role") or UserRoles.EMPLOYEE,
+                    password=password,
+                ),
+            )
+            for row, password in zip(pending, hashed)
+        ]
+        return objs, []
+
+    def build_employees(self, rows):
+        objs, errors, seen = [], [], set()
+        for row in rows:
+            email = row["email"]
+            if email in self.employees or email in seen:
+                continue
+            company_id = self.companies.get(row["company"])
+            department_id = self.departments.get((row["company"], row["department"]))
+            user_id = self.users.get(row.get("user") or email)
+            if company_id is None or department_id is None or user_id is None:
+                errors.append(f"unresolved company/department/user for {email!r}")
+                continue
+            seen.add(email)
+            employee = Employee(
+                company_id=company_id,
+                department_id=department_id,
+                user_id=user_id,
+                email=email,
+                first_name=row.get("first_name", ""),
+                middle_name=row.get("middle_name") or "",
+                last_name=row.get("last_name", ""),
+                mobile_number=row.get("mobile_number") or "",
+                address=row.get("address") or "",
+                position=row.get("position") or "",
+                hired_on=parse_date(row["hired_on"]) if row.get("hired_on") else None,
+            )
+            objs.append((email, employee))
+        return objs, errors
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-18 07:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0004_remove_employee_days_employed_employee_hired_on"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="employee",
+            index=models.Index(fields=["position"], name="employee_position_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="employee",
+            index=models.Index(fields=["created_at", "id"], name="employee_keyset_idx"),
+        ),
+    ]
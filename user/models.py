@@ -4,7 +4,7 @@ from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, UserM
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
-from common.models import TimeStampedModel
+from common.models import CountedModel
 from user.choices import UserRoles
 
 
@@ -31,7 +31,7 @@ class User(AbstractBaseUser, PermissionsMixin):
         return self.email
 
 
-class Employee(TimeStampedModel):
+class Employee(CountedModel):
     company = models.ForeignKey(
         "company.Company", on_delete=models.CASCADE, related_name="company_employee"
     )
@@ -55,6 +55,10 @@ class Employee(TimeStampedModel):
     class Meta:
         verbose_name = _("Employee")
         verbose_name_plural = _("Employees")
+        indexes = [
+            models.Index(fields=["position"], name="employee_position_idx"),
+            models.Index(fields=["created_at", "id"], name="employee_keyset_idx"),
+        ]
 
     @property
     def days_employed(self):
@@ -0,0 +1,110 @@
+"""
+Row-level scoping of querysets by the caller's own ``Employee`` row.
+
+``get_scope(user)`` returns ``(employee_id, company_id)``, or ``(None, None)``
+for users without an employee record. The mapping is memoized on the user
+object and cached like the auth snapshots, so scoped views filter on an
+integer column in SQL instead of joining ``user_employee`` on every request.
+It is dropped whenever an ``Employee`` row is saved or deleted, including by
+the bulk write paths; a missing employee record is never cached.
+"""
+
+from common.cache import TTLCache
+from user.authentication import cache_config, shared_cache
+from user.models import Employee
+
+NO_EMPLOYEE = (None, None)
+
+employee_scopes = TTLCache(cache_config()["MAX_SIZE"], cache_config()["TTL"])
+
+
+def scope_key(user_id):
+    return f"employee-scope:{user_id}"
+
+
+def memoized(user):
+    """The scope already known in this process, or ``None``."""
+    if not hasattr(user, "_employee_scope"):
+        scope = employee_scopes.get(str(user.pk))
+        if scope is None:
+            return None
+        user._employee_scope = scope
+    return user._employee_scope
+
+
+def employee_row(user):
+    return Employee.objects.filter(user_id=user.pk).values_list("pk", "company_id")
+
+
+def remember(user, scope):
+    if scope is None:
+        # Not cached: the employee row may be created at any moment, in bulk
+        # and without signals.
+        scope = NO_EMPLOYEE
+    else:
+        scope = tuple(scope)
+        employee_scopes.set(str(user.pk), scope)
+    user._employee_scope = scope
+    return scope
+
+
+def get_scope(user):
+    scope = memoized(user)
+    if scope is not None:
+        return scope
+    shared, key = shared_cache(), scope_key(user.pk)
+    scope = shared.get(key) if shared is not None else None
+    if scope is None:
+        scope = employee_row(user).first()
+        if scope is not None and shared is not None:
+            shared.set(key, scope, cache_config()["TTL"])
+    return remember(user, scope)
+
+
+async def aget_scope(user):
+    """``get_scope`` for async views; later sync calls reuse the memo."""
+    scope = memoized(user)
+    if scope is not None:
+        return scope
+    shared, key = shared_cache(), scope_key(user.pk)
+    scope = await shared.aget(key) if shared is not None else None
+    if scope is None:
+        scope = await employee_row(user).afirst()
+        if scope is not None and shared is not None:
+            await shared.aset(key, scope, cache_config()["TTL"])
+    return remember(user, scope)
+
+
+def invalidate(user_id):
+    user_id = str(user_id)
+    employee_scopes.delete(user_id)
+    shared = shared_cache()
+    if shared is not None:
+        shared.delete(scope_key(user_id))
+
+
+def owner(obj):
+    """The user whose scope ``obj`` decides: an ``Employee``'s user, else ``None``."""
+    return obj.user_id if isinstance(obj, Employee) else None
+
+
+def invalidate_owners(user_ids):
+    """For bulk writes, which send no ``post_save``/``post_delete``."""
+    for user_id in set(user_ids) - {None}:
+        invalidate(user_id)
+
+
+def own_rows(queryset, user, field="employee_id"):
+    """Rows of ``user``'s own employee record; none without one."""
+    employee_id = get_scope(user)[0]
+    if employee_id is None:
+        return queryset.none()
+    return queryset.filter(**{field: employee_id})
+
+
+def company_rows(queryset, user, field="company_id"):
+    """Rows of ``user``'s company; none without an employee record."""
+    company_id = get_scope(user)[1]
+    if company_id is None:
+        return queryset.none()
+    return queryset.filter(**{field: company_id})
@@ -0,0 +1,20 @@
+from django.db.models.signals import post_delete, post_save
+
+from user import authentication, scope
+from user.models import Employee, User
+
+
+def invalidate_user_snapshot(sender, instance, **kwargs):
+    authentication.invalidate(instance.pk)
+    scope.invalidate(instance.pk)
+
+
+def invalidate_employee_scope(sender, instance, **kwargs):
+    scope.invalidate(instance.user_id)
+
+
+def connect():
+    post_save.connect(invalidate_user_snapshot, sender=User)
+    post_delete.connect(invalidate_user_snapshot, sender=User)
+    post_save.connect(invalidate_employee_scope, sender=Employee)
+    post_delete.connect(invalidate_employee_scope, sender=Employee)
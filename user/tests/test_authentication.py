@@ -0,0 +1,71 @@
+from django.contrib.auth.hashers import make_password
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from user.authentication import CachedJWTAuthentication, get_snapshot, user_snapshots
+from user.models import User
+
+
+class CachedJWTAuthenticationTestCase(APITestCase):
+    def setUp(self):
+        user_snapshots.clear()
+        self.user = User.objects.create(
+            email="test@admin.com",
+            username="test admin",
+            password=make_password(None),
+            role="admin",
+        )
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.url = reverse("company-list")
+
+    def user_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return [query for query in queries if '"user_user"' in query["sql"]]
+
+    def test_user_is_loaded_once(self):
+        self.assertEqual(len(self.user_queries()), 1)
+        self.assertEqual(self.user_queries(), [])
+
+    def test_save_invalidates_snapshot(self):
+        self.user_queries()
+        self.user.role = "employee"
+        self.user.save()
+        self.assertEqual(len(self.user_queries()), 1)
+
+        response = self.client.get(reverse("employee-list"))
+        self.assertEqual(response.status_code, 403)
+
+    def test_inactive_user_is_rejected(self):
+        self.user_queries()
+        self.user.is_active = False
+        self.user.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 401)
+
+    def test_deleted_user_is_rejected(self):
+        self.user_queries()
+        self.user.delete()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 401)
+
+    def test_shared_cache_backend(self):
+        with self.settings(AUTH_USER_CACHE={"BACKEND": "default"}):
+            self.assertEqual(len(self.user_queries()), 1)
+            self.assertEqual(len(user_snapshots), 0)
+            self.assertEqual(self.user_queries(), [])
+            self.user.save()
+            self.assertEqual(len(self.user_queries()), 1)
+
+    def test_other_fields_are_deferred(self):
+        user = CachedJWTAuthentication().build_user(get_snapshot(self.user.pk))
+        self.assertEqual(user.role, "admin")
+        self.assertIn("username", user.get_deferred_fields())
+        self.assertFalse(user._state.adding)
+        with self.assertNumQueries(1):
+            self.assertEqual(user.username, "test admin")
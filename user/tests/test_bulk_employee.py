@@ -0,0 +1,152 @@
+from django.contrib.auth.hashers import make_password
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from common.tests.base_test import BaseTest
+from company.models import Company, Department
+from user.models import Employee, User
+
+
+class BulkEmployeeAPITestCase(BaseTest):
+    def setUp(self):
+        super().setUp()
+        self.admin = User.objects.create(
+            email="test@admin.com",
+            username="test admin",
+            password=make_password("TestPass123"),
+            role="admin",
+        )
+        self.client.force_authenticate(user=self.admin)
+        self.bulk_url = reverse("employee-bulk")
+        self.company = Company.objects.create(name="Test Company")
+        self.department = Department.objects.create(
+            name="Test Department", company=self.company
+        )
+        self.other_department = Department.objects.create(
+            name="Other Department", company=self.company
+        )
+
+    def create_users(self, count):
+        return [
+            User.objects.create(
+                email=f"user{index}@test.com",
+                username=f"user {index}",
+                password=make_password(None),
+            )
+            for index in range(count)
+        ]
+
+    def employee_payload(self, user, index):
+        return {
+            "first_name": "test",
+            "last_name": f"employee {index}",
+            "email": f"employee{index}@test.com",
+            "company": self.company.id,
+            "department": self.department.id,
+            "user": user.id,
+        }
+
+    def test_bulk_create(self):
+        users = self.create_users(3)
+        payload = [self.employee_payload(user, i) for i, user in enumerate(users)]
+        response = self.client.post(self.bulk_url, payload, format="json")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([r["status"] for r in response.data["results"]], [201] * 3)
+        self.assertEqual(Employee.objects.count(), 3)
+
+        self.company.refresh_from_db()
+        self.department.refresh_from_db()
+        self.assertEqual(self.company.number_of_employees, 3)
+        self.assertEqual(self.department.number_of_employees, 3)
+
+    def test_bulk_create_query_count_is_constant(self):
+        users = self.create_users(20)
+        few = [self.employee_payload(user, i) for i, user in enumerate(users[:2])]
+        many = [self.employee_payload(user, i + 2) for i, user in enumerate(users[2:])]
+        with self.assertNumQueries(11):
+            self.client.post(self.bulk_url, few, format="json")
+        with self.assertNumQueries(11):
+            self.client.post(self.bulk_url, many, format="json")
+        self.assertEqual(Employee.objects.count(), 20)
+
+    def test_bulk_create_reports_item_errors(self):
+        users = self.create_users(2)
+        payload = [
+            self.employee_payload(users[0], 0),
+            {**self.employee_payload(users[1], 1), "department": 999999},
+            {**self.employee_payload(users[1], 2), "email": "employee0@test.com"},
+        ]
+        response = self.client.post(self.bulk_url, payload, format="json")
+        self.assertEqual(response.status_code, 207)
+        results = response.data["results"]
+        self.assertEqual(results[0]["status"], 201)
+        self.assertIn("department", results[1]["errors"])
+        self.assertIn("email", results[2]["errors"])
+        self.assertEqual(Employee.objects.count(), 1)
+
+    def test_bulk_update_moves_department(self):
+        users = self.create_users(2)
+        payload = [self.employee_payload(user, i) for i, user in enumerate(users)]
+        created = self.client.post(self.bulk_url, payload, format="json")
+        ids = [result["id"] for result in created.data["results"]]
+
+        response = self.client.patch(
+            self.bulk_url,
+            [
+                {"id": ids[0], "department": self.other_department.id},
+                {"id": ids[1], "position": "Lead"},
+                {"id": 999999, "position": "Ghost"},
+            ],
+            format="json",
+        )
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual(
+            [r["status"] for r in response.data["results"]], [200, 200, 404]
+        )
+        self.assertEqual(Employee.objects.get(id=ids[1]).position, "Lead")
+
+        self.department.refresh_from_db()
+        self.other_department.refresh_from_db()
+        self.assertEqual(self.department.number_of_employees, 1)
+        self.assertEqual(self.other_department.number_of_employees, 1)
+
+    def moves(self, ids):
+        return [{"id": pk, "department": self.other_department.id} for pk in ids]
+
+    def test_bulk_update_query_count_is_constant(self):
+        users = self.create_users(12)
+        payload = [self.employee_payload(user, i) for i, user in enumerate(users)]
+        created = self.client.post(self.bulk_url, payload, format="json")
+        ids = [result["id"] for result in created.data["results"]]
+
+        with CaptureQueriesContext(connection) as few:
+            self.client.patch(self.bulk_url, self.moves(ids[:2]), format="json")
+        with CaptureQueriesContext(connection) as many:
+            self.client.patch(self.bulk_url, self.moves(ids[2:]), format="json")
+        self.assertEqual(len(few.captured_queries), len(many.captured_queries))
+        self.department.refresh_from_db()
+        self.other_department.refresh_from_db()
+        self.assertEqual(self.department.number_of_employees, 0)
+        self.assertEqual(self.other_department.number_of_employees, 12)
+
+    def test_bulk_delete(self):
+        users = self.create_users(2)
+        payload = [self.employee_payload(user, i) for i, user in enumerate(users)]
+        created = self.client.post(self.bulk_url, payload, format="json")
+        ids = [result["id"] for result in created.data["results"]]
+
+        response = self.client.delete(self.bulk_url, {"ids": ids}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Employee.objects.count(), 0)
+        self.company.refresh_from_db()
+        self.assertEqual(self.company.number_of_employees, 0)
+
+    def test_bulk_rejects_too_many_items(self):
+        payload = [{}] * 1001
+        response = self.client.post(self.bulk_url, payload, format="json")
+        self.assertEqual(response.status_code, 400)
+
+    def test_bulk_wrong_role(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(self.bulk_url, [{}], format="json")
+        self.assertEqual(response.status_code, 403)
@@ -1,3 +1,5 @@
+import csv
+
 from django.contrib.auth.hashers import make_password
 from django.urls import reverse
 from common.tests.base_test import BaseTest
@@ -8,13 +10,13 @@ from user.models import User
 class EmployeeAPITestCase(BaseTest):
     def setUp(self):
         super().setUp()
-        self.manager = User.objects.create(
-            email="test@manager.com",
-            username="test manager",
+        self.admin = User.objects.create(
+            email="test@admin.com",
+            username="test admin",
             password=make_password("TestPass123"),
-            role="manager",
+            role="admin",
         )
-        self.client.force_authenticate(user=self.manager)
+        self.client.force_authenticate(user=self.admin)
         self.employee_url = reverse("employee-list")
         self.company = Company.objects.create(name="Test Company")
         self.department = Department.objects.create(
@@ -78,7 +80,7 @@ class EmployeeAPITestCase(BaseTest):
             "first_name": "updated",
             "middle_name": "B",
             "last_name": "employee",
-            "email": "test@manager.com",
+            "email": "test@admin.com",
             "address": "456 Updated St",
             "position": "Manager",
             "company": self.company.id,
@@ -135,3 +137,26 @@ class EmployeeAPITestCase(BaseTest):
             self.employee_url, self.employee_data, format="json"
         )
         self.assertEqual(response.status_code, 403)
+
+    def test_export_csv_streams_rows(self):
+        self.client.post(self.employee_url, self.employee_data, format="json")
+        response = self.client.get(reverse("employee-export"), {"format": "csv"})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        rows = list(
+            csv.reader(b"".join(response.streaming_content).decode().splitlines())
+        )
+        self.assertEqual(rows[0][:4], ["id", "first_name", "middle_name", "last_name"])
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[1][4], "Test Company")
+        self.assertEqual(rows[1][-1], "")
+
+    def test_export_wrong_role(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(reverse("employee-export"), {"format": "csv"})
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        rows = list(csv.reader(response.content.decode().splitlines()))
+        self.assertEqual(rows[0], ["detail"])
+        self.assertEqual(len(rows), 2)
@@ -0,0 +1,70 @@
+from django.contrib.auth.hashers import make_password
+from django.test import TransactionTestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from user.models import User
+
+FAST_SCRYPT = {"scrypt": {"work_factor": 2**10, "block_size": 8, "parallelism": 1}}
+
+
+@override_settings(PASSWORD_HASHER_PARAMS=FAST_SCRYPT)
+class PasswordHasherPolicyTestCase(TransactionTestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.login_data = {"email": "test@user.com", "password": "TestPass123"}
+
+    def create_user(self, hasher):
+        return User.objects.create(
+            email=self.login_data["email"],
+            username="test user",
+            password=make_password(self.login_data["password"], hasher=hasher),
+        )
+
+    @override_settings(
+        PASSWORD_HASHERS=[
+            "user.hashers.TunedScryptPasswordHasher",
+            "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+        ]
+    )
+    def test_login_rehashes_to_preferred_hasher(self):
+        user = self.create_user("pbkdf2_sha256")
+        response = self.client.post(reverse("login"), self.login_data, format="json")
+        self.assertEqual(response.status_code, 200)
+        user.refresh_from_db()
+        self.assertTrue(user.password.startswith("scrypt$1024$"))
+
+    @override_settings(PASSWORD_HASHERS=["user.hashers.TunedScryptPasswordHasher"])
+    def test_changed_parameters_are_upgraded(self):
+        user = self.create_user("scrypt")
+        with self.settings(
+            PASSWORD_HASHER_PARAMS={
+                "scrypt": {**FAST_SCRYPT["scrypt"], "block_size": 4}
+            }
+        ):
+            response = self.client.post(
+                reverse("login-async"), self.login_data, format="json"
+            )
+        self.assertEqual(response.status_code, 200)
+        user.refresh_from_db()
+        self.assertEqual(user.password.split("$")[3], "4")
+
+    @override_settings(PASSWORD_HASHERS=["user.hashers.TunedScryptPasswordHasher"])
+    def test_async_login(self):
+        self.create_user("scrypt")
+        response = self.client.post(
+            reverse("login-async"), self.login_data, format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("access", response.json())
+        self.assertIn("refresh", response.json())
+
+    def test_async_login_invalid_credentials(self):
+        self.create_user("pbkdf2_sha256")
+        response = self.client.post(
+            reverse("login-async"),
+            {"email": self.login_data["email"], "password": "WrongPass123"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("non_field_errors", response.json())
@@ -0,0 +1,118 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from company.models import Company, Department
+from user.management.commands.import_org import fingerprint
+from user.models import Employee, User
+
+
+class ImportOrgCommandTestCase(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.dir = Path(self.tmp.name)
+        self.checkpoint = self.dir / "checkpoint.json"
+        (self.dir / "companies.csv").write_text("name\nAcme\nGlobex\n")
+        (self.dir / "departments.csv").write_text(
+            "company,name\nAcme,Engineering\nAcme,Sales\nGlobex,Engineering\n"
+        )
+        users = [
+            {"email": f"user{i}@test.com", "username": f"user {i}", "password": "pw"}
+            for i in range(3)
+        ]
+        (self.dir / "users.ndjson").write_text(
+            "".join(json.dumps(user) + "\n" for user in users)
+        )
+        (self.dir / "employees.csv").write_text(
+            "email,user,company,department,first_name,last_name,hired_on\n"
+            "e0@test.com,user0@test.com,Acme,Engineering,Ann,One,2024-01-02\n"
+            "e1@test.com,user1@test.com,Acme,Sales,Bob,Two,\n"
+            "e2@test.com,user2@test.com,Globex,Engineering,Cid,Three,\n"
+            "e3@test.com,missing@test.com,Acme,Sales,Dan,Four,\n"
+        )
+
+    def write_checkpoint(self, **rows):
+        self.checkpoint.write_text(
+            json.dumps(
+                {
+                    entity: {
+                        "file": fingerprint(self.dir / f"{entity}.csv"),
+                        "rows": done,
+                    }
+                    for entity, done in rows.items()
+                }
+            )
+        )
+
+    def run_import(self, workers=0):
+        out, err = StringIO(), StringIO()
+        call_command(
+            "import_org",
+            companies=str(self.dir / "companies.csv"),
+            departments=str(self.dir / "departments.csv"),
+            users=str(self.dir / "users.ndjson"),
+            employees=str(self.dir / "employees.csv"),
+            checkpoint=str(self.checkpoint),
+            workers=workers,
+            batch_size=2,
+            stdout=out,
+            stderr=err,
+        )
+        return out.getvalue(), err.getvalue()
+
+    def test_import_creates_rows_and_counters(self):
+        out, err = self.run_import()
+        self.assertEqual(Company.objects.count(), 2)
+        self.assertEqual(Department.objects.count(), 3)
+        self.assertEqual(User.objects.count(), 3)
+        self.assertEqual(Employee.objects.count(), 3)
+        self.assertIn("e3@test.com", err)
+
+        acme = Company.objects.get(name="Acme")
+        self.assertEqual(acme.number_of_departments, 2)
+        self.assertEqual(acme.number_of_employees, 2)
+        sales = Department.objects.get(company=acme, name="Sales")
+        self.assertEqual(sales.number_of_employees, 1)
+
+        user = User.objects.get(email="user0@test.com")
+        self.assertTrue(user.check_password("pw"))
+        self.assertEqual(
+            str(Employee.objects.get(email="e0@test.com").hired_on), "2024-01-02"
+        )
+        self.assertFalse(self.checkpoint.exists())
+
+    def test_import_resumes_from_checkpoint(self):
+        self.write_checkpoint(companies=2, departments=1)
+        Company.objects.create(name="Acme")
+        Company.objects.create(name="Globex")
+        out, _ = self.run_import()
+        self.assertIn("companies: created 0, skipped 0", out)
+        self.assertIn("departments: created 2, skipped 0", out)
+        self.assertFalse(
+            Department.objects.filter(company__name="Acme", name="Engineering").exists()
+        )
+
+    def test_changed_input_refuses_to_resume(self):
+        self.write_checkpoint(companies=2, departments=1)
+        with open(self.dir / "departments.csv", "a") as handle:
+            handle.write("Globex,Sales\n")
+        with self.assertRaisesMessage(CommandError, "--departments"):
+            self.run_import()
+        self.assertFalse(Department.objects.exists())
+
+    def test_rerun_skips_existing_natural_keys(self):
+        self.run_import()
+        out, _ = self.run_import()
+        self.assertIn("employees: created 0, skipped 4", out)
+        self.assertEqual(Employee.objects.count(), 3)
+        self.assertEqual(Company.objects.count(), 2)
+
+    def test_import_hashes_passwords_in_process_pool(self):
+        self.run_import(workers=2)
+        user = User.objects.get(email="user2@test.com")
+        self.assertTrue(user.check_password("pw"))
@@ -0,0 +1,164 @@
+from django.contrib.auth.hashers import make_password
+from django.core.cache import caches
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from common.tests.base_test import BaseTest
+from company.models import Company, Department, PerformanceReview, Project
+from user import scope
+from user.authentication import user_snapshots
+from user.models import Employee, User
+
+
+class EmployeeScopeTestCase(BaseTest):
+    def setUp(self):
+        super().setUp()
+        caches["default"].clear()
+        scope.employee_scopes.clear()
+        user_snapshots.clear()
+        self.companies = []
+        self.managers = []
+        for index in range(2):
+            company = Company.objects.create(name=f"Company {index}")
+            department = Department.objects.create(name="D", company=company)
+            Project.objects.create(
+                name=f"Project {index}", company=company, department=department
+            )
+            manager = User.objects.create(
+                email=f"manager{index}@test.com",
+                username=f"manager {index}",
+                password=make_password(None),
+                role="manager",
+            )
+            Employee.objects.create(
+                company=company,
+                department=department,
+                user=manager,
+                first_name=f"manager {index}",
+                last_name="test",
+                email=manager.email,
+            )
+            self.companies.append(company)
+            self.managers.append(manager)
+        self.employee = Employee.objects.create(
+            company=self.companies[0],
+            department=Department.objects.get(company=self.companies[0]),
+            user=self.user,
+            first_name="test",
+            last_name="employee",
+            email="test@employee.com",
+        )
+
+    def names(self, url, user):
+        self.client.force_authenticate(user=user)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return sorted(row.get("first_name") or row["name"] for row in response.data)
+
+    def test_managers_only_see_their_company(self):
+        employees, projects = reverse("employee-list"), reverse("project-list")
+        self.assertEqual(self.names(employees, self.managers[0]), ["manager 0", "test"])
+        self.assertEqual(self.names(employees, self.managers[1]), ["manager 1"])
+        self.assertEqual(self.names(projects, self.managers[0]), ["Project 0"])
+        self.assertEqual(self.names(projects, self.managers[1]), ["Project 1"])
+        self.assertEqual(self.names(projects, self.user), ["Project 0"])
+
+        detail = reverse("employee-detail", args=[self.employee.id])
+        self.client.force_authenticate(user=self.managers[1])
+        self.assertEqual(self.client.get(detail).status_code, 404)
+
+    def test_user_without_employee_record_sees_nothing(self):
+        manager = User.objects.create(
+            email="test@manager.com",
+            username="test manager",
+            password=make_password(None),
+            role="manager",
+        )
+        self.assertEqual(self.names(reverse("employee-list"), manager), [])
+
+    def test_own_reviews_filter_by_employee_id(self):
+        PerformanceReview.objects.create(employee=self.employee)
+        PerformanceReview.objects.create(
+            employee=Employee.objects.get(user=self.managers[0])
+        )
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("performance-review-list"))
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]["employee"], "test")
+        select = queries.captured_queries[-1]["sql"]
+        self.assertIn(
+            f'WHERE "company_performancereview"."employee_id" = {self.employee.id}',
+            select,
+        )
+        self.assertNotIn('"email" =', select)
+
+    def test_scope_is_cached_and_dropped_on_employee_write(self):
+        user = User.objects.get(pk=self.managers[0].pk)
+        # A fresh user object per request, as CachedJWTAuthentication builds.
+        with self.assertNumQueries(1):
+            scope.get_scope(user)
+            scope.get_scope(User(pk=user.pk))
+        employee = Employee.objects.get(user=user)
+        employee.company = self.companies[1]
+        employee.save()
+        self.assertEqual(
+            scope.get_scope(User(pk=user.pk)), (employee.pk, self.companies[1].pk)
+        )
+
+    def test_missing_employee_is_not_cached(self):
+        user = User.objects.create(
+            email="new@test.com", username="new", password=make_password(None)
+        )
+        self.assertEqual(scope.get_scope(User(pk=user.pk)), scope.NO_EMPLOYEE)
+        # bulk_create sends no post_save.
+        (employee,) = Employee.objects.bulk_create(
+            [
+                Employee(
+                    company=self.companies[1],
+                    department=Department.objects.get(company=self.companies[1]),
+                    user=user,
+                    first_name="new",
+                    last_name="employee",
+                    email=user.email,
+                )
+            ]
+        )
+        self.assertEqual(
+            scope.get_scope(User(pk=user.pk)), (employee.pk, self.companies[1].pk)
+        )
+
+    def test_bulk_update_drops_the_scope(self):
+        scope.get_scope(User(pk=self.user.pk))
+        admin = User.objects.create(
+            email="admin@test.com",
+            username="admin",
+            password=make_password(None),
+            role="admin",
+        )
+        self.client.force_authenticate(user=admin)
+        response = self.client.patch(
+            reverse("employee-bulk"),
+            [
+                {
+                    "id": self.employee.id,
+                    "company": self.companies[1].id,
+                    "department": Department.objects.get(company=self.companies[1]).id,
+                }
+            ],
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            scope.get_scope(User(pk=self.user.pk)),
+            (self.employee.pk, self.companies[1].pk),
+        )
+
+    def test_async_list_is_scoped(self):
+        token = RefreshToken.for_user(self.managers[1]).access_token
+        response = self.client.get(
+            reverse("async-employee-list"), HTTP_AUTHORIZATION=f"Bearer {token}"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row["first_name"] for row in response.json()], ["manager 1"])
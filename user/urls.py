@@ -1,12 +1,16 @@
 from django.urls import path
 from rest_framework.routers import DefaultRouter
 
-from user.apis import LoginAPIView, RegisterAPI, EmployeeAPIView
+from common.async_views import async_read_urls
+
+from user.apis import LoginAPIView, AsyncLoginView, RegisterAPI, EmployeeAPIView
 
 router = DefaultRouter()
 router.register("employee", EmployeeAPIView, basename="employee")
 urlpatterns = [
     path("login/", LoginAPIView.as_view(), name="login"),
+    path("login/async/", AsyncLoginView.as_view(), name="login-async"),
     path("register/", RegisterAPI.as_view(), name="register"),
 ]
+urlpatterns += async_read_urls("employee", EmployeeAPIView, "employee")
 urlpatterns += router.urls